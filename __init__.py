@@ -1,2 +1,43 @@
-from .src.liquid_crystal import LiquidCrystal
-from .src.liquid_crystal_i2c import LiquidCrystal_I2C
+# Classes are imported on first use, so that an application only loads the modules of the backend and helpers it
+# uses: 'from LiquidCrystal import LiquidCrystal_I2C' does not load the GPIO backend, nor the reverse.
+_MODULES: dict = {
+    "LiquidCrystal": "liquid_crystal",
+    "LiquidCrystal_I2C": "liquid_crystal_i2c",
+    "LiquidCrystal_PIO": "liquid_crystal_pio",  # RP2040 only, needs the 'rp2' module.
+    "LiquidCrystal_Bus": "liquid_crystal_bus",
+    "PCF8574Transport": "transport_pcf8574",
+    "MCP23017Transport": "transport_mcp23017",
+    "SPI595Transport": "transport_spi595",
+    "DisplayBuffer": "display_buffer",
+    "AsyncLiquidCrystal": "liquid_crystal_async",
+    "ThreadedLiquidCrystal": "liquid_crystal_thread",  # Needs the '_thread' module.
+    "DisplayGroup": "display_group",
+    "GlyphCache": "glyph_cache",
+    "Ticker": "ticker",
+    "Layout": "layout",
+    "RefreshScheduler": "refresh_scheduler",
+    "BitmapRenderer": "bitmap_renderer",
+    "Charset": "charset",
+    "TraceRecorder": "trace_recorder",
+    "Instruction": "instructions",
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports the module defining a class of the package on first access.
+
+    :param name: The class name.
+    :raises AttributeError: If the package has no such class.
+    :return: The class.
+    """
+    module: str = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(name)
+
+    value = getattr(__import__(f"{__name__}.src.{module}", None, None, (name,)), name)
+    globals()[name] = value  # Later accesses no longer go through __getattr__.
+    return value
+
+
+# THE END
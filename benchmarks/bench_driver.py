@@ -0,0 +1,221 @@
+"""
+Benchmarks of the LiquidCrystal backends against the simulated hardware.
+
+Reports, for each backend and geometry, the bus operations (I2C transactions or GPIO writes), the bytes
+transferred, the modeled time and the writes received while the controller was busy, for initialization,
+a full-screen print, 8 custom character uploads and 100 cursor moves. I2C runs at 100 kHz; GPIO writes are
+modeled as instantaneous, so the GPIO time is the time spent sleeping. For the PIO backend, the operations are
+the CPU pin writes and the words written to the state machine FIFO, and the time runs until the state machine
+has executed everything. The bus-* backends drive LiquidCrystal_Bus through each transport, the 74HC595 on a
+4 MHz SPI bus, its operations being the SPI writes and the latch pin writes.
+
+    python benchmarks/bench_driver.py
+    python benchmarks/bench_driver.py --save baseline.json
+    python benchmarks/bench_driver.py --baseline baseline.json --tolerance 0.05
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+GEOMETRIES: tuple = ((2, 16), (4, 20))
+BACKENDS: tuple = (
+    "i2c",
+    "i2c-legacy",
+    "gpio4",
+    "gpio8",
+    "pio",
+    "bus-pcf8574",
+    "bus-mcp23017",
+    "bus-spi595",
+)
+METRICS: tuple = ("ops", "bytes", "time_us", "violations")
+
+GLYPHS: tuple = tuple(tuple((0x1F >> (row + slot) % 5) for row in range(8)) for slot in range(8))
+
+
+class Probe:
+    def __init__(self, backend: str, row: int, col: int) -> None:
+        """
+        Wire a simulated LCD for the given backend and geometry.
+
+        :param backend: One of BACKENDS.
+        :param row: Number of rows.
+        :param col: Number of columns.
+        """
+        sim.reset()
+        self.backend: str = backend
+        self.i2c = None
+        self.spi = None
+
+        if backend.startswith("i2c") or backend == "bus-pcf8574":
+            self.model, _ = sim.attach_i2c(0x27, row, col)
+            self.i2c = sim.machine.I2C(0, freq=100_000)
+        elif backend == "bus-mcp23017":
+            self.model, _ = sim.attach_mcp23017(0x20, 0, row, col)
+            self.i2c = sim.machine.I2C(0, freq=100_000)
+        elif backend == "bus-spi595":
+            self.model, _ = sim.attach_spi595(0, 17, row, col)
+            self.spi = sim.machine.SPI(0, baudrate=4_000_000)
+        else:
+            self.gpio_list: tuple = tuple(range(3 + (8 if backend == "gpio8" else 4)))
+            self.model = sim.attach_parallel(self.gpio_list, row, col)
+
+        self.__start: tuple = self.__counters()
+
+    def __counters(self) -> tuple:
+        violations: int = self.model.violations
+        if self.i2c is not None:
+            return self.i2c.transactions, self.i2c.bytes_written + self.i2c.bytes_read, sim.clock.now(), violations
+
+        if self.spi is not None:
+            ops: int = self.spi.transactions + sim.machine.Pin.writes
+            return ops, self.spi.bytes_written, sim.clock.now(), violations
+
+        state_machine = sim.rp2.StateMachine._machines.get(0)
+        if self.backend == "pio" and state_machine is not None:
+            words: int = state_machine.words
+            return sim.machine.Pin.writes + words, 2 * words, sim.clock.now(), violations
+
+        return sim.machine.Pin.writes, 0, sim.clock.now(), violations
+
+    def lap(self) -> dict:
+        """
+        Returns the figures since the previous lap, or since wiring.
+
+        :return: A dict of METRICS.
+        """
+        if self.backend == "pio":
+            sim.settle()
+
+        now: tuple = self.__counters()
+        figures: dict = {name: round(now[index] - self.__start[index]) for index, name in enumerate(METRICS)}
+        self.__start = now
+        return figures
+
+
+def transport(package, probe: Probe, backend: str):
+    """
+    Creates the transport of a bus-* backend.
+
+    :param package: The LiquidCrystal package.
+    :param probe: The probe wired for the backend.
+    :param backend: One of the bus-* BACKENDS.
+    :return: The transport.
+    """
+    if backend == "bus-pcf8574":
+        return package.PCF8574Transport(probe.i2c, 0x27)
+    if backend == "bus-mcp23017":
+        return package.MCP23017Transport(probe.i2c, 0x20)
+    return package.SPI595Transport(probe.spi, 17)
+
+
+def run(package, backend: str, row: int, col: int) -> dict:
+    """
+    Runs every scenario on one backend and geometry.
+
+    :param package: The LiquidCrystal package.
+    :param backend: One of BACKENDS.
+    :param row: Number of rows.
+    :param col: Number of columns.
+    :raises AssertionError: If the simulated glass does not show what was printed.
+    :return: Figures by scenario.
+    """
+    probe = Probe(backend, row, col)
+    results: dict = {}
+
+    if backend.startswith("bus-"):
+        lcd = package.LiquidCrystal_Bus(transport(package, probe, backend), row=row, col=col)
+    elif probe.i2c is not None:
+        lcd = package.LiquidCrystal_I2C(probe.i2c, row=row, col=col, packed=backend == "i2c")
+    elif backend == "pio":
+        lcd = package.LiquidCrystal_PIO(probe.gpio_list, row=row, col=col)
+    else:
+        lcd = package.LiquidCrystal(probe.gpio_list, row=row, col=col)
+    results["init"] = probe.lap()
+
+    rows: list = ["".join(chr(0x41 + (line * 7 + index) % 26) for index in range(col)) for line in range(row)]
+    for line, text in enumerate(rows):
+        lcd.set_cursor(line, 0)
+        lcd.print(text)
+    results["full_screen"] = probe.lap()
+    assert probe.model.lines() == rows, f"{backend} {row}x{col}: {probe.model.lines()} != {rows}"
+
+    for slot, glyph in enumerate(GLYPHS):
+        lcd.custom_character(slot, glyph)
+    results["custom_character"] = probe.lap()
+    assert bytes(probe.model.cgram) == b"".join(bytes(glyph) for glyph in GLYPHS), f"{backend}: CGRAM mismatch"
+
+    for move in range(100):
+        lcd.set_cursor(move % row, (move * 7) % col)
+    results["cursor_moves"] = probe.lap()
+
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Lists the figures that grew by more than the tolerance over the baseline.
+
+    :param results: Current figures.
+    :param baseline: Reference figures.
+    :param tolerance: Allowed relative growth.
+    :return: Descriptions of the regressions.
+    """
+    regressions: list = []
+    for case, scenarios in results.items():
+        for scenario, figures in scenarios.items():
+            reference: dict = baseline.get(case, {}).get(scenario)
+            if reference is None:
+                continue
+
+            for name in METRICS:
+                if figures[name] > reference[name] * (1 + tolerance):
+                    regressions.append(f"{case} {scenario} {name}: {reference[name]} -> {figures[name]}")
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", help="write the figures to this JSON file")
+    parser.add_argument("--baseline", help="compare the figures with this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="allowed relative growth (default 0.05)")
+    args = parser.parse_args()
+
+    package = sim.load_package()
+    results: dict = {}
+
+    print(f"{'case':<18}{'scenario':<18}" + "".join(f"{name:>12}" for name in METRICS))
+    for row, col in GEOMETRIES:
+        for backend in BACKENDS:
+            case: str = f"{backend} {col}x{row}"
+            results[case] = run(package, backend, row, col)
+            for scenario, figures in results[case].items():
+                print(f"{case:<18}{scenario:<18}" + "".join(f"{figures[name]:>12}" for name in METRICS))
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions: list = compare(results, json.load(file), args.tolerance)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# THE END
@@ -0,0 +1,156 @@
+"""
+Import-time and heap benchmark of the LiquidCrystal package.
+
+For the bare package, for each class and for all the classes together, the package is imported from scratch and
+the classes accessed; the time taken and the heap retained by the loaded modules are reported.
+
+On MicroPython, with the package in /lib, every case runs in turn after unloading the package, and the heap is
+measured with gc.mem_alloc: the figures are the RAM the driver takes from the application. On CPython, against the
+simulated hardware, every case runs in a fresh interpreter, with the modules the package depends on imported
+beforehand, and the heap is measured with tracemalloc.
+
+    python benchmarks/bench_import.py
+    mpremote run benchmarks/bench_import.py
+"""
+import gc
+import sys
+
+CLASSES: tuple = (
+    "LiquidCrystal",
+    "LiquidCrystal_I2C",
+    "LiquidCrystal_PIO",
+    "LiquidCrystal_Bus",
+    "PCF8574Transport",
+    "MCP23017Transport",
+    "SPI595Transport",
+    "DisplayBuffer",
+    "AsyncLiquidCrystal",
+    "ThreadedLiquidCrystal",
+    "DisplayGroup",
+    "GlyphCache",
+    "Ticker",
+    "Layout",
+    "RefreshScheduler",
+    "BitmapRenderer",
+    "Charset",
+    "TraceRecorder",
+    "Instruction",
+)
+
+if sys.implementation.name == "micropython":
+    import utime
+
+    def load_package():
+        return __import__("LiquidCrystal")
+
+    def heap() -> int:
+        gc.collect()
+        return gc.mem_alloc()
+
+    def ticks() -> int:
+        return utime.ticks_us()
+
+    def elapsed(start: int) -> int:
+        return utime.ticks_diff(utime.ticks_us(), start)
+
+else:
+    import os
+    import subprocess
+    import time
+    import tracemalloc
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    import array  # noqa: E402, F401  Dependencies of the package, not measured.
+    import asyncio  # noqa: E402, F401
+
+    import sim  # noqa: E402
+
+    load_package = sim.load_package
+    tracemalloc.start()
+
+    def heap() -> int:
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    def ticks() -> int:
+        return time.perf_counter_ns() // 1000
+
+    def elapsed(start: int) -> int:
+        return ticks() - start
+
+
+def unload() -> None:
+    """
+    Removes the package and its modules from sys.modules, so the next import starts from scratch.
+
+    :return: None
+    """
+    for name in [name for name in sys.modules if name == "LiquidCrystal" or name.startswith("LiquidCrystal.")]:
+        del sys.modules[name]
+
+    gc.collect()
+
+
+def measure(names: tuple) -> tuple:
+    """
+    Imports the package from scratch and accesses the given classes.
+
+    :param names: The class names.
+    :return: The elapsed time in microseconds and the heap retained in bytes, or None if a class is unavailable.
+    """
+    unload()
+    before: int = heap()
+    start: int = ticks()
+
+    try:
+        package = load_package()
+        for name in names:
+            getattr(package, name)
+    except (AttributeError, ImportError):
+        return None
+
+    us: int = elapsed(start)
+    return us, heap() - before
+
+
+def run(case: str, names: tuple):
+    """
+    Measures one case, in a fresh interpreter on CPython.
+
+    :param case: The case name.
+    :param names: The class names.
+    :return: The elapsed time in microseconds and the heap retained in bytes, or None if a class is unavailable.
+    """
+    if sys.implementation.name == "micropython":
+        return measure(names)
+
+    output: str = subprocess.run(
+        (sys.executable, os.path.abspath(__file__), case), capture_output=True, text=True, check=True
+    ).stdout
+    return None if output.strip() == "n/a" else tuple(int(figure) for figure in output.split())
+
+
+def main() -> None:
+    cases: list = [("package", ())] + [(name, (name,)) for name in CLASSES] + [("all", CLASSES)]
+
+    if len(getattr(sys, "argv", ())) > 1:
+        figures = measure(dict(cases)[sys.argv[1]])
+        print("n/a" if figures is None else f"{figures[0]} {figures[1]}")
+        return
+
+    print(f"{'case':<22}{'time_us':>12}{'heap_bytes':>12}")
+    for case, names in cases:
+        figures = run(case, names)
+        if figures is None:
+            print(f"{case:<22}{'n/a':>12}{'n/a':>12}")
+        else:
+            print(f"{case:<22}{figures[0]:>12}{figures[1]:>12}")
+
+    unload()
+
+
+main()
+
+
+# THE END
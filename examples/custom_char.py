@@ -1,7 +1,7 @@
 import utime
 from machine import I2C, Pin
 
-from LiquidCrystal import LiquidCrystal_I2C
+from LiquidCrystal import GlyphCache, LiquidCrystal_I2C
 
 
 def main() -> None:
@@ -13,20 +13,20 @@ def main() -> None:
     lcd.set_cursor(0, 0)
     lcd.print("Hello, World!")
 
-    lcd.custom_character(0, (0x0E, 0x1B, 0x11, 0x11, 0x11, 0x11, 0x11, 0x1F))  # 0% Empty
-    lcd.custom_character(1, (0x0E, 0x1B, 0x11, 0x11, 0x11, 0x11, 0x1F, 0x1F))  # 16%
-    lcd.custom_character(2, (0x0E, 0x1B, 0x11, 0x11, 0x11, 0x1F, 0x1F, 0x1F))  # 33%
-    lcd.custom_character(3, (0x0E, 0x1B, 0x11, 0x11, 0x1F, 0x1F, 0x1F, 0x1F))  # 50%
-    lcd.custom_character(4, (0x0E, 0x1B, 0x11, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F))  # 66%
-    lcd.custom_character(5, (0x0E, 0x1B, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F))  # 83%
-    lcd.custom_character(6, (0x0E, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F))  # # 100% Full
-    lcd.custom_character(7, (0x0E, 0x1F, 0x1B, 0x1B, 0x1B, 0x1F, 0x1B, 0x1F))  # ! Error
+    # Glyphs are uploaded to CGRAM on first use, and stay resident until a slot is needed.
+    glyphs = GlyphCache(lcd)
+    glyphs.register("0%", (0x0E, 0x1B, 0x11, 0x11, 0x11, 0x11, 0x11, 0x1F))  # 0% Empty
+    glyphs.register("16%", (0x0E, 0x1B, 0x11, 0x11, 0x11, 0x11, 0x1F, 0x1F))  # 16%
+    glyphs.register("33%", (0x0E, 0x1B, 0x11, 0x11, 0x11, 0x1F, 0x1F, 0x1F))  # 33%
+    glyphs.register("50%", (0x0E, 0x1B, 0x11, 0x11, 0x1F, 0x1F, 0x1F, 0x1F))  # 50%
+    glyphs.register("66%", (0x0E, 0x1B, 0x11, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F))  # 66%
+    glyphs.register("83%", (0x0E, 0x1B, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F))  # 83%
+    glyphs.register("100%", (0x0E, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F))  # 100% Full
+    glyphs.register("error", (0x0E, 0x1F, 0x1B, 0x1B, 0x1B, 0x1F, 0x1B, 0x1F))  # ! Error
 
     while True:
-        lcd.clear_display()
-        for i in range(8):
-            lcd.set_cursor(0, 0)
-            lcd.print(chr(i))
+        for name in ("0%", "16%", "33%", "50%", "66%", "83%", "100%", "error"):
+            glyphs.print_at(1, 0, name)
             utime.sleep_ms(150)
 
 
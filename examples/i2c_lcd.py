@@ -1,7 +1,7 @@
 import utime
 from machine import I2C, Pin
 
-from LiquidCrystal import LiquidCrystal_I2C
+from LiquidCrystal import DisplayBuffer, LiquidCrystal_I2C
 
 
 def main() -> None:
@@ -12,15 +12,15 @@ def main() -> None:
 
     lcd.backlight(True)  # Backlight on.
     lcd.clear_display()
-    lcd.set_cursor(0, 0)  # Set the cursor to print.
-    lcd.print("Hello, World!")
+
+    screen = DisplayBuffer(lcd)  # Only changed characters are sent to the LCD.
+    screen.write_at(0, 0, "Hello, World!")
+    screen.flush()
 
     while True:
         for i in range(100):
-            lcd.set_cursor(1, 0)  # allocate space for print variable.
-            lcd.print("       ")
-            lcd.set_cursor(1, 0)
-            lcd.print(i)  # Print the variable.
+            screen.write_at(1, 0, f"{i:<7}")  # Fixed width, overwrites the previous value.
+            screen.flush()
             utime.sleep_ms(500)
 
 
@@ -1,7 +1,7 @@
 import utime
 from machine import ADC, I2C, Pin
 
-from LiquidCrystal import LiquidCrystal_I2C
+from LiquidCrystal import Charset, Layout, LiquidCrystal_I2C
 
 
 def main() -> None:
@@ -12,16 +12,20 @@ def main() -> None:
     conversion_factor: float = 3.3 / 65535
 
     lcd.backlight(True)
-    lcd.set_cursor(0, 0)
+    lcd.set_charset(Charset(Charset.A00))  # Text is translated to the glyphs of the character ROM.
     lcd.print("Temperature")
+    lcd.set_cursor(1, 0)
+    lcd.print("temp:")
+    lcd.set_cursor(1, 13)
+    lcd.print("°C")
+
+    layout = Layout(lcd)  # Only the fields that changed are sent, in one I2C transaction.
+    layout.field("temperature", 1, 6, 7, align=">", fmt=".2f")
 
     while True:
         reading = sensor_temp.read_u16() * conversion_factor
         temperature = 27 - (reading - 0.706) / 0.001721
-        lcd.set_cursor(1, 0)
-        lcd.print("       ")  # For avoid. clearing entire display.
-        lcd.set_cursor(1, 0)
-        lcd.print(f"temp: {temperature:.2f}°C")
+        layout.update(temperature=temperature)
         utime.sleep_ms(60)  # Update the new readings.
 
 
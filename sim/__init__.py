@@ -0,0 +1,188 @@
+"""
+Host-side simulation of the hardware driven by the LiquidCrystal package.
+
+install() registers stand-ins for the MicroPython 'machine', 'rp2', 'utime' and 'micropython' modules, backed
+by a modeled clock; load_package() then imports the driver from this repository. Simulated HD44780 controllers are
+wired to the simulated I2C bus through a PCF8574 with attach_i2c() or an MCP23017 with attach_mcp23017(), to a
+simulated SPI bus through a 74HC595 with attach_spi595(), or to GPIOs with attach_parallel(), driven by the CPU or
+by emulated PIO state machines.
+
+    import sim
+
+    LiquidCrystal = sim.load_package()
+    lcd_model, expander = sim.attach_i2c(0x27)
+    lcd = LiquidCrystal.LiquidCrystal_I2C(sim.machine.I2C(0))
+    lcd.print("Hello")
+    print(lcd_model.lines())
+"""
+import importlib.util
+import os
+import sys
+import types
+
+from . import clock, machine, micropython, rp2, utime
+from .hc595 import HC595
+from .hd44780 import HD44780, HD44780Pair
+from .mcp23017 import MCP23017
+from .pcf8574 import PCF8574, PCF8574T
+
+__all__ = (
+    "HC595",
+    "HD44780",
+    "HD44780Pair",
+    "MCP23017",
+    "PCF8574",
+    "attach_i2c",
+    "attach_mcp23017",
+    "attach_parallel",
+    "attach_spi595",
+    "clock",
+    "install",
+    "load_package",
+    "reset",
+    "settle",
+)
+
+_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def install() -> None:
+    """
+    Registers the simulated 'machine', 'rp2', 'utime' and 'micropython' modules, unless they already exist.
+
+    :return: None
+    """
+    for name, module in (("machine", machine), ("rp2", rp2), ("utime", utime), ("micropython", micropython)):
+        sys.modules.setdefault(name, module)
+
+
+def load_package(name: str = "LiquidCrystal") -> types.ModuleType:
+    """
+    Imports the driver package from this repository under the given name, whatever the checkout is called.
+
+    If the lib/PCF8574T submodule is not checked out, the stand-in PCF8574T driver is used.
+
+    :param name: Package name to import the driver as (default is 'LiquidCrystal').
+    :return: The package.
+    """
+    install()
+    if name in sys.modules:
+        return sys.modules[name]
+
+    submodule: str = os.path.join(_ROOT, "lib", "PCF8574T", "__init__.py")
+    if not os.path.exists(submodule):
+        stand_in = types.ModuleType(f"{name}.lib.PCF8574T")
+        stand_in.PCF8574T = PCF8574T
+        sys.modules[stand_in.__name__] = stand_in
+
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(_ROOT, "__init__.py"), submodule_search_locations=[_ROOT]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[name] = package
+    spec.loader.exec_module(package)
+    return package
+
+
+def attach_i2c(addr: int = 0x27, row: int = 2, col: int = 16, en2: int = PCF8574.BL) -> tuple:
+    """
+    Connects a simulated HD44780 behind a PCF8574 to the simulated I2C bus.
+
+    A 40x4 glass has two controllers, the second one enabled by the RW or BL pin of the expander.
+
+    :param addr: I2C address of the expander (default is 0x27).
+    :param row: Number of rows of the glass (default is 2).
+    :param col: Number of columns of the glass (default is 16).
+    :param en2: Port bit mask of the enable line of the second controller of a 40x4 glass (default is BL).
+    :return: The controller, or the HD44780Pair of a 40x4 glass, and the expander.
+    """
+    if row == 4 and col == 40:
+        lcd = HD44780Pair(col)
+        expander = PCF8574(*lcd.controllers, en2)
+    else:
+        lcd = HD44780(row, col)
+        expander = PCF8574(lcd)
+    machine.I2C._devices[addr] = expander
+    return lcd, expander
+
+
+def attach_mcp23017(addr: int = 0x20, bank: int = 0, row: int = 2, col: int = 16) -> tuple:
+    """
+    Connects a simulated HD44780 behind one port of an MCP23017 to the simulated I2C bus.
+
+    :param addr: I2C address of the expander (default is 0x20).
+    :param bank: Port wired to the LCD, 0 for port A or 1 for port B (default is 0).
+    :param row: Number of rows of the glass (default is 2).
+    :param col: Number of columns of the glass (default is 16).
+    :return: The controller and the expander.
+    """
+    lcd = HD44780(row, col)
+    expander = MCP23017(lcd, bank)
+    machine.I2C._devices[addr] = expander
+    return lcd, expander
+
+
+def attach_spi595(spi_id: int = 0, latch: int = 17, row: int = 2, col: int = 16) -> tuple:
+    """
+    Connects a simulated HD44780 behind a 74HC595 to a simulated SPI bus and a latch GPIO.
+
+    :param spi_id: Id of the SPI bus (default is 0).
+    :param latch: GPIO wired to RCLK (default is 17).
+    :param row: Number of rows of the glass (default is 2).
+    :param col: Number of columns of the glass (default is 16).
+    :return: The controller and the shift register.
+    """
+    lcd = HD44780(row, col)
+    shift_register = HC595(lcd, latch)
+    machine.SPI._devices[spi_id] = shift_register
+    machine.Pin._buses[latch] = shift_register
+    return lcd, shift_register
+
+
+def attach_parallel(gpio_list: tuple, row: int = 2, col: int = 16, en2: int = -1) -> HD44780:
+    """
+    Connects a simulated HD44780 to GPIOs, in the order used by LiquidCrystal.
+
+    :param gpio_list: GPIOs for RS, RW, EN, and (D4 to D7) or (D0 to D7).
+    :param row: Number of rows of the glass (default is 2).
+    :param col: Number of columns of the glass (default is 16).
+    :param en2: GPIO wired to the enable line of the second controller of a 40x4 glass.
+    :return: The controller, or the HD44780Pair of a 40x4 glass.
+    """
+    if row == 4 and col == 40:
+        lcd = HD44780Pair(col)
+        machine.ParallelBus(lcd.controllers[0], gpio_list, en2, lcd.controllers[1])
+        return lcd
+
+    lcd = HD44780(row, col)
+    machine.ParallelBus(lcd, gpio_list)
+    return lcd
+
+
+def reset() -> None:
+    """
+    Disconnects every simulated device and resets the modeled clock.
+
+    :return: None
+    """
+    machine.reset_devices()
+    rp2.reset_devices()
+    clock.reset()
+
+
+def settle(limit_us: float = 1_000_000) -> float:
+    """
+    Advances the modeled time until every active PIO state machine has executed everything written to it.
+
+    :param limit_us: Longest time to advance by, in microseconds.
+    :return: The time advanced by, in microseconds.
+    """
+    start: float = clock.now()
+    machines: list = [sm for sm in rp2.StateMachine._machines.values() if sm.active()]
+    while not all(sm.idle() for sm in machines) and clock.now() - start < limit_us:
+        clock.advance(1)
+
+    return clock.now() - start
+
+
+# THE END
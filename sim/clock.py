@@ -0,0 +1,80 @@
+# Modeled time of the simulation, in microseconds. Sleeps and bus transfers advance it.
+_now_us: float = 0.0
+
+# Peripherals running alongside the CPU, called as listener(until) whenever the time advances.
+_listeners: list = []
+
+
+def now() -> float:
+    """
+    Returns the modeled time.
+
+    :return: Microseconds since the last reset().
+    """
+    return _now_us
+
+
+def advance(us: float) -> None:
+    """
+    Advances the modeled time.
+
+    :param us: Microseconds to advance by.
+    :return: None
+    """
+    global _now_us
+    if us <= 0:
+        return
+
+    until: float = _now_us + us
+    for listener in tuple(_listeners):
+        listener(until)
+
+    _now_us = until
+
+
+def seek(us: float) -> None:
+    """
+    Moves the modeled time forward to the given time, without running the listeners. Listeners use it to
+    act at the time of each of their events.
+
+    :param us: The new time, in microseconds.
+    :return: None
+    """
+    global _now_us
+    _now_us = max(_now_us, us)
+
+
+def attach(listener) -> None:
+    """
+    Registers a peripheral to be run up to the new time whenever the time advances.
+
+    :param listener: Called as listener(until).
+    :return: None
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def detach(listener) -> None:
+    """
+    Unregisters a peripheral.
+
+    :param listener: The listener passed to attach().
+    :return: None
+    """
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def reset() -> None:
+    """
+    Resets the modeled time to 0, and unregisters every listener.
+
+    :return: None
+    """
+    global _now_us
+    _now_us = 0.0
+    _listeners.clear()
+
+
+# THE END
@@ -0,0 +1,49 @@
+from . import clock
+from .hd44780 import HD44780
+from .pcf8574 import PCF8574
+
+
+class HC595:
+    def __init__(self, lcd: HD44780, latch: int) -> None:
+        """
+        Initialize a simulated 74HC595 shift register, its outputs wired to an HD44780 as the port of the usual
+        LCD backpacks: QA to QD drive RS, RW, EN and the backlight, QE to QH drive D4 to D7.
+
+        Bytes shifted in over SPI reach the outputs on the rising edge of the latch GPIO (RCLK).
+
+        :param lcd: The simulated controller.
+        :param latch: The GPIO wired to RCLK.
+        """
+        self.lcd: HD44780 = lcd
+        self.outputs: PCF8574 = PCF8574(lcd)  # Same wiring, and same EN edge detection, as the backpack.
+        self.outputs.port = 0x00
+        self.shift_register: int = 0x00
+        self.__latch: int = latch
+
+        # Statistics.
+        self.latches: int = 0
+
+    def shift(self, byte: int) -> None:
+        """
+        Receives one byte shifted in over SPI.
+
+        :param byte: The byte.
+        :return: None
+        """
+        self.shift_register = byte & 0xFF
+
+    def edge(self, gpio: int, level: int) -> None:
+        """
+        Handles a level change of the latch GPIO: the shift register is copied to the outputs on a rising edge.
+
+        :param gpio: The GPIO.
+        :param level: The new level.
+        :return: None
+        """
+        if gpio == self.__latch and level:
+            clock.advance(0.02)  # Propagation delay of the storage register.
+            self.latches += 1
+            self.outputs.write(self.shift_register)
+
+
+# THE END
@@ -0,0 +1,258 @@
+from . import clock
+
+
+class HD44780:
+    # Execution times, in microseconds.
+    EXEC_US: float = 37.0
+    CLEAR_US: float = 1520.0
+    PULSE_US: float = 0.45  # Minimum enable pulse width.
+
+    # DDRAM addresses of the start of each row.
+    ROW_OFFSETS: tuple = (0x00, 0x40, 0x14, 0x54)
+
+    def __init__(self, row: int = 2, col: int = 16) -> None:
+        """
+        Initialize a simulated HD44780 controller, in its power-on state.
+
+        The model assembles 4-bit or 8-bit transfers, executes instructions against DDRAM, CGRAM, the address
+        counter and the display state, and tracks the busy flag against the modeled clock. Every transfer
+        received while the busy flag is set is counted as a violation; so are enable pulses that are too short,
+        as reported by the bus.
+
+        :param row: Number of rows of the simulated glass.
+        :param col: Number of columns of the simulated glass.
+        """
+        self.row: int = row
+        self.col: int = col
+
+        self.ddram: bytearray = bytearray(b" " * 0x80)
+        self.cgram: bytearray = bytearray(64)
+        self.ac: int = 0
+        self.cgram_selected: bool = False
+        self.increment: bool = True
+        self.shift: bool = False
+        self.display: bool = False
+        self.cursor: bool = False
+        self.blink: bool = False
+        self.eight_bit: bool = True
+        self.two_line: bool = False
+        self.font5x10: bool = False
+        self.offset: int = 0  # Display shift, in characters to the left.
+
+        self.busy_until: float = 0.0
+        self.__high_nibble: int = -1  # First nibble of a 4-bit write, -1 if none.
+        self.__read_low: bool = False  # Next 4-bit read returns the low nibble.
+
+        # Statistics.
+        self.instructions: int = 0
+        self.data_writes: int = 0
+        self.status_reads: int = 0
+        self.violations: int = 0
+        self.log: list = []  # (time, rs, byte) of every executed transfer.
+
+    def busy(self) -> bool:
+        """
+        Returns the busy flag at the modeled time.
+
+        :return: True while the last instruction is executing.
+        """
+        return clock.now() < self.busy_until
+
+    def output(self, rs: bool) -> int:
+        """
+        Returns the value the controller drives on D0 to D7 while EN is high with RW set.
+
+        In 4-bit mode, the high nibble then the low nibble of the register is driven on D4 to D7.
+
+        :param rs: Register Select (False for busy flag and address counter, True for data).
+        :return: The bus value.
+        """
+        if rs:
+            value: int = (self.cgram[self.ac & 0x3F] if self.cgram_selected else self.ddram[self.ac]) & 0xFF
+        else:
+            value = (0x80 if self.busy() else 0x00) | (self.ac & 0x7F)
+
+        if self.eight_bit:
+            return value
+
+        return ((value << 4) & 0xF0) if self.__read_low else (value & 0xF0)
+
+    def strobe(self, rs: bool, rw: bool, bus: int) -> None:
+        """
+        Latches the bus on the falling edge of EN.
+
+        :param rs: Register Select (False for instruction, True for data).
+        :param rw: Read/Write (True for read).
+        :param bus: Value of D0 to D7. In 4-bit mode, only D4 to D7 are used.
+        :return: None
+        """
+        if rw:
+            if not rs:
+                self.status_reads += 1
+            if not self.eight_bit:
+                self.__read_low = not self.__read_low
+            return
+
+        if self.eight_bit:
+            self.execute(rs, bus & 0xFF)
+            return
+
+        if self.__high_nibble < 0:
+            self.__high_nibble = bus & 0xF0
+            return
+
+        value: int = self.__high_nibble | ((bus >> 4) & 0x0F)
+        self.__high_nibble = -1
+        self.execute(rs, value)
+
+    def __advance_ac(self) -> None:
+        """
+        Move the address counter after a data transfer, wrapping like the DDRAM and CGRAM do.
+
+        :return: None
+        """
+        step: int = 1 if self.increment else -1
+
+        if self.cgram_selected:
+            self.ac = (self.ac + step) & 0x3F
+            return
+
+        if self.two_line:
+            line: int = self.ac & 0x40
+            position: int = ((self.ac & 0x3F) + step) % 40
+            if (step > 0 and position == 0) or (step < 0 and position == 39):
+                line ^= 0x40
+            self.ac = line | position
+        else:
+            self.ac = (self.ac + step) % 80
+
+        if self.shift:
+            self.offset += step
+
+    def execute(self, rs: bool, value: int) -> None:
+        """
+        Executes a complete 8-bit transfer, as latched from the bus or replayed from a trace.
+
+        :param rs: Register Select (False for instruction, True for data).
+        :param value: The instruction or data byte.
+        :return: None
+        """
+        if self.busy():
+            self.violations += 1
+
+        self.log.append((clock.now(), rs, value))
+        duration: float = self.EXEC_US
+
+        if rs:
+            self.data_writes += 1
+            if self.cgram_selected:
+                self.cgram[self.ac & 0x3F] = value
+            else:
+                self.ddram[self.ac] = value
+            self.__advance_ac()
+
+        else:
+            self.instructions += 1
+
+            if value & 0x80:
+                self.ac = value & 0x7F
+                self.cgram_selected = False
+            elif value & 0x40:
+                self.ac = value & 0x3F
+                self.cgram_selected = True
+            elif value & 0x20:
+                self.eight_bit = bool(value & 0x10)
+                self.two_line = bool(value & 0x08)
+                self.font5x10 = bool(value & 0x04)
+                self.__high_nibble = -1
+                self.__read_low = False
+            elif value & 0x10:
+                if value & 0x08:
+                    self.offset += -1 if value & 0x04 else 1
+                else:
+                    self.ac = (self.ac + (1 if value & 0x04 else -1)) & 0x7F
+            elif value & 0x08:
+                self.display = bool(value & 0x04)
+                self.cursor = bool(value & 0x02)
+                self.blink = bool(value & 0x01)
+            elif value & 0x04:
+                self.increment = bool(value & 0x02)
+                self.shift = bool(value & 0x01)
+            elif value & 0x02:
+                self.ac = 0
+                self.cgram_selected = False
+                self.offset = 0
+                duration = self.CLEAR_US
+            elif value & 0x01:
+                for index in range(len(self.ddram)):
+                    self.ddram[index] = 0x20
+                self.ac = 0
+                self.cgram_selected = False
+                self.increment = True
+                self.offset = 0
+                duration = self.CLEAR_US
+
+        self.busy_until = clock.now() + duration
+
+    def address(self, row: int, col: int) -> int:
+        """
+        Returns the DDRAM address shown at the given row and column, taking the display shift into account.
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :return: The DDRAM address.
+        """
+        if not self.two_line:
+            return (row * self.col + col + self.offset) % 80
+
+        start: int = self.ROW_OFFSETS[row]
+        line: int = start & 0x40
+        return line | (((start & 0x3F) + col + self.offset) % 40)
+
+    def lines(self) -> list:
+        """
+        Returns the characters shown on the glass, one string per row.
+
+        Character codes outside the printable ASCII range are shown as '?'.
+
+        :return: The rows.
+        """
+        rows: list = []
+        for row in range(self.row):
+            codes = (self.ddram[self.address(row, col)] for col in range(self.col))
+            rows.append("".join(chr(code) if 0x20 <= code < 0x7F else "?" for code in codes))
+
+        return rows
+
+
+class HD44780Pair:
+    def __init__(self, col: int = 40) -> None:
+        """
+        Initialize the two simulated HD44780 controllers of a 4-row glass: the first one drives rows 0 and 1, the
+        second one rows 2 and 3. They share RS, RW and the data lines, each one has its own enable line.
+
+        :param col: Number of columns of the simulated glass (default is 40).
+        """
+        self.row: int = 4
+        self.col: int = col
+        self.controllers: tuple = (HD44780(2, col), HD44780(2, col))
+
+    @property
+    def violations(self) -> int:
+        """
+        Returns the violations counted by both controllers.
+
+        :return: Number of violations.
+        """
+        return sum(lcd.violations for lcd in self.controllers)
+
+    def lines(self) -> list:
+        """
+        Returns the characters shown on the glass, one string per row.
+
+        :return: The rows.
+        """
+        return self.controllers[0].lines() + self.controllers[1].lines()
+
+
+# THE END
@@ -0,0 +1,245 @@
+# Host stand-in for the MicroPython 'machine' module, wired to simulated devices.
+from . import clock
+from .hd44780 import HD44780
+
+
+class Pin:
+    IN, OUT = 0, 1
+    PULL_UP, PULL_DOWN = 1, 2
+
+    # Output level, mode and level driven by a device, of every GPIO.
+    _levels: dict = {}
+    _modes: dict = {}
+    _inputs: dict = {}
+    _buses: dict = {}  # GPIO to the ParallelBus watching it.
+    writes: int = 0  # Number of output level changes requested, over all pins.
+
+    def __init__(self, id: int, mode: int = -1, pull: int = -1, value: int = None) -> None:
+        self.__id: int = id
+        if mode != -1:
+            Pin._modes[id] = mode
+        if value is not None:
+            self.value(value)
+
+    def init(self, mode: int = -1, pull: int = -1, value: int = None) -> None:
+        if mode != -1:
+            Pin._modes[self.__id] = mode
+        if value is not None:
+            self.value(value)
+
+    def id(self) -> int:
+        return self.__id
+
+    def value(self, value: int = None):
+        if value is None:
+            if Pin._modes.get(self.__id, Pin.IN) == Pin.IN:
+                bus = Pin._buses.get(self.__id)
+                if bus is not None:
+                    return bus.input_level(self.__id)
+                return Pin._inputs.get(self.__id, 0)
+            return Pin._levels.get(self.__id, 0)
+
+        Pin.writes += 1
+        drive(self.__id, value)
+
+    def on(self) -> None:
+        self.value(1)
+
+    def off(self) -> None:
+        self.value(0)
+
+    def __call__(self, value: int = None):
+        return self.value(value)
+
+
+def drive(gpio: int, value: int) -> None:
+    """
+    Sets the output level of a GPIO, notifying the ParallelBus watching it. Peripherals such as PIO state
+    machines use it directly, as their pin changes are not CPU writes.
+
+    :param gpio: The GPIO.
+    :param value: The new level.
+    :return: None
+    """
+    level: int = 1 if value else 0
+    previous: int = Pin._levels.get(gpio, 0)
+    Pin._levels[gpio] = level
+
+    bus = Pin._buses.get(gpio)
+    if bus is not None and level != previous:
+        bus.edge(gpio, level)
+
+
+class ParallelBus:
+    def __init__(self, lcd: HD44780, gpio_list: tuple, en2: int = -1, lcd2: HD44780 = None) -> None:
+        """
+        Wire a simulated HD44780 to GPIOs, in the order used by LiquidCrystal: RS, RW, EN, then D4 to D7 or
+        D0 to D7. The second controller of a 40x4 glass shares every line but its enable.
+
+        :param lcd: The simulated controller.
+        :param gpio_list: The GPIO numbers.
+        :param en2: GPIO wired to the enable line of the second controller, if any.
+        :param lcd2: The second controller, if any.
+        """
+        self.lcd: HD44780 = lcd
+        self.__rs, self.__rw, self.__en = gpio_list[:3]
+        self.__data: tuple = tuple(gpio_list[3:])
+        self.__offset: int = 4 if len(self.__data) == 4 else 0  # Bit of D0 to D7 driven by the first data GPIO.
+        self.__lcds: dict = {self.__en: lcd}  # Controller of each enable GPIO.
+        self.__rise: dict = {self.__en: 0.0}  # Time of the last rising edge of each enable GPIO.
+
+        if lcd2 is not None:
+            self.__lcds[en2] = lcd2
+            self.__rise[en2] = 0.0
+
+        for gpio in tuple(gpio_list) + tuple(self.__lcds):
+            Pin._buses[gpio] = self
+
+    def edge(self, gpio: int, level: int) -> None:
+        """
+        Handles a level change of a wired GPIO; the controller latches the bus on the falling edge of EN.
+
+        An enable pulse shorter than the 450 ns minimum width is counted as a violation.
+
+        :param gpio: The GPIO.
+        :param level: The new level.
+        :return: None
+        """
+        lcd: HD44780 = self.__lcds.get(gpio)
+        if lcd is None:
+            return
+
+        if level:
+            self.__rise[gpio] = clock.now()
+            return
+
+        if clock.now() - self.__rise[gpio] < lcd.PULSE_US:
+            lcd.violations += 1
+
+        bus: int = 0
+        for bit, data in enumerate(self.__data):
+            bus |= Pin._levels.get(data, 0) << (bit + self.__offset)
+
+        lcd.strobe(bool(Pin._levels.get(self.__rs, 0)), bool(Pin._levels.get(self.__rw, 0)), bus)
+
+    def input_level(self, gpio: int) -> int:
+        """
+        Returns the level read on a wired GPIO; the controller drives the data lines while RW and EN are high.
+
+        :param gpio: The GPIO.
+        :return: The level.
+        """
+        if gpio in self.__data and Pin._levels.get(self.__rw, 0):
+            for en, lcd in self.__lcds.items():
+                if Pin._levels.get(en, 0):
+                    bus: int = lcd.output(bool(Pin._levels.get(self.__rs, 0)))
+                    return (bus >> (self.__data.index(gpio) + self.__offset)) & 0x01
+
+        return Pin._levels.get(gpio, 0)
+
+
+class I2C:
+    # Devices on the simulated bus, by address.
+    _devices: dict = {}
+
+    def __init__(self, id: int = 0, scl: Pin = None, sda: Pin = None, freq: int = 400_000) -> None:
+        self.freq: int = freq
+
+        # Statistics.
+        self.transactions: int = 0
+        self.bytes_written: int = 0
+        self.bytes_read: int = 0
+
+    def __byte_time(self) -> float:
+        # 8 data bits and the acknowledge bit, in microseconds.
+        return 9 * 1_000_000 / self.freq
+
+    def scan(self) -> list:
+        return sorted(I2C._devices)
+
+    def writeto(self, addr: int, buf, stop: bool = True) -> int:
+        device = I2C._devices.get(addr)
+        if device is None:
+            raise OSError(19)  # ENODEV, as MicroPython raises on a missing acknowledge.
+
+        self.transactions += 1
+        clock.advance(self.__byte_time())  # Start condition and address byte.
+        if hasattr(device, "start"):
+            device.start()
+        for byte in bytes(buf):
+            clock.advance(self.__byte_time())
+            device.write(byte)
+            self.bytes_written += 1
+
+        return len(buf)
+
+    def readfrom_into(self, addr: int, buf, stop: bool = True) -> None:
+        device = I2C._devices.get(addr)
+        if device is None:
+            raise OSError(19)
+
+        self.transactions += 1
+        clock.advance(self.__byte_time())
+        for index in range(len(buf)):
+            clock.advance(self.__byte_time())
+            buf[index] = device.read()
+            self.bytes_read += 1
+
+    def readfrom(self, addr: int, nbytes: int, stop: bool = True) -> bytes:
+        buf: bytearray = bytearray(nbytes)
+        self.readfrom_into(addr, buf, stop)
+        return bytes(buf)
+
+
+SoftI2C = I2C
+
+
+class SPI:
+    MSB, LSB = 0, 1
+
+    # Devices on the simulated buses, by bus id.
+    _devices: dict = {}
+
+    def __init__(self, id: int = 0, baudrate: int = 1_000_000, polarity: int = 0, phase: int = 0, **kwargs) -> None:
+        self.__id: int = id
+        self.baudrate: int = baudrate
+
+        # Statistics.
+        self.transactions: int = 0
+        self.bytes_written: int = 0
+
+    def write(self, buf) -> None:
+        device = SPI._devices.get(self.__id)
+
+        self.transactions += 1
+        for byte in bytes(buf):
+            clock.advance(8 * 1_000_000 / self.baudrate)
+            if device is not None:
+                device.shift(byte)
+            self.bytes_written += 1
+
+
+class ADC:
+    def __init__(self, pin) -> None:
+        self.__value: int = 0x3700  # About 27 °C on the RP2040 temperature sensor.
+
+    def read_u16(self) -> int:
+        return self.__value
+
+
+def reset_devices() -> None:
+    """
+    Disconnects every simulated device and clears the pin states.
+
+    :return: None
+    """
+    I2C._devices.clear()
+    SPI._devices.clear()
+    Pin._levels.clear()
+    Pin._modes.clear()
+    Pin._inputs.clear()
+    Pin._buses.clear()
+    Pin.writes = 0
+
+
+# THE END
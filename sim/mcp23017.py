@@ -0,0 +1,116 @@
+from .hd44780 import HD44780
+
+
+class MCP23017:
+    # Registers, with IOCON.BANK = 0: direction, configuration, port and output latch of port A; port B follows.
+    IODIR, IOCON, GPIO, OLAT = 0x00, 0x0A, 0x12, 0x14
+
+    # IOCON: sequential operation disabled.
+    SEQOP = 0x20
+
+    # Port bit masks of the LCD wiring, as on the PCF8574 backpacks.
+    RS, RW, EN, BL = 0x01, 0x02, 0x04, 0x08
+
+    def __init__(self, lcd: HD44780, bank: int = 0) -> None:
+        """
+        Initialize a simulated MCP23017 expander, one port wired to an HD44780: bits 0 to 3 drive RS, RW, EN and
+        the backlight, bits 4 to 7 drive D4 to D7. The controller latches the data lines on every falling edge
+        of EN.
+
+        The first byte of each write transaction selects a register. Following bytes are written to it, moving
+        to the next register after each byte unless IOCON.SEQOP is set.
+
+        :param lcd: The simulated controller.
+        :param bank: Port wired to the LCD, 0 for port A or 1 for port B (default is 0).
+        """
+        self.lcd: HD44780 = lcd
+        self.bank: int = bank
+        self.registers: bytearray = bytearray(0x16)
+        self.registers[self.IODIR] = self.registers[self.IODIR + 1] = 0xFF  # Power-on state: all inputs.
+        self.pointer: int = 0
+        self.__selecting: bool = True  # The next byte written is a register address.
+
+        # Statistics.
+        self.transactions: int = 0
+        self.bytes_written: int = 0
+        self.bytes_read: int = 0
+
+    def start(self) -> None:
+        """
+        Handles the start of a transaction.
+
+        :return: None
+        """
+        self.transactions += 1
+        self.__selecting = True
+
+    def port(self) -> int:
+        """
+        Returns the level of the output pins of the LCD port, inputs read as low.
+
+        :return: The pin levels.
+        """
+        return self.registers[self.OLAT + self.bank] & ~self.registers[self.IODIR + self.bank] & 0xFF
+
+    def write(self, byte: int) -> None:
+        """
+        Receives one byte of a write transaction.
+
+        :param byte: The register address, or the value written.
+        :return: None
+        """
+        self.bytes_written += 1
+        if self.__selecting:
+            self.pointer = byte % len(self.registers)
+            self.__selecting = False
+            return
+
+        register: int = self.pointer
+        previous: int = self.port()
+
+        if register in (self.GPIO, self.GPIO + 1):
+            register += self.OLAT - self.GPIO  # Writing the port writes the output latch.
+        if register in (self.IOCON, self.IOCON + 1):
+            self.registers[self.IOCON] = self.registers[self.IOCON + 1] = byte
+        else:
+            self.registers[register] = byte
+
+        if not self.registers[self.IOCON] & self.SEQOP:
+            self.pointer = (self.pointer + 1) % len(self.registers)
+
+        current: int = self.port()
+        if previous & self.EN and not current & self.EN:
+            self.lcd.strobe(bool(previous & self.RS), bool(previous & self.RW), previous & 0xF0)
+
+    def read(self) -> int:
+        """
+        Returns the register selected. The port of the LCD reads the controller on D4 to D7 while they are
+        inputs, and RW and EN are high.
+
+        :return: The register value.
+        """
+        self.bytes_read += 1
+        register: int = self.pointer
+        if not self.registers[self.IOCON] & self.SEQOP:
+            self.pointer = (self.pointer + 1) % len(self.registers)
+
+        if register != self.GPIO + self.bank:
+            return self.registers[register]
+
+        port: int = self.port()
+        inputs: int = self.registers[self.IODIR + self.bank]
+        if port & self.RW and port & self.EN:
+            return (port & ~inputs) | (self.lcd.output(bool(port & self.RS)) & 0xF0 & inputs)
+
+        return port
+
+    def backlight(self) -> bool:
+        """
+        Returns the backlight state.
+
+        :return: True if the backlight is on.
+        """
+        return bool(self.port() & self.BL)
+
+
+# THE END
@@ -0,0 +1,27 @@
+# Host stand-in for the MicroPython 'micropython' module.
+
+
+def const(value):
+    """
+    Returns the value as-is, as const() does outside of the MicroPython compiler.
+
+    :param value: The constant value.
+    :return: The value.
+    """
+    return value
+
+
+def native(function):
+    """
+    Returns the function as-is; there is no native code emitter on the host.
+
+    :param function: The decorated function.
+    :return: The function.
+    """
+    return function
+
+
+viper = native
+
+
+# THE END
@@ -0,0 +1,126 @@
+from .hd44780 import HD44780
+
+
+class PCF8574:
+    # Port bit masks of the usual LCD backpack wiring.
+    RS, RW, EN, BL = 0x01, 0x02, 0x04, 0x08
+
+    def __init__(self, lcd: HD44780, lcd2: HD44780 = None, en2: int = 0) -> None:
+        """
+        Initialize a simulated PCF8574 expander wired to an HD44780 as on the usual LCD backpacks.
+
+        P0 to P3 drive RS, RW, EN and the backlight, P4 to P7 drive D4 to D7. The controller latches the
+        data lines on every falling edge of EN.
+
+        The second controller of a 40x4 glass is enabled by the RW or BL pin instead: if wired to RW, the
+        controllers are always written.
+
+        :param lcd: The simulated controller.
+        :param lcd2: The second controller, if any.
+        :param en2: Port bit mask of the enable line of the second controller, RW or BL.
+        """
+        self.lcd: HD44780 = lcd
+        self.lcd2: HD44780 = lcd2
+        self.en2: int = en2 if lcd2 is not None else 0
+        self.port: int = 0xFF  # Power-on state: all lines high.
+
+        # Statistics.
+        self.transactions: int = 0
+        self.bytes_written: int = 0
+        self.bytes_read: int = 0
+
+    def write(self, byte: int) -> None:
+        """
+        Receives one byte written to the port.
+
+        :param byte: The new port value.
+        :return: None
+        """
+        previous: int = self.port
+        self.port = byte & 0xFF
+        self.bytes_written += 1
+
+        if previous & self.EN and not self.port & self.EN:
+            self.lcd.strobe(bool(previous & self.RS), bool(previous & self.RW & ~self.en2), previous & 0xF0)
+
+        if previous & self.en2 and not self.port & self.en2:
+            self.lcd2.strobe(bool(previous & self.RS), bool(previous & self.RW & ~self.en2), previous & 0xF0)
+
+    def read(self) -> int:
+        """
+        Returns the port value read back. While RW and EN are high, the controller drives D4 to D7.
+
+        :return: The port value.
+        """
+        self.bytes_read += 1
+
+        if self.port & self.RW and self.port & self.EN:
+            return (self.port & 0x0F) | (self.lcd.output(bool(self.port & self.RS)) & 0xF0)
+
+        if self.en2 == self.BL and self.port & self.RW and self.port & self.BL:
+            return (self.port & 0x0F) | (self.lcd2.output(bool(self.port & self.RS)) & 0xF0)
+
+        return self.port
+
+    def backlight(self) -> bool:
+        """
+        Returns the backlight state.
+
+        :return: True if the backlight is on.
+        """
+        return bool(self.port & self.BL)
+
+
+class PCF8574T:
+    # Stand-in for the PCF8574T driver submodule, used when lib/PCF8574T is not checked out.
+    PIN_MIN, PIN_MAX = 0, 8
+    OUTPUT, INPUT = 0, 1
+
+    def __init__(self, port, addr: int) -> None:
+        """
+        Initialize the stand-in expander driver.
+
+        :param port: I2C port for communication.
+        :param addr: I2C address of the expander.
+        :raises TypeError: If the provided port has no writeto method.
+        """
+        if not hasattr(port, "writeto"):
+            raise TypeError("Invalid port! 'port' must be an I2C object.")
+
+        self.__port = port
+        self.__addr: int = addr
+        self.__state: int = 0x00
+
+    def set_gpio_mode(self, pin: int, mode: int) -> None:
+        """
+        Sets the mode of a pin. Inputs are written high, as the PCF8574 requires.
+
+        :param pin: The pin number.
+        :param mode: OUTPUT or INPUT.
+        :return: None
+        """
+        if mode == self.INPUT:
+            self.gpio_write(pin, True)
+
+    def gpio_write(self, pin: int, value: bool) -> None:
+        """
+        Writes one pin, sending the whole port byte.
+
+        :param pin: The pin number.
+        :param value: The pin level.
+        :return: None
+        """
+        self.__state = (self.__state | (1 << pin)) if value else (self.__state & ~(1 << pin))
+        self.__port.writeto(self.__addr, bytes((self.__state,)))
+
+    def gpio_read(self, pin: int) -> int:
+        """
+        Reads one pin.
+
+        :param pin: The pin number.
+        :return: The pin level.
+        """
+        return (self.__port.readfrom(self.__addr, 1)[0] >> pin) & 0x01
+
+
+# THE END
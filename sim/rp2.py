@@ -0,0 +1,564 @@
+# Host stand-in for the MicroPython 'rp2' module: a PIO assembler with the asm_pio syntax, a state machine
+# emulator stepped cycle by cycle on the modeled clock, and DMA channels feeding the state machine TX FIFOs.
+#
+# Supported instructions: jmp, out, pull, set, mov (x, y, osr, pins, null) and nop, with side-set and delays.
+import types
+
+from . import clock
+from .machine import Pin, drive
+
+# Addresses of the PIO blocks, and offset of the TX FIFO of state machine 0 (one word per state machine).
+_PIO_BASES: tuple = (0x50200000, 0x50300000)
+_TXF0: int = 0x010
+
+
+class PIO:
+    IN_LOW, IN_HIGH, OUT_LOW, OUT_HIGH = 0, 1, 2, 3
+    SHIFT_LEFT, SHIFT_RIGHT = 0, 1
+    JOIN_NONE, JOIN_TX, JOIN_RX = 0, 1, 2
+
+    def __init__(self, id: int) -> None:
+        self.__id: int = id
+
+    def state_machine(self, id: int, *args, **kwargs) -> "StateMachine":
+        return StateMachine(self.__id * 4 + id, *args, **kwargs)
+
+
+class _Instruction:
+    def __init__(self, op: str, *args) -> None:
+        """
+        Initialize one assembled instruction.
+
+        :param op: The mnemonic.
+        :param args: The operands.
+        """
+        self.op: str = op
+        self.args: tuple = args
+        self.side_value: int = 0
+        self.delay: int = 0
+
+    def side(self, value: int) -> "_Instruction":
+        self.side_value = value
+        return self
+
+    def __getitem__(self, delay: int) -> "_Instruction":
+        self.delay = delay
+        return self
+
+
+class _Program:
+    def __init__(self, settings: dict) -> None:
+        """
+        Initialize an empty program, with the settings passed to asm_pio().
+
+        :param settings: The asm_pio() keyword arguments.
+        """
+        self.settings: dict = settings
+        self.instructions: list = []
+        self.labels: dict = {}
+        self.wrap_target: int = 0
+        self.wrap: int = -1
+
+    def pin_count(self, name: str) -> int:
+        """
+        Returns the number of pins given by an *_init setting.
+
+        :param name: 'out_init', 'set_init' or 'sideset_init'.
+        :return: The number of pins.
+        """
+        init = self.settings.get(name)
+        if init is None:
+            return 0
+        return len(init) if isinstance(init, tuple) else 1
+
+
+def asm_pio(**settings):
+    """
+    Assembles a PIO program written with the MicroPython asm_pio syntax.
+
+    :param settings: out_init, set_init, sideset_init, out_shiftdir, autopull, pull_thresh and fifo_join.
+    :return: The decorator, returning the assembled program.
+    """
+
+    def assemble(function) -> _Program:
+        program = _Program(settings)
+        side_bits: int = program.pin_count("sideset_init")
+
+        def emit(op: str, *args) -> _Instruction:
+            instruction = _Instruction(op, *args)
+            program.instructions.append(instruction)
+            return instruction
+
+        def label(name: str) -> None:
+            program.labels[name] = len(program.instructions)
+
+        def wrap_target() -> None:
+            program.wrap_target = len(program.instructions)
+
+        def wrap() -> None:
+            program.wrap = len(program.instructions) - 1
+
+        def jmp(condition, target=None) -> _Instruction:
+            if target is None:
+                condition, target = None, condition
+            return emit("jmp", condition, target)
+
+        def pull(first=None, second=None) -> _Instruction:
+            options: tuple = tuple(option for option in (first, second) if option is not None)
+            return emit("pull", "ifempty" in options, "noblock" not in options)
+
+        namespace: dict = {
+            "__builtins__": __builtins__,
+            "label": label,
+            "wrap_target": wrap_target,
+            "wrap": wrap,
+            "jmp": jmp,
+            "pull": pull,
+            "out": lambda destination, count: emit("out", destination, count),
+            "set": lambda destination, value: emit("set", destination, value),
+            "mov": lambda destination, source: emit("mov", destination, source),
+            "nop": lambda: emit("mov", "y", "y"),
+        }
+        for name in ("pins", "x", "y", "null", "pindirs", "pc", "isr", "osr", "exec"):
+            namespace[name] = name
+        for name in ("not_x", "x_dec", "not_y", "y_dec", "x_not_y", "pin", "not_osre"):
+            namespace[name] = name
+        for name in ("block", "noblock", "ifempty"):
+            namespace[name] = name
+
+        types.FunctionType(function.__code__, namespace)()
+
+        if len(program.instructions) > 32:
+            raise ValueError("PIO program too long! At most 32 instructions fit in the instruction memory.")
+
+        for instruction in program.instructions:
+            if instruction.delay >= 1 << (5 - side_bits) or instruction.side_value >= 1 << max(side_bits, 1):
+                raise ValueError(f"Invalid delay or side-set value in {instruction.op}{instruction.args}.")
+
+        if program.wrap < 0:
+            program.wrap = len(program.instructions) - 1
+
+        return program
+
+    return assemble
+
+
+class StateMachine:
+    # State machines created so far, by id; like on the hardware, there is one object per id.
+    _machines: dict = {}
+
+    def __new__(cls, id: int, *args, **kwargs) -> "StateMachine":
+        machine = cls._machines.get(id)
+        if machine is None:
+            machine = super().__new__(cls)
+            machine.__id = id
+            machine.__program = None
+            machine.__active = False
+            cls._machines[id] = machine
+        return machine
+
+    def __init__(self, id: int, program: _Program = None, freq: int = -1, **kwargs) -> None:
+        """
+        Initialize an emulated PIO state machine.
+
+        The state machine runs alongside the modeled clock: whenever the time advances, it executes the
+        cycles up to the new time, driving the simulated pins at the time of each cycle. DMA channels whose
+        write address is its TX FIFO keep the FIFO filled.
+
+        :param id: State machine number, 0 to 3 on PIO0 and 4 to 7 on PIO1.
+        :param program: The program assembled by asm_pio().
+        :param freq: Clock frequency in Hz (default is the 125 MHz system clock).
+        """
+        if program is not None:
+            self.init(program, freq, **kwargs)
+
+    def init(
+        self,
+        program: _Program,
+        freq: int = -1,
+        *,
+        out_base: Pin = None,
+        set_base: Pin = None,
+        sideset_base: Pin = None,
+        out_shiftdir: int = None,
+        pull_thresh: int = None,
+    ) -> None:
+        settings: dict = program.settings
+        self.__program: _Program = program
+        self.__period: float = 1_000_000 / (125_000_000 if freq < 0 else freq)
+        self.__time: float = clock.now()  # Time of the next cycle.
+
+        self.__out: tuple = self.__pins(out_base, program.pin_count("out_init"), settings.get("out_init"))
+        self.__set: tuple = self.__pins(set_base, program.pin_count("set_init"), settings.get("set_init"))
+        self.__side: tuple = self.__pins(
+            sideset_base, program.pin_count("sideset_init"), settings.get("sideset_init")
+        )
+
+        shift = settings.get("out_shiftdir", PIO.SHIFT_LEFT) if out_shiftdir is None else out_shiftdir
+        self.__shift_right: bool = shift == PIO.SHIFT_RIGHT
+        self.__autopull: bool = settings.get("autopull", False)
+        self.__threshold: int = (settings.get("pull_thresh", 32) if pull_thresh is None else pull_thresh) or 32
+        self.__depth: int = 8 if settings.get("fifo_join", PIO.JOIN_NONE) == PIO.JOIN_TX else 4
+
+        self.__fifo: list = []
+        self.__pc: int = 0
+        self.__x: int = 0
+        self.__y: int = 0
+        self.__osr: int = 0
+        self.__osr_count: int = 32  # Bits shifted out of the OSR; 32 is empty.
+        self.__stalled: bool = False
+
+        # Statistics.
+        self.cycles: int = 0
+        self.words: int = 0  # Words written to the TX FIFO, by put() or DMA.
+
+    @staticmethod
+    def __pins(base: Pin, count: int, init) -> tuple:
+        """
+        Map consecutive pins from a base pin, and drive them to their initial level.
+
+        :param base: The first pin.
+        :param count: The number of pins.
+        :param init: PIO.OUT_LOW or PIO.OUT_HIGH, or a tuple of them.
+        :return: The GPIO numbers.
+        """
+        if base is None or not count:
+            return ()
+
+        levels: tuple = init if isinstance(init, tuple) else (init,)
+        gpios: tuple = tuple(base.id() + index for index in range(count))
+        for gpio, level in zip(gpios, levels):
+            Pin._modes[gpio] = Pin.OUT
+            drive(gpio, level == PIO.OUT_HIGH)
+
+        return gpios
+
+    def txf_address(self) -> int:
+        """
+        Returns the bus address of the TX FIFO, to be used as a DMA write address.
+
+        :return: The address.
+        """
+        return _PIO_BASES[self.__id // 4] + _TXF0 + 4 * (self.__id % 4)
+
+    def active(self, value: int = None):
+        if value is None:
+            return self.__active
+
+        self.__active = bool(value)
+        if self.__active:
+            self.__time = max(self.__time, clock.now())
+            clock.attach(self._run)
+        else:
+            clock.detach(self._run)
+
+    def put(self, value, shift: int = 0) -> None:
+        """
+        Writes words to the TX FIFO, waiting for room while it is full.
+
+        :param value: An int, or a buffer of words.
+        :param shift: Left shift applied to every word.
+        :return: None
+        """
+        words = (value,) if isinstance(value, int) else value
+        for word in words:
+            while len(self.__fifo) >= self.__depth:
+                clock.advance(self.__period)
+            self.__fifo.append((word << shift) & 0xFFFFFFFF)
+            self.words += 1
+
+    def tx_fifo(self) -> int:
+        return len(self.__fifo)
+
+    def idle(self) -> bool:
+        """
+        Simulation only: returns whether the state machine is stalled on an empty TX FIFO, with no DMA transfer
+        pending.
+
+        :return: True once everything written has been executed.
+        """
+        return not self.__fifo and self.__stalled and not any(
+            channel.target() is self for channel in DMA._channels if channel.active()
+        )
+
+    def _fill(self) -> None:
+        """
+        Lets the active DMA channels writing to the TX FIFO transfer while it has room.
+
+        :return: None
+        """
+        for channel in DMA._channels:
+            while len(self.__fifo) < self.__depth and channel.active() and channel.target() is self:
+                self.__fifo.append(channel._next())
+                self.words += 1
+
+    def _run(self, until: float) -> None:
+        """
+        Executes the cycles up to the given time.
+
+        :param until: The modeled time, in microseconds.
+        :return: None
+        """
+        if self.__stalled:
+            self.__time = max(self.__time, clock.now())
+
+        while self.__time < until:
+            self._fill()
+            clock.seek(self.__time)
+            self.__step()
+
+            if self.__stalled and not self.__fifo:
+                self._fill()
+                if not self.__fifo:
+                    self.__time = until  # Nothing can happen until the FIFO is written.
+
+    def __step(self) -> None:
+        """
+        Execute one cycle.
+
+        :return: None
+        """
+        program: _Program = self.__program
+        instruction: _Instruction = program.instructions[self.__pc]
+        self.cycles += 1
+
+        for bit, gpio in enumerate(self.__side):
+            drive(gpio, (instruction.side_value >> bit) & 0x01)
+
+        target: int = self.__execute(instruction)
+        if self.__stalled:
+            self.__time += self.__period
+            return
+
+        if target >= 0:
+            self.__pc = target
+        elif self.__pc == program.wrap:
+            self.__pc = program.wrap_target
+        else:
+            self.__pc += 1
+
+        self.__time += self.__period * (1 + instruction.delay)
+
+    def __shift_out(self, count: int) -> int:
+        """
+        Shift bits out of the OSR.
+
+        :param count: Number of bits.
+        :return: The bits.
+        """
+        count = count or 32
+        mask: int = (1 << count) - 1
+        if self.__shift_right:
+            value: int = self.__osr & mask
+            self.__osr >>= count
+        else:
+            value = (self.__osr >> (32 - count)) & mask
+            self.__osr = (self.__osr << count) & 0xFFFFFFFF
+
+        self.__osr_count = min(self.__osr_count + count, 32)
+        return value
+
+    def __write(self, destination: str, value: int, pins: tuple) -> int:
+        """
+        Write a value to a destination of out, set or mov.
+
+        :param destination: The destination name.
+        :param value: The value.
+        :param pins: The GPIOs written by the 'pins' destination.
+        :return: The jump target for the 'pc' destination, otherwise -1.
+        """
+        if destination == "pins":
+            for bit, gpio in enumerate(pins):
+                drive(gpio, (value >> bit) & 0x01)
+        elif destination == "x":
+            self.__x = value & 0xFFFFFFFF
+        elif destination == "y":
+            self.__y = value & 0xFFFFFFFF
+        elif destination == "osr":
+            self.__osr, self.__osr_count = value & 0xFFFFFFFF, 0
+        elif destination == "pc":
+            return value
+        elif destination != "null":
+            raise NotImplementedError(f"Unsupported PIO destination: {destination}.")
+
+        return -1
+
+    def __execute(self, instruction: _Instruction) -> int:
+        """
+        Execute an instruction, or stall it.
+
+        :param instruction: The instruction.
+        :return: The jump target, or -1 to continue with the next instruction.
+        """
+        op: str = instruction.op
+        args: tuple = instruction.args
+        self.__stalled = False
+
+        if op == "jmp":
+            condition, target = args
+            taken: bool = {
+                None: True,
+                "not_x": self.__x == 0,
+                "x_dec": self.__x != 0,
+                "not_y": self.__y == 0,
+                "y_dec": self.__y != 0,
+                "x_not_y": self.__x != self.__y,
+                "not_osre": self.__osr_count < self.__threshold,
+            }[condition]
+            if condition == "x_dec":
+                self.__x = (self.__x - 1) & 0xFFFFFFFF
+            elif condition == "y_dec":
+                self.__y = (self.__y - 1) & 0xFFFFFFFF
+            return self.__program.labels[target] if taken else -1
+
+        if op == "out":
+            if self.__autopull and self.__osr_count >= self.__threshold:
+                if not self.__fifo:
+                    self.__stalled = True
+                    return -1
+                self.__osr, self.__osr_count = self.__fifo.pop(0), 0
+
+            destination, count = args
+            return self.__write(destination, self.__shift_out(count), self.__out)
+
+        if op == "pull":
+            if_empty, block = args
+            if if_empty and self.__osr_count < self.__threshold:
+                return -1
+            if self.__fifo:
+                self.__osr, self.__osr_count = self.__fifo.pop(0), 0
+            elif block:
+                self.__stalled = True
+            else:
+                self.__osr, self.__osr_count = self.__x, 0
+            return -1
+
+        if op == "set":
+            destination, value = args
+            return self.__write(destination, value, self.__set)
+
+        if op == "mov":
+            destination, source = args
+            if source not in ("x", "y", "osr", "null"):
+                raise NotImplementedError(f"Unsupported PIO source: {source}.")
+            value: int = {"x": self.__x, "y": self.__y, "osr": self.__osr, "null": 0}[source]
+            return self.__write(destination, value, self.__out)
+
+        raise NotImplementedError(f"Unsupported PIO instruction: {op}.")
+
+
+class DMA:
+    # Channels claimed so far.
+    _channels: list = []
+
+    # Bit positions of the CTRL register fields.
+    __FIELDS: tuple = (
+        ("enable", 0, 1),
+        ("high_pri", 1, 1),
+        ("size", 2, 2),
+        ("inc_read", 4, 1),
+        ("inc_write", 5, 1),
+        ("ring_size", 6, 4),
+        ("ring_sel", 10, 1),
+        ("chain_to", 11, 4),
+        ("treq_sel", 15, 6),
+        ("irq_quiet", 21, 1),
+        ("bswap", 22, 1),
+        ("sniff_en", 23, 1),
+    )
+
+    def __init__(self) -> None:
+        """
+        Claim an emulated DMA channel. Only transfers from a buffer to a state machine TX FIFO are modeled;
+        they are paced by the FIFO, whatever treq_sel is.
+        """
+        self.channel: int = len(DMA._channels)
+        self.__active: bool = False
+        self.__source: memoryview = memoryview(b"")
+        self.__target: StateMachine | None = None
+        self.__size: int = 4
+        self.__index: int = 0
+        self.__count: int = 0
+        DMA._channels.append(self)
+
+    def pack_ctrl(self, default: int = None, **fields) -> int:
+        values: dict = {"enable": 1, "size": 2, "inc_read": 1, "inc_write": 1, "chain_to": self.channel}
+        values.update({"treq_sel": 0x3F, "irq_quiet": 1})
+        if default is not None:
+            values = self.unpack_ctrl(default)
+        values.update(fields)
+
+        ctrl: int = 0
+        for name, shift, width in self.__FIELDS:
+            ctrl |= (int(values.get(name, 0)) & ((1 << width) - 1)) << shift
+        return ctrl
+
+    @staticmethod
+    def unpack_ctrl(ctrl: int) -> dict:
+        return {name: (ctrl >> shift) & ((1 << width) - 1) for name, shift, width in DMA.__FIELDS}
+
+    def config(self, read=None, write=None, count: int = None, ctrl: int = None, trigger: bool = False) -> None:
+        if read is not None:
+            self.__source = memoryview(read).cast("B")
+        if write is not None:
+            self.__target = next(
+                (machine for machine in StateMachine._machines.values() if machine.txf_address() == write), None
+            )
+            if self.__target is None:
+                raise NotImplementedError("Unsupported DMA write address! Only state machine TX FIFOs are modeled.")
+        if count is not None:
+            self.__count = count
+        if ctrl is not None:
+            self.__size = 1 << self.unpack_ctrl(ctrl)["size"]
+
+        self.__index = 0
+        if trigger:
+            self.active(1)
+
+    def active(self, value: int = None):
+        if value is None:
+            return self.__active and self.__index < self.__count
+
+        self.__active = bool(value)
+        if self.__active and self.__target is not None:
+            self.__target._fill()
+
+    def target(self) -> StateMachine | None:
+        return self.__target
+
+    def _next(self) -> int:
+        """
+        Reads the next item of the source buffer, replicated over the 32-bit bus like the hardware does.
+
+        :return: The word written to the FIFO.
+        """
+        size: int = self.__size
+        start: int = self.__index * size
+        item: int = int.from_bytes(self.__source[start : start + size], "little")
+        self.__index += 1
+
+        if size == 1:
+            return item * 0x01010101
+        if size == 2:
+            return item | (item << 16)
+        return item
+
+    def close(self) -> None:
+        self.__active = False
+        if self in DMA._channels:
+            DMA._channels.remove(self)
+
+
+def reset_devices() -> None:
+    """
+    Releases every state machine and DMA channel.
+
+    :return: None
+    """
+    for machine in StateMachine._machines.values():
+        clock.detach(machine._run)
+    StateMachine._machines.clear()
+    DMA._channels.clear()
+
+
+# THE END
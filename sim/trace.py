@@ -0,0 +1,252 @@
+"""
+Host-side replayer of the traces recorded by TraceRecorder.
+
+The records are executed against a simulated HD44780, or the pair of a 40x4 glass, at their recorded times, to
+rebuild every screen shown and compute statistics: redundant instructions, data writes that leave a cell unchanged,
+sleeps longer than the controller needed, and bus bytes per visible change of the screen.
+
+    python -m sim.trace trace.bin
+    python -m sim.trace trace.bin --screens
+"""
+import argparse
+import struct
+import sys
+
+from . import clock
+from .hd44780 import HD44780, HD44780Pair
+
+# Trace file header and records, as written by TraceRecorder.dump().
+HEADER: str = "<4sBBBBII"
+MAGIC: bytes = b"LCDT"
+RECORD_SIZE: int = 4
+
+# Record kinds.
+INSTRUCTION, DATA, WAIT, SELECT = 0, 1, 2, 3
+
+
+def load(source) -> tuple:
+    """
+    Parses a trace.
+
+    :param source: The trace file name, or its contents.
+    :raises ValueError: If the trace is not a version 1 or 2 trace, or is truncated.
+    :return: A dict of the header fields, and the list of (kind, value, delta_us) records, oldest first.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as stream:
+            source = stream.read()
+
+    size: int = struct.calcsize(HEADER)
+    if len(source) < size:
+        raise ValueError("Invalid trace! The header is truncated.")
+
+    magic, version, row, col, controllers, count, dropped = struct.unpack_from(HEADER, source)
+    if magic != MAGIC or version not in (1, 2):
+        raise ValueError("Invalid trace! Not a version 1 or 2 LiquidCrystal trace.")
+
+    if version == 1:
+        controllers = 1  # Reserved byte, and no controller selection recorded.
+
+    if len(source) < size + RECORD_SIZE * count:
+        raise ValueError(f"Invalid trace! Expected {count} records.")
+
+    records: list = [
+        (source[offset], source[offset + 1], source[offset + 2] | (source[offset + 3] << 8))
+        for offset in range(size, size + RECORD_SIZE * count, RECORD_SIZE)
+    ]
+    return {"row": row, "col": col, "controllers": controllers, "records": count, "dropped": dropped}, records
+
+
+def _state(lcd: HD44780) -> tuple:
+    """
+    Returns everything an instruction can change in the controller.
+
+    :param lcd: The simulated controller.
+    :return: The state.
+    """
+    return (
+        bytes(lcd.ddram),
+        bytes(lcd.cgram),
+        lcd.ac,
+        lcd.cgram_selected,
+        lcd.increment,
+        lcd.shift,
+        lcd.display,
+        lcd.cursor,
+        lcd.blink,
+        lcd.two_line,
+        lcd.font5x10,
+        lcd.offset,
+    )
+
+
+def _screen(controllers: tuple) -> tuple:
+    """
+    Returns what the glass shows: the character codes of the cells, and the glyphs of the custom characters, of
+    each controller.
+
+    :param controllers: The simulated controllers.
+    :return: The screen, None for a controller whose display is off.
+    """
+    return tuple(_cells(lcd) for lcd in controllers)
+
+
+def _cells(lcd: HD44780) -> tuple:
+    """
+    Returns what a controller shows: the character codes of its cells, and the glyphs of the custom characters.
+
+    :param lcd: The simulated controller.
+    :return: The cells, None while the display is off.
+    """
+    if not lcd.display:
+        return None
+
+    codes: bytes = bytes(lcd.ddram[lcd.address(row, col)] for row in range(lcd.row) for col in range(lcd.col))
+    glyphs: tuple = tuple(bytes(lcd.cgram[8 * (code & 0x07) : 8 * (code & 0x07) + 8]) for code in codes if code < 0x10)
+    return codes, glyphs
+
+
+def _lines(controllers: tuple) -> list:
+    """
+    Returns the characters shown on the glass, one string per row, with blank rows for a controller whose
+    display is off.
+
+    :param controllers: The simulated controllers.
+    :return: The rows, none while every display is off.
+    """
+    if not any(lcd.display for lcd in controllers):
+        return []
+
+    return [line for lcd in controllers for line in (lcd.lines() if lcd.display else [" " * lcd.col] * lcd.row)]
+
+
+def replay(source, settle_us: int = 20_000) -> dict:
+    """
+    Replays a trace against a simulated controller, or the two controllers of a 40x4 trace. The modeled clock is
+    reset.
+
+    The controllers start on, in 4-bit mode with the number of lines of the trace, and with a blank DDRAM: the
+    screens are exact from the first clear display of the trace on. The records of a 40x4 trace are executed by
+    the controller last selected, the first one until a selection is recorded.
+
+    Records are stamped when the driver hands them to its backend, so the bytes of a combined transfer share one
+    time: each one is executed at its recorded time, or once the controller is ready if later.
+
+    A screen counts as shown if it stays at least settle_us, so the intermediate states of an update, a character
+    at a time, are not counted as visible changes.
+
+    :param source: The trace file name, or its contents.
+    :param settle_us: Shortest time a screen must stay to be seen, in microseconds (default is 20000).
+    :return: A dict of statistics, with 'screens', the list of (time_us, lines) of every screen shown.
+    """
+    header, records = load(source)
+
+    clock.reset()
+    if header["controllers"] > 1:
+        controllers: tuple = HD44780Pair(header["col"]).controllers
+    else:
+        controllers = (HD44780(header["row"], header["col"]),)
+
+    for lcd in controllers:
+        lcd.eight_bit = False
+        lcd.two_line = lcd.row >= 2
+        lcd.display = True
+
+    lcd = controllers[0]
+    stats: dict = {
+        "records": len(records),
+        "dropped": header["dropped"],
+        "duration_us": 0,
+        "instructions": 0,
+        "data_bytes": 0,
+        "redundant_instructions": 0,
+        "unchanged_writes": 0,
+        "selects": 0,
+        "waits": 0,
+        "wait_us": 0,
+        "wasted_wait_us": 0,
+        "visible_changes": 0,
+        "bytes_per_visible_change": 0.0,
+    }
+    screens: list = []
+    shown: tuple = _screen(controllers)  # Last screen seen.
+    screen: tuple = shown  # Current screen, seen once it stays settle_us.
+    since: int = 0  # Time of the last change of the current screen.
+    now: int = 0
+
+    for kind, value, delta in records:
+        now += delta
+        if screen != shown and now - since >= settle_us:
+            shown = screen
+            screens.append((since, _lines(controllers)))
+
+        if kind == SELECT:
+            lcd = controllers[value]
+            stats["selects"] += 1
+            continue
+
+        if kind == WAIT:
+            requested: int = 16 * value
+            busy_until: int = int(max(controller.busy_until for controller in controllers))
+            stats["waits"] += 1
+            stats["wait_us"] += requested
+            stats["wasted_wait_us"] += max(requested - max(busy_until - now, 0), 0)
+            continue
+
+        clock.seek(max(now, lcd.busy_until))
+        if kind == INSTRUCTION:
+            before: tuple = _state(lcd)
+            lcd.execute(False, value)
+            stats["instructions"] += 1
+            if _state(lcd) == before:
+                stats["redundant_instructions"] += 1
+        else:
+            ram: bytearray = lcd.cgram if lcd.cgram_selected else lcd.ddram
+            if ram[lcd.ac] == value:
+                stats["unchanged_writes"] += 1
+            lcd.execute(True, value)
+            stats["data_bytes"] += 1
+
+        current: tuple = _screen(controllers)
+        if current != screen:
+            screen = current
+            since = now
+
+    if screen != shown:
+        screens.append((since, _lines(controllers)))
+
+    stats["duration_us"] = now
+    stats["visible_changes"] = len(screens)
+    if screens:
+        stats["bytes_per_visible_change"] = (stats["instructions"] + stats["data_bytes"]) / len(screens)
+
+    stats["screens"] = screens
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replays a LiquidCrystal trace and reports statistics.")
+    parser.add_argument("trace", help="trace file written by TraceRecorder.dump()")
+    parser.add_argument("--screens", action="store_true", help="print every screen shown, not only the last one")
+    parser.add_argument("--settle", type=int, default=20_000, help="shortest time a screen is seen, in microseconds")
+    args = parser.parse_args()
+
+    stats: dict = replay(args.trace, args.settle)
+    screens: list = stats.pop("screens")
+
+    for name, value in stats.items():
+        print(f"{name:<26}{value:>12.1f}" if isinstance(value, float) else f"{name:<26}{value:>12}")
+
+    for time_us, lines in screens if args.screens else screens[-1:]:
+        print(f"\n@ {time_us} us")
+        for line in lines:
+            print(f"|{line}|")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# THE END
@@ -0,0 +1,37 @@
+# Host stand-in for the MicroPython 'utime' module, running on the modeled clock.
+from . import clock
+
+
+def sleep(seconds: float) -> None:
+    clock.advance(seconds * 1_000_000)
+
+
+def sleep_ms(ms: int) -> None:
+    clock.advance(ms * 1_000)
+
+
+def sleep_us(us: int) -> None:
+    clock.advance(us)
+
+
+def ticks_us() -> int:
+    return int(clock.now())
+
+
+def ticks_ms() -> int:
+    return int(clock.now() // 1_000)
+
+
+def ticks_cpu() -> int:
+    return int(clock.now())
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    return ticks + delta
+
+
+def ticks_diff(ticks1: int, ticks2: int) -> int:
+    return ticks1 - ticks2
+
+
+# THE END
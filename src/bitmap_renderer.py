@@ -0,0 +1,206 @@
+from micropython import const
+
+from .liquid_crystal_api import HD44780API
+
+# Character codes of the blank and full 5x8 cells in the character ROM.
+_BLANK = const(0x20)
+_FULL = const(0xFF)
+
+
+class BitmapRenderer:
+    # Rows of the blank and full tiles.
+    __BLANK_TILE: bytes = bytes(8)
+    __FULL_TILE: bytes = b"\x1f" * 8
+
+    def __init__(
+        self,
+        lcd: HD44780API,
+        row: int = 0,
+        col: int = 0,
+        cols: int = 4,
+        rows: int = 2,
+        first_slot: int = 0,
+    ) -> None:
+        """
+        Initialize a renderer of monochrome bitmaps onto a block of character cells, through CGRAM.
+
+        The bitmap covers cols x rows cells, 5 x 8 pixels each, without gaps: 20 x 16 pixels for the default 4 x 2
+        block. It is packed one bit per pixel, row after row, the leftmost pixel in the most significant bit, each
+        row starting on a new byte: the MONO_HLSB layout of framebuf.
+
+        render() slices the bitmap into 5 x 8 tiles. Blank and full tiles are shown with the space and full block
+        characters of the character ROM, identical tiles share one CGRAM slot, and a tile already held by a slot
+        stays there. Only the slots whose glyph changed are uploaded, and the rows of the block whose characters
+        changed are written, all in one combined transfer.
+
+        :param lcd: The LCD to be driven, with the 5x8 font.
+        :param row: The row of the top left cell of the block (default is 0).
+        :param col: The column of the top left cell of the block (default is 0).
+        :param cols: Width of the block, in cells (default is 4).
+        :param rows: Height of the block, in cells (default is 2).
+        :param first_slot: First CGRAM slot used, the renderer owns it and the following ones, e.g. to leave the
+            slots below to a GlyphCache (default is 0).
+        :raises ValueError: If first_slot is not in the range of 0 to 7.
+        :raises IndexError: If the block does not fit on the LCD.
+        """
+        if not 0 <= first_slot <= 7:
+            raise ValueError("Invalid first_slot! 'first_slot' must be in the range of 0 to 7.")
+
+        if not (0 <= row < lcd._row and 0 < rows <= lcd._row - row):
+            raise IndexError(f"Invalid rows! The block must fit in the {lcd._row} rows of the LCD.")
+
+        if not (0 <= col < lcd._col and 0 < cols <= lcd._col - col):
+            raise IndexError(f"Invalid cols! The block must fit in the {lcd._col} columns of the LCD.")
+
+        self.__lcd: HD44780API = lcd
+        self.__row: int = row
+        self.__col: int = col
+        self.__cols: int = cols
+        self.__rows: int = rows
+        self.__first_slot: int = first_slot
+
+        self.width: int = 5 * cols
+        self.height: int = 8 * rows
+        self.__stride: int = (self.width + 7) // 8  # Bytes per pixel row.
+        self.buffer: bytearray = bytearray(self.__stride * self.height)
+
+        self.__slots: list = [None] * (8 - first_slot)  # Tile held by each slot, None if unknown.
+        self.__pending: bytearray = bytearray(cols * rows)  # Character code of each cell.
+        self.__shown: bytearray = bytearray(cols * rows)  # Character code held by the DDRAM for each cell.
+        self.__stale: bool = True  # The DDRAM contents are unknown, so the next render() writes every cell.
+        self.__runs: list = []  # Runs of the frame being written, reused by every render().
+        self.__uploads: int = 0
+
+    def uploads(self) -> int:
+        """
+        Returns the number of glyphs uploaded to CGRAM so far.
+
+        :return: Number of uploads.
+        """
+        return self.__uploads
+
+    def frame_buffer(self):
+        """
+        Returns a framebuf.FrameBuffer drawing into the bitmap, for its line, rect, text and other methods.
+
+        :return: The FrameBuffer, in the MONO_HLSB format.
+        """
+        import framebuf  # Only loaded if drawn through framebuf.
+
+        return framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_HLSB)
+
+    def invalidate(self) -> None:
+        """
+        Forgets the CGRAM and DDRAM contents, e.g. after other code used the slots or the cells, so the next
+        render() uploads every glyph and writes every cell.
+
+        :return: None
+        """
+        for slot in range(len(self.__slots)):
+            self.__slots[slot] = None
+
+        self.__stale = True
+
+    def __tile(self, bitmap, cell_row: int, cell_col: int) -> bytes:
+        """
+        Extracts the 5 x 8 tile of a cell from the bitmap.
+
+        :param bitmap: The packed bitmap.
+        :param cell_row: Row of the cell in the block.
+        :param cell_col: Column of the cell in the block.
+        :return: The 8 rows of the tile, 5 bits each.
+        """
+        stride: int = self.__stride
+        bit: int = 5 * cell_col
+        first: int = bit >> 3
+        shift: int = 11 - (bit & 0x07)  # Right shift of the 5 bits out of a 16-bit window.
+        has_next: bool = first + 1 < stride
+
+        tile: bytearray = bytearray(8)
+        index: int = 8 * cell_row * stride + first
+        for line in range(8):
+            window: int = (bitmap[index] << 8) | (bitmap[index + 1] if has_next else 0)
+            tile[line] = (window >> shift) & 0x1F
+            index += stride
+
+        return bytes(tile)
+
+    def render(self, bitmap=None) -> int:
+        """
+        Shows a bitmap on the block of cells.
+
+        :param bitmap: The packed bitmap, of at least width x height pixels; the buffer, also drawn into by the
+            frame_buffer(), if None (default is None).
+        :raises ValueError: If the bitmap is too short.
+        :raises RuntimeError: If the bitmap has more distinct tiles, blank and full ones aside, than CGRAM slots.
+        :return: Number of glyphs uploaded.
+        """
+        if bitmap is None:
+            bitmap = self.buffer
+
+        if len(bitmap) < len(self.buffer):
+            raise ValueError(f"Invalid bitmap! Expected {len(self.buffer)} bytes, but received {len(bitmap)} bytes.")
+
+        slots: list = self.__slots
+        tiles: dict = {}  # Tile to slot, for the tiles of this frame.
+        new_tiles: list = []
+        cells: list = []
+
+        for cell_row in range(self.__rows):
+            for cell_col in range(self.__cols):
+                tile: bytes = self.__tile(bitmap, cell_row, cell_col)
+                cells.append(tile)
+
+                if tile == self.__BLANK_TILE or tile == self.__FULL_TILE or tile in tiles:
+                    continue
+
+                # A tile already resident stays in its slot.
+                tiles[tile] = slots.index(tile) if tile in slots else -1
+                if tiles[tile] < 0:
+                    new_tiles.append(tile)
+
+        if len(tiles) > len(slots):
+            raise RuntimeError(f"Out of CGRAM slots! {len(tiles)} distinct tiles for {len(slots)} slots.")
+
+        runs: list = self.__runs
+        runs.clear()
+
+        # New tiles go to the slots no tile of this frame holds.
+        taken: set = set(tiles.values())
+        free: list = [slot for slot in range(len(slots)) if slot not in taken]
+        for tile, slot in zip(new_tiles, free):
+            tiles[tile] = slot
+            slots[slot] = tile
+            runs.append((self.__lcd._glyph_address(self.__first_slot + slot), tile))
+
+        uploads: int = len(runs)
+        self.__uploads += uploads
+
+        pending: bytearray = self.__pending
+        for index, tile in enumerate(cells):
+            if tile == self.__BLANK_TILE:
+                pending[index] = _BLANK
+            elif tile == self.__FULL_TILE:
+                pending[index] = _FULL
+            else:
+                pending[index] = self.__first_slot + tiles[tile]
+
+        # Rows of the block whose characters changed. Cells keeping a slot whose glyph changed need no write.
+        view: memoryview = memoryview(pending)
+        shown: bytearray = self.__shown
+        cols: int = self.__cols
+        for cell_row in range(self.__rows):
+            start: int = cell_row * cols
+            if self.__stale or pending[start : start + cols] != shown[start : start + cols]:
+                addr: int = self.__lcd._address(self.__row + cell_row, self.__col)
+                runs.append((addr, view[start : start + cols]))
+                shown[start : start + cols] = pending[start : start + cols]
+
+        self.__stale = False
+        if runs:
+            self.__lcd._write_cells(runs)
+
+        return uploads
+
+
+# THE END
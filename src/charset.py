@@ -0,0 +1,201 @@
+from micropython import const
+
+from .glyph_cache import GlyphCache
+
+# Marks a character code with no ROM glyph in the translation table. Code 0x00 only translates to itself.
+_MISSING = const(0x00)
+
+# Closest ASCII letter of the Latin-1 characters 0xC0 to 0xFF, for ROMs without accented letters.
+_LATIN1_BASE: str = "AAAAAAACEEEEIIIIDNOOOOOxOUUUUYPsaaaaaaaceeeeiiiidnooooo/ouuuuypy"
+
+# ROM code A00 (Japanese): Latin-1 and other characters with a glyph, by code point.
+_A00_GLYPHS: dict = {
+    0xA0: 0x20,  # No-break space.
+    0xA2: 0xEC,  # ¢
+    0xA5: 0x5C,  # ¥
+    0xB0: 0xDF,  # °
+    0xB5: 0xE4,  # µ
+    0xB7: 0xA5,  # ·
+    0xDF: 0xE2,  # ß, shown as β.
+    0xE4: 0xE1,  # ä
+    0xF1: 0xEE,  # ñ
+    0xF6: 0xEF,  # ö
+    0xF7: 0xFD,  # ÷
+    0xFC: 0xF5,  # ü
+    0x03A3: 0xF6,  # Σ
+    0x03A9: 0xF4,  # Ω
+    0x03B1: 0xE0,  # α
+    0x03B2: 0xE2,  # β
+    0x03B5: 0xE3,  # ε
+    0x03B8: 0xF2,  # θ
+    0x03BC: 0xE4,  # μ
+    0x03C0: 0xF7,  # π
+    0x03C1: 0xE6,  # ρ
+    0x03C3: 0xE5,  # σ
+    0x2190: 0x7F,  # ←
+    0x2192: 0x7E,  # →
+    0x221A: 0xE8,  # √
+    0x221E: 0xF3,  # ∞
+    0x2588: 0xFF,  # █
+}
+
+
+class Charset:
+    # Character ROM codes.
+    A00, A02 = ("A00", "A02")
+
+    def __init__(self, rom: str = A00, fallback: str = "?", glyphs: GlyphCache = None) -> None:
+        """
+        Initialize a translation of text to the character codes of an HD44780 character ROM.
+
+        The translation is compiled once into a 256-entry table for code points up to 0xFF, and a dict for the
+        others. A00, the Japanese ROM, has ASCII apart from the backslash and the tilde, half-width katakana, and
+        a few Latin-1, Greek and math characters; accented letters it lacks are shown as their base letter.
+        A02, the European ROM, has ASCII and, from 0xA0 to 0xFF, the Latin-1 characters. Codes 0x00 to 0x1F are
+        kept as-is, so chr(0) to chr(7) still print the custom characters.
+
+        Characters without a glyph are shown as the fallback, unless a GlyphCache glyph substitutes them.
+        ASCII text the ROM shows as-is is encoded without a lookup per character.
+
+        :param rom: The character ROM of the LCD, A00 or A02 (default is A00).
+        :param fallback: Character shown for characters without a glyph (default is '?').
+        :param glyphs: GlyphCache holding the glyphs registered by substitute() (default is None).
+        :raises ValueError: If rom is invalid, or the fallback has no glyph.
+        """
+        if rom not in (self.A00, self.A02):
+            raise ValueError("Invalid rom! 'rom' must be 'A00' or 'A02'.")
+
+        self.__glyphs: GlyphCache = glyphs
+        self.__substitutes: dict = {}  # Code point to glyph name.
+        self.__sparse: dict = {}  # Code point above 0xFF to character code.
+
+        table: bytearray = bytearray(256)  # Code point to character code, _MISSING if none.
+        for code in range(0x80):
+            table[code] = code
+
+        if rom == self.A00:
+            table[0x5C] = table[0x7E] = table[0x7F] = _MISSING  # ¥, → and ← in this ROM.
+            for code, base in enumerate(_LATIN1_BASE, 0xC0):
+                table[code] = ord(base)
+
+            for code, char_code in _A00_GLYPHS.items():
+                if code < 0x100:
+                    table[code] = char_code
+                else:
+                    self.__sparse[code] = char_code
+
+            for code in range(0xFF61, 0xFFA0):  # Half-width katakana and punctuation.
+                self.__sparse[code] = code - 0xFF61 + 0xA1
+        else:
+            for code in range(0xA0, 0x100):
+                table[code] = code
+
+        self.__table: bytearray = table
+
+        # ASCII character codes that are not shown as-is: ASCII text holding none of them is encoded directly.
+        self.__ascii_changes: bytes = bytes(code for code in range(1, 0x80) if table[code] != code)
+
+        self.__fallback: int = self.__lookup(ord(fallback))
+        if self.__fallback < 0:
+            raise ValueError("Invalid fallback! The fallback character must have a glyph in the ROM.")
+
+    def map(self, char: str, code: int) -> None:
+        """
+        Translates a character to the given character code, e.g. a glyph the tables miss.
+
+        :param char: The character.
+        :param code: The character code, 0x01 to 0xFF (custom character 0 is printed with chr(0)).
+        :raises ValueError: If the code is out of range.
+        :return: None
+        """
+        if not 0x01 <= code <= 0xFF:
+            raise ValueError("Invalid code! 'code' must be in the range of 0x01 to 0xFF.")
+
+        point: int = ord(char)
+        self.__substitutes.pop(point, None)
+        if point < 0x100:
+            self.__table[point] = code
+            self.__ascii_changes = bytes(c for c in range(1, 0x80) if self.__table[c] != c)
+        else:
+            self.__sparse[point] = code
+
+    def substitute(self, char: str, name: str) -> None:
+        """
+        Shows a character without a glyph in the ROM with a glyph of the GlyphCache, loaded into CGRAM on use.
+        The glyph also replaces the base letter A00 shows for an accented letter.
+
+        Loading a glyph moves the address counter to CGRAM: print() sets the cursor back, other callers must
+        translate the text before setting the cursor, as DisplayBuffer.write_at() does.
+
+        :param char: The character.
+        :param name: Name of the glyph registered in the GlyphCache.
+        :raises ValueError: If the Charset has no GlyphCache.
+        :return: None
+        """
+        if self.__glyphs is None:
+            raise ValueError("Invalid substitute! Glyphs are loaded through a GlyphCache; pass one to Charset().")
+
+        point: int = ord(char)
+        self.__substitutes[point] = name
+
+        # Only characters missing from the tables are looked up in the substitutes.
+        if point < 0x100:
+            self.__table[point] = _MISSING
+            self.__ascii_changes = bytes(c for c in range(1, 0x80) if self.__table[c] != c)
+        else:
+            self.__sparse.pop(point, None)
+
+    def uploads(self) -> int:
+        """
+        Returns the number of glyphs uploaded to CGRAM by the GlyphCache so far.
+
+        :return: Number of uploads, 0 without a GlyphCache.
+        """
+        return 0 if self.__glyphs is None else self.__glyphs.uploads()
+
+    def __lookup(self, point: int) -> int:
+        """
+        Translate a code point through the table or the dict.
+
+        :param point: The code point.
+        :return: The character code, -1 if the ROM has no glyph.
+        """
+        if point < 0x100:
+            code: int = self.__table[point]
+            return code if code != _MISSING or point == 0 else -1
+
+        return self.__sparse.get(point, -1)
+
+    def encode(self, text: str) -> bytes | bytearray:
+        """
+        Translates text to character codes.
+
+        :param text: The text.
+        :return: The character codes, one per character.
+        """
+        payload: bytes = text.encode()
+
+        # ASCII text: one C-level scan per ASCII character shown differently, none for A02.
+        if len(payload) == len(text):
+            for code in self.__ascii_changes:
+                if code in payload:
+                    break
+            else:
+                return payload
+
+        codes: bytearray = bytearray(len(text))
+        table: bytearray = self.__table
+        for index, char in enumerate(text):
+            point: int = ord(char)
+            code: int = table[point] if point < 0x100 else self.__sparse.get(point, _MISSING)
+
+            if code == _MISSING and point != 0:
+                name: str = self.__substitutes.get(point)
+                code = self.__fallback if name is None else self.__glyphs.load(name)
+
+            codes[index] = code
+
+        return codes
+
+
+# THE END
@@ -0,0 +1,179 @@
+from .liquid_crystal_api import HD44780API
+
+
+class DisplayBuffer:
+    def __init__(self, lcd: HD44780API) -> None:
+        """
+        Initialize a shadow framebuffer of the LCD character cells.
+
+        Writes only update the buffer; flush() sends the cells that differ from what the DDRAM currently
+        holds. The display is assumed to be blank, as it is right after initialization or clear_display().
+
+        :param lcd: The LCD to be driven.
+        """
+        self.__lcd: HD44780API = lcd
+        self.__row: int = lcd._row
+        self.__col: int = lcd._col
+
+        # Character codes to be shown, and character codes currently held by the DDRAM.
+        self.__pending: bytearray = bytearray(b" " * (self.__row * self.__col))
+        self.__shown: bytearray = bytearray(self.__pending)
+        self.__view: memoryview = memoryview(self.__pending)
+
+    def __contains__(self, char: int) -> bool:
+        """
+        Checks whether a character code is shown, or about to be shown by the next flush().
+
+        :param char: The character code.
+        :return: True if any cell holds the character code.
+        """
+        return char in self.__pending or char in self.__shown
+
+    def write_at(self, row: int, col: int, data: any) -> None:
+        """
+        Writes the given data into the buffer at the specified row and column.
+
+        Data that does not fit on the row is clipped.
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :param data: The data to be written (int, float, str, bytes, bytearray or memoryview).
+        :raises IndexError: If invalid, row or column values are provided.
+        :return: None
+        """
+        if not (0 <= row < self.__row):
+            raise IndexError(f"Invalid row! 'row' must be in the range 0 to {self.__row - 1}.")
+
+        if not (0 <= col < self.__col):
+            raise IndexError(f"Invalid column! 'col' must be in the range 0 to {self.__col - 1}.")
+
+        payload = self.__lcd._encode_text(data)
+        start: int = row * self.__col + col
+        length: int = min(len(payload), self.__col - col)
+        self.__pending[start : start + length] = payload[:length]
+
+    def fill(self, char: int = 0x20) -> None:
+        """
+        Fills the whole buffer with the given character code.
+
+        :param char: The character code (default is space).
+        :return: None
+        """
+        pending: bytearray = self.__pending
+        for index in range(len(pending)):
+            pending[index] = char
+
+    def invalidate(self) -> None:
+        """
+        Forgets the DDRAM contents, so that the next flush() redraws every cell.
+
+        :return: None
+        """
+        shown: bytearray = self.__shown
+        for index in range(len(shown)):
+            shown[index] = self.__pending[index] ^ 0xFF
+
+    def mark_cleared(self) -> None:
+        """
+        Records that the DDRAM has been cleared, e.g. by clear_display(), keeping the buffered cells.
+
+        :return: None
+        """
+        shown: bytearray = self.__shown
+        for index in range(len(shown)):
+            shown[index] = 0x20
+
+    def __find_run(self, index: int, end_of_row: int) -> tuple:
+        """
+        Finds the next run of changed cells of a row, starting at index.
+
+        A run is extended over a single unchanged cell, which costs the same as a separate set_cursor.
+
+        :param index: Buffer index to start scanning from.
+        :param end_of_row: Buffer index following the last cell of the row.
+        :return: Buffer indexes of the first cell of the run and following its last cell, both end_of_row if
+            the rest of the row is unchanged.
+        """
+        pending: bytearray = self.__pending
+        shown: bytearray = self.__shown
+
+        while index < end_of_row and pending[index] == shown[index]:
+            index += 1
+
+        if index == end_of_row:
+            return end_of_row, end_of_row
+
+        # Extend the run until two consecutive cells are unchanged.
+        start: int = index
+        end: int = index + 1
+        index += 1
+        while index < end_of_row:
+            if pending[index] != shown[index]:
+                end = index + 1
+            elif index - end >= 1:
+                break
+            index += 1
+
+        return start, end
+
+    def __send_run(self, row: int, start: int, end: int) -> None:
+        """
+        Sends a run of cells with one set_cursor and one contiguous write.
+
+        :param row: The row number (0-indexed).
+        :param start: Buffer index of the first cell of the run.
+        :param end: Buffer index following the last cell of the run.
+        :return: None
+        """
+        self.__lcd.set_cursor(row, start - row * self.__col)
+        self.__lcd.print(self.__view[start:end])
+        self.__shown[start:end] = self.__pending[start:end]
+
+    def flush_row(self, row: int) -> int:
+        """
+        Sends the changed cells of one row to the LCD, one set_cursor and one contiguous write per run.
+
+        :param row: The row number (0-indexed).
+        :return: Number of character cells written.
+        """
+        end_of_row: int = (row + 1) * self.__col
+        index: int = row * self.__col
+        written: int = 0
+
+        while index < end_of_row:
+            start, index = self.__find_run(index, end_of_row)
+            if start < index:
+                self.__send_run(row, start, index)
+                written += index - start
+
+        return written
+
+    def flush_run(self) -> int:
+        """
+        Sends the first run of changed cells to the LCD.
+
+        :return: Number of character cells written, 0 if the LCD is up to date.
+        """
+        for row in range(self.__row):
+            end_of_row: int = (row + 1) * self.__col
+            start, end = self.__find_run(row * self.__col, end_of_row)
+            if start < end:
+                self.__send_run(row, start, end)
+                return end - start
+
+        return 0
+
+    def flush(self) -> int:
+        """
+        Sends the changed cells of every row to the LCD.
+
+        :return: Number of character cells written.
+        """
+        written: int = 0
+        for row in range(self.__row):
+            written += self.flush_row(row)
+
+        return written
+
+
+# THE END
@@ -0,0 +1,175 @@
+import utime
+from machine import I2C
+
+from .display_buffer import DisplayBuffer
+from .liquid_crystal_i2c import LiquidCrystal_I2C
+
+
+class DisplayGroup:
+    def __init__(self, port: I2C, addrs: tuple | list, row: int = 2, col: int = 16, **kwargs) -> None:
+        """
+        Initialize a group of I2C LCDs sharing one bus.
+
+        Each LCD gets a DisplayBuffer. flush() sends the changed runs of all the LCDs in round-robin order,
+        and clear_display() and return_home() send the instruction to every LCD before waiting once, so that
+        the execution time of one controller is spent on the transfers to the others.
+
+        :param port: I2C port shared by the LCDs.
+        :param addrs: I2C addresses of the LCDs, e.g. 0x20 to 0x27.
+        :param row: Number of rows on the LCDs (default is 2).
+        :param col: Number of columns on the LCDs (default is 16).
+        :param kwargs: Other arguments passed to every LiquidCrystal_I2C.
+        :raises ValueError: If addrs is empty or holds the same address twice.
+        """
+        if not addrs:
+            raise ValueError("Invalid addrs! At least one I2C address is required.")
+
+        if len(set(addrs)) != len(addrs):
+            raise ValueError("Invalid addrs! I2C addresses must be unique.")
+
+        self.__addrs: tuple = tuple(addrs)
+        self.__lcds: tuple = tuple(LiquidCrystal_I2C(port, addr, row, col, **kwargs) for addr in addrs)
+        self.__buffers: tuple = tuple(DisplayBuffer(lcd) for lcd in self.__lcds)
+
+        # Per-LCD runs, cells written and microseconds spent on the bus.
+        self.__runs: list = [0] * len(addrs)
+        self.__cells: list = [0] * len(addrs)
+        self.__bus_us: list = [0] * len(addrs)
+        self.__start: int = utime.ticks_us()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of LCDs in the group.
+
+        :return: Number of LCDs.
+        """
+        return len(self.__lcds)
+
+    def display(self, index: int) -> LiquidCrystal_I2C:
+        """
+        Returns the LCD at the given index, for direct access.
+
+        :param index: Index of the LCD in addrs.
+        :return: The LCD.
+        """
+        return self.__lcds[index]
+
+    def buffer(self, index: int) -> DisplayBuffer:
+        """
+        Returns the DisplayBuffer of the LCD at the given index.
+
+        :param index: Index of the LCD in addrs.
+        :return: The DisplayBuffer.
+        """
+        return self.__buffers[index]
+
+    def write_at(self, index: int, row: int, col: int, data: any) -> None:
+        """
+        Writes the given data into the buffer of an LCD at the specified row and column.
+
+        :param index: Index of the LCD in addrs.
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :param data: The data to be written (int, float, str, bytes, bytearray or memoryview).
+        :return: None
+        """
+        self.__buffers[index].write_at(row, col, data)
+
+    def flush(self) -> int:
+        """
+        Sends the changed cells of every LCD, one run per LCD in turn.
+
+        :return: Number of character cells written.
+        """
+        buffers: tuple = self.__buffers
+        active: list = list(range(len(buffers)))
+        written: int = 0
+
+        while active:
+            for index in tuple(active):
+                start: int = utime.ticks_us()
+                cells: int = buffers[index].flush_run()
+                if not cells:
+                    active.remove(index)
+                    continue
+
+                self.__bus_us[index] += utime.ticks_diff(utime.ticks_us(), start)
+                self.__runs[index] += 1
+                self.__cells[index] += cells
+                written += cells
+
+        return written
+
+    def __broadcast(self, clear: bool) -> None:
+        """
+        Send a CLEAR_DISPLAY or RETURN_HOME instruction to every LCD, with HD44780API._send_home() so each one
+        tracks its effects, then wait once for the slowest execution time.
+
+        :param clear: True for CLEAR_DISPLAY, False for RETURN_HOME.
+        :return: None
+        """
+        start: int = utime.ticks_us()
+        for index, lcd in enumerate(self.__lcds):
+            sent: int = utime.ticks_us()
+            lcd._send_home(clear)
+            self.__bus_us[index] += utime.ticks_diff(utime.ticks_us(), sent)
+
+        # Only the part of the execution time not already spent on the other transfers is left to wait.
+        remaining: int = 2000 - utime.ticks_diff(utime.ticks_us(), start)
+        if remaining > 0:
+            utime.sleep_us(remaining)
+
+    def clear_display(self) -> None:
+        """
+        Clears every LCD and its buffer.
+
+        :return: None
+        """
+        self.__broadcast(True)
+        for buffer in self.__buffers:
+            buffer.fill()
+            buffer.mark_cleared()
+
+    def return_home(self) -> None:
+        """
+        Sets the cursor of every LCD to the home position.
+
+        :return: None
+        """
+        self.__broadcast(False)
+
+    def stats(self) -> dict:
+        """
+        Returns the bus usage since initialization or the last reset_stats().
+
+        :return: A dict with 'elapsed_us', 'bus_us' and 'utilization' for the whole group, and 'displays',
+            a list of dicts with 'addr', 'runs', 'cells', 'bus_us' and 'utilization' for each LCD.
+        """
+        elapsed: int = max(utime.ticks_diff(utime.ticks_us(), self.__start), 1)
+        displays: list = [
+            {
+                "addr": self.__addrs[index],
+                "runs": self.__runs[index],
+                "cells": self.__cells[index],
+                "bus_us": self.__bus_us[index],
+                "utilization": self.__bus_us[index] / elapsed,
+            }
+            for index in range(len(self.__lcds))
+        ]
+        bus_us: int = sum(self.__bus_us)
+
+        return {"elapsed_us": elapsed, "bus_us": bus_us, "utilization": bus_us / elapsed, "displays": displays}
+
+    def reset_stats(self) -> None:
+        """
+        Resets the bus usage figures.
+
+        :return: None
+        """
+        for index in range(len(self.__lcds)):
+            self.__runs[index] = self.__cells[index] = self.__bus_us[index] = 0
+
+        self.__start = utime.ticks_us()
+
+
+# THE END
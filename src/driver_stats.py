@@ -0,0 +1,90 @@
+import utime
+
+
+class DriverStats:
+    def __init__(self, slow_us: int = 0, callback=None) -> None:
+        """
+        Initialize the instrumentation counters of an LCD driver.
+
+        :param slow_us: Duration from which a public call is reported to the callback, in microseconds.
+        :param callback: Called as callback(name, elapsed_us) for every slow public call (default is None).
+        """
+        self.slow_us: int = slow_us
+        self.callback = callback
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets every counter to 0.
+
+        :return: None
+        """
+        self.commands: int = 0  # Instruction bytes sent (RS: 0).
+        self.data_bytes: int = 0  # Data bytes sent (RS: 1).
+        self.status_reads: int = 0  # Busy flag reads.
+        self.skipped_writes: int = 0  # Register writes skipped, as the controller already held the value.
+        self.transactions: int = 0  # I2C transactions, or EN strobes for GPIO.
+        self.bytes_written: int = 0  # Bytes written to the bus.
+        self.enable_sleep_us: int = 0  # Time slept while EN is high.
+        self.wait_us: int = 0  # Time spent waiting for the controller, e.g. after clear_display.
+        self.transfer_us: int = 0  # Time spent in the backend writes, enable sleeps included.
+
+    def record(self, rs: bool, count: int, transactions: int, nbytes: int, start: int) -> None:
+        """
+        Accounts for a completed write.
+
+        :param rs: Register Select (True for data, False for instruction).
+        :param count: Number of instruction or data bytes.
+        :param transactions: Number of bus transactions.
+        :param nbytes: Number of bytes written to the bus.
+        :param start: Value of utime.ticks_us() when the write started.
+        :return: None
+        """
+        if rs:
+            self.data_bytes += count
+        else:
+            self.commands += count
+
+        self.transactions += transactions
+        self.bytes_written += nbytes
+        self.transfer_us += utime.ticks_diff(utime.ticks_us(), start)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the counters.
+
+        :return: A dict of the counter values.
+        """
+        return {
+            "commands": self.commands,
+            "data_bytes": self.data_bytes,
+            "status_reads": self.status_reads,
+            "skipped_writes": self.skipped_writes,
+            "transactions": self.transactions,
+            "bytes_written": self.bytes_written,
+            "enable_sleep_us": self.enable_sleep_us,
+            "wait_us": self.wait_us,
+            "transfer_us": self.transfer_us,
+        }
+
+    def timed(self, name: str, method):
+        """
+        Wraps a method to report its calls lasting at least slow_us to the callback.
+
+        :param name: Name reported to the callback.
+        :param method: The bound method.
+        :return: The wrapper.
+        """
+
+        def wrapper(*args, **kwargs):
+            start: int = utime.ticks_us()
+            result = method(*args, **kwargs)
+            elapsed: int = utime.ticks_diff(utime.ticks_us(), start)
+            if elapsed >= self.slow_us:
+                self.callback(name, elapsed)
+            return result
+
+        return wrapper
+
+
+# THE END
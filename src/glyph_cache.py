@@ -0,0 +1,124 @@
+from .display_buffer import DisplayBuffer
+from .liquid_crystal_api import HD44780API
+
+
+class GlyphCache:
+    def __init__(self, lcd: HD44780API, buffer: DisplayBuffer = None, slots: int = 8) -> None:
+        """
+        Initialize a registry of named custom characters, loaded into CGRAM on demand.
+
+        Any number of glyphs can be registered. A glyph is uploaded when it is first used, skipped if the same
+        bitmap is already resident, and otherwise replaces the least recently used glyph. If a DisplayBuffer
+        is given, glyphs it shows or is about to show are never replaced.
+
+        Uploading moves the address counter to CGRAM, so load glyphs before calling set_cursor and print.
+
+        :param lcd: The LCD to be driven.
+        :param buffer: DisplayBuffer of the LCD, to keep glyphs on screen resident (default is None).
+        :param slots: Number of CGRAM slots to use, from slot 0 (default is 8).
+        :raises ValueError: If slots is not in the range of 1 to 8.
+        """
+        if not 1 <= slots <= 8:
+            raise ValueError("Invalid slots! 'slots' must be in the range of 1 to 8.")
+
+        self.__lcd: HD44780API = lcd
+        self.__buffer: DisplayBuffer = buffer
+        self.__glyphs: dict = {}  # Name to bitmap.
+        self.__resident: dict = {}  # Bitmap to slot.
+        self.__slots: list = [None] * slots  # Bitmap held by each slot.
+        self.__last_used: list = [0] * slots  # Use counter value at the last use of each slot.
+        self.__uses: int = 0
+        self.__uploads: int = 0
+
+    def uploads(self) -> int:
+        """
+        Returns the number of glyphs uploaded to CGRAM so far.
+
+        :return: Number of uploads.
+        """
+        return self.__uploads
+
+    def register(self, name: str, bit_map: tuple | list) -> None:
+        """
+        Registers a glyph under the given name. Nothing is sent to the LCD.
+
+        :param name: Name of the glyph.
+        :param bit_map: The bit map representing the custom character.
+        :raises IndexError: If the bit map length is invalid.
+        :return: None
+        """
+        if not 0 <= len(bit_map) <= 8:
+            raise IndexError("Invalid bit_map length! It must be in the range of 0 to 8.")
+
+        self.__glyphs[name] = bytes(bit_map)
+
+    def __evict(self) -> int:
+        """
+        Pick the slot for a new glyph: a free slot, or the least recently used one not on screen.
+
+        :raises RuntimeError: If every slot holds a glyph on screen.
+        :return: The slot.
+        """
+        free: int = -1
+        for slot, bit_map in enumerate(self.__slots):
+            if bit_map is None:
+                return slot
+
+            if self.__buffer is not None and slot in self.__buffer:
+                continue
+
+            if free < 0 or self.__last_used[slot] < self.__last_used[free]:
+                free = slot
+
+        if free < 0:
+            raise RuntimeError("No free CGRAM slot! Every custom character is on screen.")
+
+        del self.__resident[self.__slots[free]]
+        return free
+
+    def load(self, name: str) -> int:
+        """
+        Makes the named glyph resident in CGRAM, uploading it if needed.
+
+        :param name: Name of the glyph.
+        :raises KeyError: If no glyph is registered under the name.
+        :return: The character code of the glyph.
+        """
+        bit_map: bytes = self.__glyphs[name]
+        slot: int = self.__resident.get(bit_map, -1)
+
+        if slot < 0:
+            slot = self.__evict()
+            self.__lcd.custom_character(slot, bit_map)
+            self.__slots[slot] = bit_map
+            self.__resident[bit_map] = slot
+            self.__uploads += 1
+
+        self.__uses += 1
+        self.__last_used[slot] = self.__uses
+        return slot
+
+    def char(self, name: str) -> str:
+        """
+        Makes the named glyph resident in CGRAM, and returns it as a string for print or write_at.
+
+        :param name: Name of the glyph.
+        :return: The glyph character.
+        """
+        return chr(self.load(name))
+
+    def print_at(self, row: int, col: int, name: str) -> None:
+        """
+        Prints the named glyph at the specified row and column.
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :param name: Name of the glyph.
+        :return: None
+        """
+        code: int = self.load(name)
+        self.__lcd.set_cursor(row, col)
+        self.__lcd.print(bytes((code,)))
+
+
+# THE END
@@ -1,36 +1,70 @@
 from micropython import const
 
-
 # LiquidCrystal instructions flags.
+#
+# MicroPython only inlines const() values within the module defining them, so liquid_crystal_api.py declares the
+# flags as private module constants, and the other modules go through HD44780API. These public ones are kept for
+# applications.
+CLEAR_DISPLAY = const(0x01)
+RETURN_HOME = const(0x02)
+
+ENTRY_MODE_SET = const(0x04)
+INCREMENT = const(0x02)
+SHIFT = const(0x01)
+
+DISPLAY_CONTROL = const(0x08)
+DISPLAY = const(0x04)
+CURSOR = const(0x02)
+BLINK = const(0x01)
+
+CRD_SHIFT = const(0x10)  # Cursor or display shift.
+CURSOR_MOVE = const(0x00)
+DISPLAY_SHIFT = const(0x08)
+SHIFT_RIGHT = const(0x04)
+SHIFT_LEFT = const(0x00)
+
+FUNCTION_SET = const(0x20)
+LEN_8BIT = const(0x10)
+LEN_4BIT = const(0x00)
+DISPLAY_1LINE = const(0x00)
+DISPLAY_2LINE = const(0x08)
+FONT5X8 = const(0x00)
+FONT5X10 = const(0x04)
+
+CGRAM_ADDR = const(0x40)
+DDRAM_ADDR = const(0x80)
+
+
+# The flags as class attributes, for compatibility.
 class Instruction:
-    CLEAR_DISPLAY: int = const(0x01)
-    RETURN_HOME: int = const(0x02)
-
-    ENTRY_MODE_SET: int = const(0x04)
-    INCREMENT: int = const(0x02)
-    SHIFT: int = const(0x01)
-
-    DISPLAY_CONTROL: int = const(0x08)
-    DISPLAY: int = const(0x04)
-    CURSOR: int = const(0x02)
-    BLINK: int = const(0x01)
-
-    CRD_SHIFT: int = const(0x10)  # Cursor or display shift.
-    CURSOR_MOVE: int = const(0x00)
-    DISPLAY_SHIFT: int = const(0x08)
-    SHIFT_RIGHT: int = const(0x04)
-    SHIFT_LEFT: int = const(0x00)
-
-    FUNCTION_SET: int = const(0x20)
-    LEN_8BIT: int = const(0x10)
-    LEN_4BIT: int = const(0x00)
-    DISPLAY_1LINE: int = const(0x00)
-    DISPLAY_2LINE: int = const(0x08)
-    FONT5X8: int = const(0x00)
-    FONT5X10: int = const(0x04)
-
-    CGRAM_ADDR: int = const(0x40)
-    DDRAM_ADDR: int = const(0x80)
+    CLEAR_DISPLAY: int = CLEAR_DISPLAY
+    RETURN_HOME: int = RETURN_HOME
+
+    ENTRY_MODE_SET: int = ENTRY_MODE_SET
+    INCREMENT: int = INCREMENT
+    SHIFT: int = SHIFT
+
+    DISPLAY_CONTROL: int = DISPLAY_CONTROL
+    DISPLAY: int = DISPLAY
+    CURSOR: int = CURSOR
+    BLINK: int = BLINK
+
+    CRD_SHIFT: int = CRD_SHIFT
+    CURSOR_MOVE: int = CURSOR_MOVE
+    DISPLAY_SHIFT: int = DISPLAY_SHIFT
+    SHIFT_RIGHT: int = SHIFT_RIGHT
+    SHIFT_LEFT: int = SHIFT_LEFT
+
+    FUNCTION_SET: int = FUNCTION_SET
+    LEN_8BIT: int = LEN_8BIT
+    LEN_4BIT: int = LEN_4BIT
+    DISPLAY_1LINE: int = DISPLAY_1LINE
+    DISPLAY_2LINE: int = DISPLAY_2LINE
+    FONT5X8: int = FONT5X8
+    FONT5X10: int = FONT5X10
+
+    CGRAM_ADDR: int = CGRAM_ADDR
+    DDRAM_ADDR: int = DDRAM_ADDR
 
 
 # THE END
@@ -0,0 +1,211 @@
+import math
+
+from .liquid_crystal_api import HD44780API
+
+
+class Layout:
+    # Field record indexes: set DDRAM address instruction, alignment, format spec, decimals (-1 unless fixed-point),
+    # 10 ** decimals, pending and shown character codes, and (instruction, pending) run.
+    __ADDR, __ALIGN, __FMT, __DECIMALS, __SCALE, __PENDING, __SHOWN, __RUN = range(8)
+
+    def __init__(self, lcd: HD44780API) -> None:
+        """
+        Initialize a screen layout of named fixed-width fields.
+
+        Fields are declared once with field(); update() then formats the new values into the preallocated
+        buffers of their fields, and sends every field whose text changed in one combined write: one I2C
+        transaction per screenful in packed mode, instead of a set_cursor and a print per value.
+
+        Integers, and numbers with a fixed-point format such as ".2f", are rendered digit by digit without
+        allocating strings, as format() would render them. Other values, and the floats within rounding error of
+        a tie between two roundings, go through format(), then the str to character code conversion.
+
+        :param lcd: The LCD to be driven.
+        """
+        self.__lcd: HD44780API = lcd
+        self.__fields: dict = {}
+        self.__runs: list = []  # Runs of the fields to be written, reused by every update().
+        self.__scratch: bytearray = bytearray(24)  # Digits of a number, rendered from the end.
+
+    def field(self, name: str, row: int, col: int, width: int, align: str = "<", fmt: str = "") -> None:
+        """
+        Declares a field, replacing any field of the same name. The field is drawn by its first update().
+
+        :param name: The field name, used as keyword of update().
+        :param row: The row number (0-indexed).
+        :param col: The column of the first cell of the field.
+        :param width: Number of cells of the field. Longer text is clipped.
+        :param align: '<' to align the text to the left, '>' to the right, '^' to center it (default is '<').
+        :param fmt: Format spec of the values, as for format(), e.g. 'd', '.1f' or 'x' (default is '').
+        :raises ValueError: If align is invalid, or the field overlaps another field.
+        :raises IndexError: If invalid, row, column or width values are provided.
+        :return: None
+        """
+        lcd: HD44780API = self.__lcd
+
+        if align not in ("<", ">", "^"):
+            raise ValueError("Invalid align! 'align' must be '<', '>' or '^'.")
+
+        if not (0 <= row < lcd._row):
+            raise IndexError(f"Invalid row! 'row' must be in the range 0 to {lcd._row - 1}.")
+
+        if not (0 <= col < lcd._col):
+            raise IndexError(f"Invalid column! 'col' must be in the range 0 to {lcd._col - 1}.")
+
+        if not (0 < width <= lcd._col - col):
+            raise IndexError(f"Invalid width! 'width' must be in the range 1 to {lcd._col - col}.")
+
+        addr: int = lcd._address(row, col)
+        for other, record in self.__fields.items():
+            other_addr: int = record[self.__ADDR]
+            if other != name and addr < other_addr + len(record[self.__PENDING]) and other_addr < addr + width:
+                raise ValueError(f"Invalid field! '{name}' overlaps the field '{other}'.")
+
+        # Fixed-point specs are rendered by __digits().
+        decimals: int = -1
+        if fmt in ("", "d"):
+            decimals = 0
+        elif len(fmt) > 2 and fmt[0] == "." and fmt[-1] == "f" and fmt[1:-1].isdigit() and int(fmt[1:-1]) < 10:
+            decimals = int(fmt[1:-1])
+
+        pending: bytearray = bytearray(b" " * width)
+        shown: bytearray = bytearray(b"\xff" * width)  # Unknown, so the first update() draws the field.
+        run: tuple = (addr, pending)
+        self.__fields[name] = [addr, align, fmt, decimals, 10 ** max(decimals, 0), pending, shown, run]
+
+    def invalidate(self) -> None:
+        """
+        Forgets what the fields show, e.g. after clear_display(), so the next update() redraws every field it is
+        given, even with unchanged values.
+
+        :return: None
+        """
+        for record in self.__fields.values():
+            shown: bytearray = record[self.__SHOWN]
+            for index in range(len(shown)):
+                shown[index] = record[self.__PENDING][index] ^ 0xFF
+
+    def __digits(self, number: int, decimals: int) -> int:
+        """
+        Renders an integer at the end of the scratch buffer, with a decimal point before its last decimals digits.
+
+        :param number: The integer, scaled by 10 ** decimals.
+        :param decimals: Number of digits after the decimal point.
+        :return: Index in the scratch buffer of the first character, or -1 if the number does not fit.
+        """
+        scratch: bytearray = self.__scratch
+        index: int = len(scratch)
+        negative: bool = number < 0
+        if negative:
+            number = -number
+
+        while True:
+            if index < 3:
+                return -1
+
+            index -= 1
+            scratch[index] = 0x30 + number % 10  # '0' to '9'.
+            number //= 10
+            decimals -= 1
+
+            if decimals == 0:
+                index -= 1
+                scratch[index] = 0x2E  # '.'
+            elif number == 0 and decimals < 0:
+                break
+
+        if negative:
+            index -= 1
+            scratch[index] = 0x2D  # '-'
+
+        return index
+
+    def __render(self, record: list, value: any) -> None:
+        """
+        Formats a value into the pending buffer of a field, aligned and padded with spaces.
+
+        :param record: The field record.
+        :param value: The value.
+        :return: None
+        """
+        decimals: int = record[self.__DECIMALS]
+        source = None
+        start: int = -1
+
+        if decimals == 0 and isinstance(value, int):
+            start = self.__digits(value, 0)
+        elif decimals > 0 and isinstance(value, int):
+            start = self.__digits(value * record[self.__SCALE], decimals)
+        elif decimals > 0 and isinstance(value, float):
+            try:
+                scaled: float = value * record[self.__SCALE]
+                negative: bool = math.copysign(1.0, value) < 0  # Also -0.0, which format() signs.
+                rounded: int = int(scaled - 0.5 if negative else scaled + 0.5)
+
+                # format() rounds the exact value half to even, so values within rounding error of a tie are left
+                # to it.
+                if abs(abs(scaled - rounded) - 0.5) > abs(scaled) * 1e-6:
+                    start = self.__digits(rounded, decimals)
+                    if negative and rounded == 0 and start > 0:
+                        start -= 1
+                        self.__scratch[start] = 0x2D  # '-'
+            except (OverflowError, ValueError):  # Infinity or NaN.
+                pass
+
+        if start >= 0:
+            source = self.__scratch
+        else:
+            start = 0
+            fmt: str = record[self.__FMT]
+            source = self.__lcd._encode_text(value if not fmt else format(value, fmt))
+
+        pending: bytearray = record[self.__PENDING]
+        width: int = len(pending)
+        length: int = min(len(source) - start, width)
+
+        align: str = record[self.__ALIGN]
+        if align == ">":
+            first: int = width - length
+        elif align == "^":
+            first = (width - length) // 2
+        else:
+            first = 0
+
+        for index in range(first):
+            pending[index] = 0x20
+        for index in range(length):
+            pending[first + index] = source[start + index]
+        for index in range(first + length, width):
+            pending[index] = 0x20
+
+    def update(self, **values) -> int:
+        """
+        Formats the given values into their fields, and writes the fields whose text changed to the LCD in one
+        combined transfer.
+
+        :param values: The values, by field name.
+        :raises KeyError: If a field is not declared.
+        :return: Number of fields written.
+        """
+        runs: list = self.__runs
+        runs.clear()
+
+        for name, value in values.items():
+            record: list = self.__fields.get(name)
+            if record is None:
+                raise KeyError(f"Invalid field! '{name}' is not declared.")
+
+            self.__render(record, value)
+            pending: bytearray = record[self.__PENDING]
+            shown: bytearray = record[self.__SHOWN]
+            if pending != shown:
+                shown[:] = pending
+                runs.append(record[self.__RUN])
+
+        if runs:
+            self.__lcd._write_cells(runs)
+
+        return len(runs)
+
+
+# THE END
@@ -1,8 +1,9 @@
+import sys
+
 import utime
 from machine import Pin
 from micropython import const
 
-from .instructions import Instruction
 from .liquid_crystal_api import HD44780API
 
 
@@ -10,31 +11,87 @@ class LiquidCrystal(HD44780API):
     # Pin mapping for RS, RW and EN
     __RS, __RW, __EN = const((0, 1, 2))
 
-    FONT5X8, FONT5X10 = const((Instruction.FONT5X8, Instruction.FONT5X10))
+    # RP2040 SIO registers of the GPIO output levels, and to toggle them.
+    __SIO_OUT, __SIO_OUT_XOR = const((0xD0000010, 0xD000001C))
+
+    # Pin levels for D0 to D3 (or D4 to D7) of each nibble value.
+    __LEVELS: tuple = tuple(tuple((value >> bit) & 0x01 for bit in range(4)) for value in range(16))
 
-    def __init__(self, gpio_list: tuple, row: int = 2, col: int = 16, font: int = FONT5X8) -> None:
+    def __init__(
+        self,
+        gpio_list: tuple,
+        row: int = 2,
+        col: int = 16,
+        font: int = HD44780API.FONT5X8,
+        busy_flag: bool = False,
+        fast_port: bool = False,
+        warm: bool = False,
+        en2: int = -1,
+    ) -> None:
         """
         Initializes an interface to control an HD44780-compatible LCD using a specified set of GPIO pins.
 
+        With busy_flag enabled, the busy flag (DB7) is read through RW before each write instead of
+        sleeping for the worst-case execution time. If the flag cannot be read back during initialization,
+        the timed delays are used.
+
+        With fast_port enabled on RP2040, and the data pins on consecutive GPIO numbers, all data lines are
+        written at once: one write to the SIO XOR register toggles the data lines that differ from the value, as
+        read back from the SIO output register. Otherwise, the pins are written one by one.
+
+        With warm enabled, the LCD is assumed to be powered and configured already, e.g. after a soft reset of
+        the board: the power-on wait, the cleared screen and the display control are skipped, and only the
+        interface is resynchronized before the function set and entry mode are written again.
+
+        A 40x4 LCD has two controllers, sharing RS, RW and the data lines: en2 is the EN pin of the second one,
+        which drives rows 2 and 3.
+
         :param gpio_list: List of GPIO pins for RS, RW, EN, and (D4 to D7) or (D0 to D7).
         :param row: Number of rows on the LCD (default is 2).
         :param col: Number of columns on the LCD (default is 16).
         :param font: Font size (default is 5x8).
-        :raises ValueError: If the length of gpio_list is not equal to 7 or 11.
+        :param busy_flag: Poll the busy flag instead of using timed delays (default is False).
+        :param fast_port: Write the data lines with one masked port register write (default is False).
+        :param warm: Attach to an already initialized LCD, keeping its contents (default is False).
+        :param en2: GPIO pin for the EN of the second controller of a 40x4 LCD, -1 if none (default is -1).
+        :raises ValueError: If the length of gpio_list is not equal to 7 or 11, or a 40x4 LCD has no en2.
         """
         super().__init__(row, col)
 
         if len(gpio_list) not in (7, 11):
             raise ValueError(f"Invalid GPIO list! Expected (7, 11) GPIO pins, but received {len(gpio_list)} pins.")
 
+        if self._controllers > 1 and en2 < 0:
+            raise ValueError("Invalid en2! A 40x4 LCD needs the EN pin of its second controller.")
+
         # predict mode base on len of gpio_list.
-        self.__data_len: int = Instruction.LEN_8BIT if len(gpio_list) >= 11 else Instruction.LEN_4BIT
+        self.__eight_bit: bool = len(gpio_list) >= 11
 
         # List of 'Pin' objects, row and font size.
         self.__gpio_list: list[Pin] = [Pin(pin, Pin.OUT) for pin in gpio_list]
-        self.__num_row = Instruction.DISPLAY_2LINE if row >= 2 else Instruction.DISPLAY_1LINE
+        self.__data_pins: tuple = tuple(self.__gpio_list[3:])
+        self.__setters: tuple = tuple(pin.value for pin in self.__data_pins)  # Bound 'Pin.value' methods.
+        self.__shifts: tuple = (0,) if self.__eight_bit else (4, 0)
+
+        # EN pin of each controller, and of the one selected.
+        self.__enables: tuple = (self.__gpio_list[self.__EN],) + ((Pin(en2, Pin.OUT),) if en2 >= 0 else ())
+        self.__enable: Pin = self.__enables[0]
+
+        # Masked port write, if the data pins are consecutive GPIOs of the RP2040 bank.
+        self.__port_shift: int = gpio_list[3]
+        self.__port_mask: int = 0
+        self.__mem32 = None
+        data_gpio: tuple = tuple(gpio_list[3:])
+        consecutive: bool = data_gpio == tuple(range(data_gpio[0], data_gpio[0] + len(data_gpio)))
+        if fast_port and consecutive and sys.platform == "rp2":
+            from machine import mem32
+
+            self.__mem32 = mem32
+            self.__port_mask = ((1 << len(data_gpio)) - 1) << self.__port_shift
+
         self.__font_size: int = font
-        self.__init_lcd()  # Initialize the LCD.
+        self.__busy_flag: bool = False  # Enabled by __init_lcd once the busy flag is known to be readable.
+        self.__init_lcd(busy_flag, warm)  # Initialize the LCD.
 
     def __toggle_enable(self) -> None:
         """
@@ -42,25 +99,106 @@ class LiquidCrystal(HD44780API):
 
         :return: None
         """
-        self.__gpio_list[self.__EN].value(True)
-        utime.sleep_us(40)
-        self.__gpio_list[self.__EN].value(False)
+        delay: int = 1 if self.__busy_flag else 40
+
+        self.__enable.value(True)
+        utime.sleep_us(delay)
+        self.__enable.value(False)
+
+        if self._stats is not None:
+            self._stats.enable_sleep_us += delay
+
+    def __read_status(self) -> int:
+        """
+        Reads the busy flag and address counter (RS: 0, RW: 1).
+
+        :return: The busy flag (bit 7) and the address counter (bits 0 to 6).
+        """
+        data_pins: tuple = self.__data_pins
+        enable: Pin = self.__enable
+        status: int = 0
+
+        for pin in data_pins:
+            pin.init(Pin.IN)
+
+        self.__gpio_list[self.__RS].value(False)
+        self.__gpio_list[self.__RW].value(True)  # RW: 1 (Read mode).
+
+        for shift in self.__shifts:
+            enable.value(True)
+            utime.sleep_us(1)  # Data is valid 360 ns after EN rises.
+            for bit, pin in enumerate(data_pins):
+                status |= pin.value() << (bit + shift)
+            enable.value(False)
+
+        self.__gpio_list[self.__RW].value(False)
+
+        for pin in data_pins:
+            pin.init(Pin.OUT)
+
+        if self._stats is not None:
+            self._stats.status_reads += 1
+
+        return status
+
+    def __wait_busy(self, timeout_us: int = 2000) -> None:
+        """
+        Waits until the busy flag is cleared.
+
+        If the flag is still set after timeout_us, it is assumed to be unreadable and the timed delays are
+        used from then on.
+
+        :param timeout_us: Longest time to wait, in microseconds.
+        :return: None
+        """
+        start: int = utime.ticks_us()
+        while self.__read_status() & 0x80:
+            if utime.ticks_diff(utime.ticks_us(), start) > timeout_us:
+                self.__busy_flag = False
+                break
 
-    def __gpio_write(self, write_data: int, mode: int = 8) -> None:
+        if self._stats is not None:
+            self._stats.wait_us += utime.ticks_diff(utime.ticks_us(), start)
+
+    def _wait_ready(self, delay_us: int) -> None:
         """
-        Writes data to the GPIO pins.
+        Waits until the controller has executed the previous instruction.
+
+        With the busy flag in use, the wait is deferred to the next write, which polls the flag first.
+
+        :param delay_us: Worst-case execution time of the previous instruction, in microseconds.
+        :return: None
+        """
+        if not self.__busy_flag:
+            utime.sleep_us(delay_us)
+
+            if self._stats is not None:
+                self._stats.wait_us += delay_us
+
+    def __gpio_write(self, write_data: int) -> None:
+        """
+        Writes data to the GPIO pins. In 4-bit mode, only the low nibble is written.
 
         :param write_data: Data to be written.
-        :param mode: Data mode (8 or 4 bits).
         :return: None
         """
-        for pin, bit in enumerate(range(mode)):
-            self.__gpio_list[3:][pin].value((write_data >> bit) & 0x01)
+        if self.__port_mask:
+            mem32 = self.__mem32
+            value: int = write_data << self.__port_shift
+            mem32[self.__SIO_OUT_XOR] = (mem32[self.__SIO_OUT] ^ value) & self.__port_mask
+        else:
+            setters: tuple = self.__setters
+            for index in range(0, len(setters), 4):
+                levels: tuple = self.__LEVELS[(write_data >> index) & 0x0F]
+                setters[index](levels[0])
+                setters[index + 1](levels[1])
+                setters[index + 2](levels[2])
+                setters[index + 3](levels[3])
 
         # Toggle to enable. To execute previously received data.
         self.__toggle_enable()
 
-    def __send_instructions(self, data: int, rs: bool = False) -> None:
+    def _send_instructions(self, data: int, rs: bool = False) -> None:
         """
         Sends instructions to the LCD.
 
@@ -68,19 +206,89 @@ class LiquidCrystal(HD44780API):
         :param rs: Register Select (True for data, False for instruction).
         :return: None
         """
+        stats = self._stats
+        if stats is not None:
+            start: int = utime.ticks_us()
+
+        if self.__busy_flag:
+            self.__wait_busy()
+
         self.__gpio_list[self.__RS].value(rs)  # Set RS
         self.__gpio_list[self.__RW].value(False)  # Set RW
 
         # Handle if 4-bit mode
-        if self.__data_len == Instruction.LEN_4BIT:
+        if not self.__eight_bit:
             msb_data: int = (data >> 4) & 0x0F
             lsb_data: int = data & 0x0F
 
-            self.__gpio_write(msb_data, 4)  # MSB
-            self.__gpio_write(lsb_data, 4)  # LSB
-            return
+            self.__gpio_write(msb_data)  # MSB
+            self.__gpio_write(lsb_data)  # LSB
+        else:
+            self.__gpio_write(data)  # Else Write 8-bit mode.
+
+        if stats is not None:
+            stats.record(rs, 1, len(self.__shifts), 1, start)
+
+    def _write_data(self, payload: bytes | bytearray | memoryview) -> None:
+        """
+        Writes a block of data bytes to the LCD.
+
+        RS and RW are set once for the whole payload, and the data lines are driven from a local loop
+        instead of dispatching through the per-byte instruction path.
+
+        :param payload: The data bytes to be written.
+        :return: None
+        """
+        stats = self._stats
+        if stats is not None:
+            start: int = utime.ticks_us()
+
+        self.__gpio_list[self.__RS].value(True)  # RS: 1 -> Sending data.
+        self.__gpio_list[self.__RW].value(False)  # Set RW
+
+        enable = self.__enable.value
+        setters: tuple = self.__setters
+        count: int = len(setters)
+        table: tuple = self.__LEVELS
+        mem32 = self.__mem32
+        port_mask: int = self.__port_mask
+        port_shift: int = self.__port_shift
 
-        self.__gpio_write(data)  # Else Write 8-bit mode.
+        for byte in payload:
+            if self.__busy_flag:
+                self.__wait_busy()
+                self.__gpio_list[self.__RS].value(True)  # Restore RS after the status read.
+
+            for shift in self.__shifts:
+                value: int = byte >> shift
+                if port_mask:
+                    mem32[self.__SIO_OUT_XOR] = (mem32[self.__SIO_OUT] ^ (value << port_shift)) & port_mask
+                else:
+                    for index in range(0, count, 4):
+                        levels: tuple = table[(value >> index) & 0x0F]
+                        setters[index](levels[0])
+                        setters[index + 1](levels[1])
+                        setters[index + 2](levels[2])
+                        setters[index + 3](levels[3])
+
+                # Toggle to enable. To execute previously received data.
+                enable(True)
+                utime.sleep_us(1 if self.__busy_flag else 40)
+                enable(False)
+
+        if stats is not None:
+            strobes: int = len(payload) * len(self.__shifts)
+            stats.enable_sleep_us += strobes * (1 if self.__busy_flag else 40)
+            stats.record(True, len(payload), strobes, len(payload), start)
+
+    def _select(self, controller: int) -> None:
+        """
+        Selects the controller receiving the next writes, by routing the enable strobes to its EN pin.
+
+        :param controller: Index of the controller.
+        :return: None
+        """
+        self.__enable = self.__enables[controller]
 
     @staticmethod
     def backlight(pin: int, status: bool) -> None:
@@ -97,29 +305,73 @@ class LiquidCrystal(HD44780API):
         backlight: Pin = Pin(pin, Pin.OUT)  # Backlight object
         backlight.value(status)
 
-    def __init_lcd(self) -> None:
+    def __resync(self) -> None:
+        """
+        Brings an already powered LCD back to the interface length of the wiring. In 4-bit mode, the next write
+        then starts on a high nibble.
+
+        Whether the LCD is in 8-bit mode, or in 4-bit mode waiting for either nibble, three 8-bit function sets
+        written once each leave it in 8-bit mode. The first one may complete a pending nibble, at worst as a
+        return home, so its wait covers that execution time.
+
+        :return: None
+        """
+        function_set: int = 0x30 if self.__eight_bit else 0x03
+
+        self.__gpio_list[self.__RS].value(False)
+        self.__gpio_list[self.__RW].value(False)
+
+        for enable in self.__enables:
+            self.__enable = enable
+
+            self.__gpio_write(function_set)  # Function set (Interface is 8 bits long.)
+            utime.sleep_us(2000)  # Wait for a return home to complete.
+            self.__gpio_write(function_set)  # Function set (Interface is 8 bits long.)
+            utime.sleep_us(100)
+            self.__gpio_write(function_set)  # Function set (Interface is 8 bits long.)
+            utime.sleep_us(100)
+
+            if not self.__eight_bit:
+                self.__gpio_write(0x02)  # Function set (Interface is 4 bits long.)
+
+        self.__enable = self.__enables[0]
+
+    def __init_lcd(self, busy_flag: bool = False, warm: bool = False) -> None:
         """
         Initializes the LCD by sending initialization commands.
 
+        :param busy_flag: Poll the busy flag after the function set, if it can be read back.
+        :param warm: Only resynchronize the interface and restore the function set and entry mode.
         :return: None
         """
-        # Wait for more than 40 ms after VCC rises to 2.7 V.
-        utime.sleep_ms(50)
-        self.__send_instructions(0x30)  # Function set (Interface is 8 bits long.)
-        utime.sleep_ms(5)  # Wait for more than 4.1 ms.
-        self.__send_instructions(0x30)  # Function set (Interface is 8 bits long.)
-        utime.sleep_us(100)  # Wait for more than 100 µs.
-        self.__send_instructions(0x30)  # Function set (Interface is 8 bits long.)
+        if warm:
+            self.__resync()
+        else:
+            # Wait for more than 40 ms after VCC rises to 2.7 V.
+            # Every controller is sent each step before the wait, so they all wait at once.
+            utime.sleep_ms(50)
+            self._send_all(0x30)  # Function set (Interface is 8 bits long.)
+            utime.sleep_ms(5)  # Wait for more than 4.1 ms.
+            self._send_all(0x30)  # Function set (Interface is 8 bits long.)
+            utime.sleep_us(100)  # Wait for more than 100 µs.
+            self._send_all(0x30)  # Function set (Interface is 8 bits long.)
+
+            # Switch to 4-bit mode. In 8-bit mode this byte would be a return home instead.
+            if not self.__eight_bit:
+                self._send_all(0x02)  # Function set (Interface is 4 bits long.)
 
         # Function set: interface mode, number of lines (rows), and font size.
-        self.__send_instructions(Instruction.FUNCTION_SET >> 4)
-        self.__send_instructions(Instruction.FUNCTION_SET | self.__data_len | self.__num_row | self.__font_size)
+        self._write_function_set(self.__font_size, self.__eight_bit)
+
+        # The busy flag can be checked once the interface length is set.
+        self.__busy_flag = busy_flag and self._probe_busy_flag(self.__read_status)
 
-        self.display_on()  # Display control: Display on, cursor and blink off.
-        self.clear_display()  # Clear display.
+        if not warm:
+            self.display_on()  # Display control: Display on, cursor and blink off.
+            self.clear_display()  # Clear display.
 
         # Entry mode set: Increment display, No shift.
-        self.__send_instructions(Instruction.ENTRY_MODE_SET | Instruction.INCREMENT)
+        self._write_entry_mode()
 
 
 # THE END
@@ -1,29 +1,416 @@
 import utime
 from micropython import const
 
-from .instructions import Instruction
+# HD44780 instruction flags, as in instructions.py. The backends and helpers get them through HD44780API.
+_CLEAR_DISPLAY = const(0x01)
+_RETURN_HOME = const(0x02)
+_ENTRY_MODE_SET = const(0x04)
+_INCREMENT = const(0x02)
+_SHIFT = const(0x01)
+_DISPLAY_CONTROL = const(0x08)
+_DISPLAY = const(0x04)
+_CURSOR = const(0x02)
+_BLINK = const(0x01)
+_CRD_SHIFT = const(0x10)
+_CURSOR_MOVE = const(0x00)
+_DISPLAY_SHIFT = const(0x08)
+_SHIFT_RIGHT = const(0x04)
+_SHIFT_LEFT = const(0x00)
+_FUNCTION_SET = const(0x20)
+_DISPLAY_1LINE = const(0x00)
+_DISPLAY_2LINE = const(0x08)
+_LEN_8BIT = const(0x10)
+_LEN_4BIT = const(0x00)
+_FONT5X8 = const(0x00)
+_FONT5X10 = const(0x04)
+_CGRAM_ADDR = const(0x40)
+_DDRAM_ADDR = const(0x80)
+
+# Kinds of the operations recorded by batch().
+_OP_INSTRUCTION = const(0)
+_OP_DATA = const(1)
+_OP_WAIT = const(2)
+_OP_SELECT = const(3)
 
 
 class HD44780API:
+    # Macro for Font size.
+    FONT5X8, FONT5X10 = const((_FONT5X8, _FONT5X10))
+
+    # Public methods timed for the slow operation callback.
+    __TIMED: tuple = (
+        "clear_display",
+        "return_home",
+        "display_on",
+        "display_off",
+        "display_cursor",
+        "display_no_cursor",
+        "cursor_blink",
+        "cursor_no_blink",
+        "left_to_right",
+        "right_to_left",
+        "autoscroll",
+        "no_autoscroll",
+        "display_shift_left",
+        "display_shift_right",
+        "cursor_shift_left",
+        "cursor_shift_right",
+        "set_cursor",
+        "print",
+        "custom_character",
+    )
+
     def __init__(self, row: int, col: int) -> None:
         """
         Initialize the HD44780API object.
 
+        A 40x4 display has two controllers sharing every line but EN: rows 0 and 1 on the first one, rows 2 and 3
+        on the second one. Backends supporting it select the controller written to with _select().
+
         :param row: Number of rows on the display (1, 2, or 4).
-        :param col: Number of columns on the display (16 or 20).
+        :param col: Number of columns on the display (16, 20 or 40).
         :raises ValueError: If row or col is invalid.
         """
         if row not in (1, 2, 4):
             raise ValueError("Invalid row! 'row' must be 1, 2, or 4.")
 
-        if col not in (16, 20):
-            raise ValueError("Invalid col! 'col' must be 16 or 20.")
+        if col not in (16, 20, 40):
+            raise ValueError("Invalid col! 'col' must be 16, 20 or 40.")
 
         self._row: int = row
         self._col: int = col
-        self.__num_row = Instruction.DISPLAY_2LINE if row >= 2 else Instruction.DISPLAY_1LINE
+        self.__num_row = _DISPLAY_2LINE if row >= 2 else _DISPLAY_1LINE
+        self.__row_addrs: tuple = (0x00, 0x40, 0x00, 0x40) if col == 40 else (0x00, 0x40, 0x14, 0x54)
+        self._controllers: int = 2 if row == 4 and col == 40 else 1
+        self.__controller: int = 0  # Controller holding the cursor, which receives the DDRAM writes.
+        self._stats = None  # Instrumentation counters, None while disabled.
+
+        # Last value written to the DISPLAY_CONTROL, ENTRY_MODE_SET and FUNCTION_SET registers, by register.
+        self.__registers: dict = {}
+
+        # Operations recorded by batch(), as [kind, value] pairs, nesting depth, and entry mode at the start.
+        self.__batch: list = []
+        self.__batch_depth: int = 0
+        self.__batch_entry_mode: int = -1
+        self.__batch_hooks = None  # Write hooks in place before the batch, restored on exit.
+
+        # Text translation, None for the default conversion, and DDRAM address the next print() writes to, -1 if
+        # unknown, to set the cursor back after the translation loaded a glyph into CGRAM.
+        self.__charset = None
+        self.__cursor: int = -1
+
+    def enable_stats(self, slow_us: int = 0, callback=None) -> None:
+        """
+        Enables the instrumentation counters, starting from 0.
+
+        While disabled, the only cost left in the write path is a check of the counters against None.
+        With a callback, every public call lasting at least slow_us is reported as callback(name, elapsed_us).
+
+        :param slow_us: Duration from which a call is reported, in microseconds (default is 0).
+        :param callback: Called for every slow call (default is None).
+        :return: None
+        """
+        self.disable_stats()
+        from .driver_stats import DriverStats  # Only loaded once instrumentation is used.
+
+        self._stats = DriverStats(slow_us, callback)
+
+        if callback is not None:
+            for name in self.__TIMED:
+                setattr(self, name, self._stats.timed(name, getattr(self, name)))
+
+    def disable_stats(self) -> None:
+        """
+        Disables the instrumentation counters and the slow operation callback.
+
+        :return: None
+        """
+        if self._stats is not None and self._stats.callback is not None:
+            for name in self.__TIMED:
+                delattr(self, name)
+
+        self._stats = None
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the instrumentation counters.
+
+        :return: A dict of the counter values, empty while disabled.
+        """
+        return {} if self._stats is None else self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """
+        Resets the instrumentation counters to 0.
+
+        :return: None
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def batch(self):
+        """
+        Returns the LCD as a context manager, which defers the writes of the calls made inside it:
 
-    def __send_instructions(self, data: int, rs: bool = False) -> None:
+            with lcd.batch():
+                lcd.set_cursor(0, 0)
+                lcd.print("Temp")
+                lcd.custom_character(0, bit_map)
+
+        Every instruction, data write and wait is recorded instead of sent. On exit, set_cursor calls that
+        target the address the previous write already left the cursor at are dropped, adjacent prints are
+        merged, CGRAM uploads are moved before the DDRAM writes, and the writes are sent as runs through
+        _write_runs(), in one transfer where the backend supports it. Nested batches are sent by the outermost.
+
+        :return: The LCD.
+        """
+        return self
+
+    def __enter__(self):
+        """
+        Starts recording the writes, unless a batch is already open.
+
+        :return: The LCD.
+        """
+        if not self.__batch_depth:
+            self.__batch_entry_mode = self.__registers.get(_ENTRY_MODE_SET, -1)
+            self.__batch_hooks = (
+                self._send_instructions,
+                self._write_data,
+                self._write_runs,
+                self._wait_ready,
+                self._select,
+            )
+            self._send_instructions = self.__record_instruction
+            self._write_data = self.__record_data
+            self._write_runs = self.__record_runs
+            self._wait_ready = self.__record_wait
+            self._select = self.__record_select
+
+        self.__batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Ends the batch, and sends the recorded writes once the outermost batch is closed.
+
+        :param exc_type: Type of the exception raised in the block, if any.
+        :param exc_value: The exception raised in the block, if any.
+        :param traceback: Traceback of the exception, if any.
+        :return: None
+        """
+        self.__batch_depth -= 1
+        if self.__batch_depth:
+            return
+
+        # Back to the backend methods, or to the hooks wrapping them, e.g. of a TraceRecorder.
+        self._send_instructions, self._write_data, self._write_runs, self._wait_ready, self._select = self.__batch_hooks
+        self.__batch_hooks = None
+
+        # The cached registers already hold the recorded writes, so they are sent even if the block raised.
+        ops: list = self.__combine(self.__reorder(self.__batch))
+        self.__batch = []
+        self.__emit(ops)
+
+    def __record_instruction(self, data: int, rs: bool = False) -> None:
+        """
+        Records an instruction or data byte, in place of _send_instructions() while batching.
+
+        :param data: Instruction or data to be sent.
+        :param rs: Register Select (True for data, False for instruction).
+        :return: None
+        """
+        if rs:
+            self.__batch.append([_OP_DATA, bytes((data,))])
+        else:
+            self.__batch.append([_OP_INSTRUCTION, data])
+
+    def __record_data(self, payload: bytes | bytearray | memoryview) -> None:
+        """
+        Records a block of data bytes, in place of _write_data() while batching.
+
+        :param payload: The data bytes to be written.
+        :return: None
+        """
+        self.__batch.append([_OP_DATA, bytes(payload)])  # Copied, the caller may reuse its buffer.
+
+    def __record_runs(self, runs: list) -> None:
+        """
+        Records runs of data bytes, in place of _write_runs() while batching.
+
+        :param runs: The (set DDRAM or CGRAM address instruction, data bytes) pairs to be written.
+        :return: None
+        """
+        for address, payload in runs:
+            self.__batch.append([_OP_INSTRUCTION, address])
+            self.__batch.append([_OP_DATA, bytes(payload)])
+
+    def __record_wait(self, delay_us: int) -> None:
+        """
+        Records a wait, in place of _wait_ready() while batching.
+
+        :param delay_us: Worst-case execution time of the previous instruction, in microseconds.
+        :return: None
+        """
+        self.__batch.append([_OP_WAIT, delay_us])
+
+    def __record_select(self, controller: int) -> None:
+        """
+        Records a controller selection, in place of _select() while batching.
+
+        :param controller: Index of the controller.
+        :return: None
+        """
+        self.__batch.append([_OP_SELECT, controller])
+
+    @staticmethod
+    def __reorder(ops: list) -> list:
+        """
+        Moves the CGRAM uploads, each a set CGRAM address followed by its data, before the other operations.
+
+        The order is kept if the first DDRAM write does not set its address, as it relies on the address counter
+        left by the previous batch, which a CGRAM upload would change, and on LCDs with two controllers.
+
+        :param ops: The recorded operations.
+        :return: The reordered operations.
+        """
+        uploads: list = []
+        others: list = []
+        in_upload: bool = False
+        addressed: bool = False
+
+        for op in ops:
+            kind, value = op
+            if kind == _OP_INSTRUCTION:
+                in_upload = _CGRAM_ADDR <= value < _DDRAM_ADDR
+                if not in_upload and (value >= _DDRAM_ADDR or value in (_CLEAR_DISPLAY, _RETURN_HOME, 0x03)):
+                    addressed = True
+            elif kind == _OP_DATA and not in_upload and not addressed:
+                return ops
+            elif kind == _OP_WAIT:
+                in_upload = False
+            elif kind == _OP_SELECT:
+                return ops
+
+            (uploads if in_upload else others).append(op)
+
+        return uploads + others
+
+    def __combine(self, ops: list) -> list:
+        """
+        Drops the set DDRAM address instructions that target the address counter, and merges adjacent data.
+
+        The address counter is followed while the entry mode increments without shifting the display, and as long
+        as writes stay within a DDRAM line.
+
+        :param ops: The operations.
+        :return: The combined operations.
+        """
+        combined: list = []
+        entry_mode: int = self.__batch_entry_mode
+        addr: int = -1  # DDRAM address counter, -1 if unknown.
+
+        for op in ops:
+            kind, value = op
+            if kind == _OP_INSTRUCTION:
+                if value >= _DDRAM_ADDR:
+                    if value & 0x7F == addr and entry_mode == _ENTRY_MODE_SET | _INCREMENT:
+                        if self._stats is not None:
+                            self._stats.skipped_writes += 1
+                        continue
+                    addr = value & 0x7F
+                elif value >= _CGRAM_ADDR:
+                    addr = -1
+                elif _CRD_SHIFT <= value < _FUNCTION_SET:
+                    if not value & _DISPLAY_SHIFT:  # Cursor shift.
+                        addr = -1
+                elif _ENTRY_MODE_SET <= value < _DISPLAY_CONTROL:
+                    entry_mode = value
+                elif value == _CLEAR_DISPLAY:
+                    addr = 0
+                    entry_mode = entry_mode | _INCREMENT if entry_mode >= 0 else -1
+                elif _RETURN_HOME <= value < _ENTRY_MODE_SET:
+                    addr = 0
+            elif kind == _OP_DATA:
+                addr = self.__advance(addr, len(value))
+
+                if combined and combined[-1][0] == _OP_DATA:
+                    combined[-1] = [_OP_DATA, combined[-1][1] + value]
+                    continue
+            elif kind == _OP_SELECT:
+                addr = -1  # The address counter of another controller.
+
+            combined.append(op)
+
+        return combined
+
+    def __advance(self, addr: int, count: int) -> int:
+        """
+        Follows the DDRAM address counter over a write, in increment entry mode.
+
+        :param addr: DDRAM address before the write, -1 if unknown.
+        :param count: Number of data bytes written.
+        :return: DDRAM address after the write, -1 if unknown or past the end of the DDRAM line.
+        """
+        if addr < 0:
+            return -1
+
+        if self.__num_row == _DISPLAY_2LINE:
+            return addr + count if (addr & 0x3F) + count < 40 else -1
+
+        return addr + count if addr + count < 80 else -1
+
+    def set_charset(self, charset) -> None:
+        """
+        Sets the translation of text to character codes, used by print() and by the helpers writing text.
+
+        If the Charset loads a substitute glyph into CGRAM while print() translates its text, the cursor is set
+        back to where set_cursor() and the previous prints left it.
+
+        :param charset: The Charset, or None for the default conversion.
+        :return: None
+        """
+        self.__charset = charset
+
+    def __emit(self, ops: list) -> None:
+        """
+        Sends the operations, each set address instruction followed by data as a run of _write_runs().
+
+        :param ops: The operations.
+        :return: None
+        """
+        runs: list = []
+        for index, (kind, value) in enumerate(ops):
+            if kind == _OP_DATA and runs and runs[-1][1] is None:
+                runs[-1][1] = value
+                continue
+
+            if (
+                kind == _OP_INSTRUCTION
+                and value >= _CGRAM_ADDR
+                and index + 1 < len(ops)
+                and ops[index + 1][0] == _OP_DATA
+            ):
+                runs.append([value, None])  # Its data is the next operation.
+                continue
+
+            if runs:
+                self._write_runs(runs)
+                runs = []
+
+            if kind == _OP_INSTRUCTION:
+                self._send_instructions(value)
+            elif kind == _OP_DATA:
+                self._write_data(value)
+            elif kind == _OP_SELECT:
+                self._select(value)
+            else:
+                self._wait_ready(value)
+
+        if runs:
+            self._write_runs(runs)
+
+    def _send_instructions(self, data: int, rs: bool = False) -> None:
         """
         Placeholder method for sending instructions to the LCD.
 
@@ -36,14 +423,277 @@ class HD44780API:
         """
         pass
 
+    def _wait_ready(self, delay_us: int) -> None:
+        """
+        Waits until the controller has executed the previous instruction.
+
+        Backends able to read the busy flag may override this to return as soon as the controller is ready.
+        The default implementation sleeps for the given worst-case execution time.
+
+        :param delay_us: Worst-case execution time of the previous instruction, in microseconds.
+        :return: None
+        """
+        utime.sleep_us(delay_us)
+
+        if self._stats is not None:
+            self._stats.wait_us += delay_us
+
+    def _probe_busy_flag(self, read_status) -> bool:
+        """
+        Checks whether the busy flag and address counter can be read back, for backends able to read them.
+
+        The DDRAM address is set to a known value, read back once the busy flag clears, and reset to 0.
+
+        :param read_status: Reads the busy flag (bit 7) and the address counter (bits 0 to 6), -1 if RW is not
+            wired.
+        :return: True if the status read matches the address written.
+        """
+        if read_status() < 0:
+            return False
+
+        self._send_instructions(_DDRAM_ADDR | 0x05)
+
+        start: int = utime.ticks_us()
+        status: int = read_status()
+        while status & 0x80 and utime.ticks_diff(utime.ticks_us(), start) < 100:
+            status = read_status()
+
+        readable: bool = status == 0x05
+        self._send_instructions(_DDRAM_ADDR)
+        return readable
+
+    def _write_data(self, payload: bytes | bytearray | memoryview) -> None:
+        """
+        Writes a block of data bytes (RS: 1) to the LCD.
+
+        Backends may override this to stream the whole payload more efficiently than one
+        instruction at a time. The default implementation sends the bytes one by one.
+
+        :param payload: The data bytes to be written.
+        :return: None
+        """
+        for byte in payload:
+            self._send_instructions(byte, rs=True)  # RS: 1 -> Sending data.
+
+    def _write_runs(self, runs: list) -> None:
+        """
+        Writes blocks of data bytes to the LCD, each at its own DDRAM or CGRAM address.
+
+        Backends may override this to send every run in a single bus transfer. The default implementation
+        sends the set address instruction and writes the data of each run in turn.
+
+        :param runs: The (set DDRAM or CGRAM address instruction, data bytes) pairs to be written.
+        :return: None
+        """
+        for address, payload in runs:
+            self._send_instructions(address)
+            self._write_data(payload)
+
+    def _select(self, controller: int) -> None:
+        """
+        Placeholder method for selecting the controller receiving the next writes, on LCDs with two controllers.
+
+        Backends supporting them override this to route EN to the given controller.
+
+        :param controller: Index of the controller, 0 for rows 0 and 1, 1 for rows 2 and 3.
+        :return: None
+        """
+        pass
+
+    def _send_all(self, data: int, inactive: int = -1) -> None:
+        """
+        Sends an instruction to every controller. The controller holding the cursor receives it last, so the
+        others execute it meanwhile instead of one after another, and waiting for it covers them all.
+
+        :param data: The instruction.
+        :param inactive: The instruction sent to the controllers without the cursor, data if -1 (default is -1).
+        :return: None
+        """
+        if self._controllers > 1:
+            for controller in range(self._controllers):
+                if controller != self.__controller:
+                    self._select(controller)
+                    self._send_instructions(data if inactive < 0 else inactive)
+
+            self._select(self.__controller)
+
+        self._send_instructions(data)
+
+    def __switch(self, controller: int) -> None:
+        """
+        Moves the cursor to another controller, which then receives the DDRAM writes. Only the controller
+        holding the cursor shows it.
+
+        :param controller: Index of the controller.
+        :return: None
+        """
+        display: int = self.__registers.get(_DISPLAY_CONTROL, 0)
+        if display & (_CURSOR | _BLINK):
+            self._send_instructions(display & ~(_CURSOR | _BLINK))
+
+        self.__controller = controller
+        self._select(controller)
+
+        if display & (_CURSOR | _BLINK):
+            self._send_instructions(display)
+
+    def _address(self, row: int, col: int) -> int:
+        """
+        Returns the set DDRAM address instruction of a cell, for the runs of _write_cells().
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :return: The instruction, with the index of the controller of the row from bit 8 on.
+        """
+        return _DDRAM_ADDR | (self.__row_addrs[row] + col) | ((row >> 1) << 8 if self._controllers > 1 else 0)
+
+    @staticmethod
+    def _glyph_address(slot: int) -> int:
+        """
+        Returns the set CGRAM address instruction of a custom character, for the runs of _write_cells().
+
+        :param slot: The custom character (0 to 7).
+        :return: The instruction.
+        """
+        return _CGRAM_ADDR | ((slot & 0x07) << 3)
+
+    def _write_cells(self, runs: list) -> None:
+        """
+        Writes runs of data bytes with _write_runs(), routed to the controllers of an LCD with two of them: a run
+        at a DDRAM address from _address() to the controller of its row, and a run at a CGRAM address to both.
+
+        :param runs: The (_address() or _glyph_address() instruction, data bytes) pairs to be written.
+        :return: None
+        """
+        self.__cursor = -1  # The address counter is left after the last run.
+
+        if self._controllers == 1:
+            self._write_runs(runs)
+            return
+
+        active: int = self.__controller
+        for controller in (1 - active, active):
+            routed: list = [
+                (address & 0xFF, payload)
+                for address, payload in runs
+                if address < _DDRAM_ADDR or address >> 8 == controller
+            ]
+            if routed:
+                self._select(controller)
+                self._write_runs(routed)
+
+        self._select(active)
+
+    def _write_register(self, register: int, value: int) -> None:
+        """
+        Writes a DISPLAY_CONTROL, ENTRY_MODE_SET or FUNCTION_SET instruction, unless the controller already
+        holds the same value.
+
+        :param register: The register instruction flag, e.g. _DISPLAY_CONTROL.
+        :param value: The complete instruction, register flag included.
+        :return: None
+        """
+        if self.__registers.get(register, -1) == value:
+            if self._stats is not None:
+                self._stats.skipped_writes += 1
+            return
+
+        # Only the controller holding the cursor shows it.
+        self._send_all(value, value & ~(_CURSOR | _BLINK) if register == _DISPLAY_CONTROL else -1)
+        self.__registers[register] = value
+
+    def _write_function_set(self, font: int, eight_bit: bool = False) -> None:
+        """
+        Writes the FUNCTION_SET instruction of the initialization: the interface length, the display lines and
+        the font size.
+
+        :param font: Font size, FONT5X8 or FONT5X10.
+        :param eight_bit: True for the 8-bit interface, False for the 4-bit one (default is False).
+        :return: None
+        """
+        length: int = _LEN_8BIT if eight_bit else _LEN_4BIT
+        self._write_register(_FUNCTION_SET, _FUNCTION_SET | length | self.__num_row | font)
+
+    def _write_entry_mode(self) -> None:
+        """
+        Writes the ENTRY_MODE_SET instruction of the initialization: increment, and no display shift.
+
+        :return: None
+        """
+        self._write_register(_ENTRY_MODE_SET, _ENTRY_MODE_SET | _INCREMENT)
+
+    def __update_register(self, register: int, set_bits: int, clear_bits: int = 0, default: int = 0) -> None:
+        """
+        Changes bits of a register against its cached value.
+
+        :param register: The register instruction flag, e.g. _DISPLAY_CONTROL.
+        :param set_bits: Bits to be set.
+        :param clear_bits: Bits to be cleared.
+        :param default: Bits assumed set while the register was never written.
+        :return: None
+        """
+        current: int = self.__registers.get(register, register | default)
+        self._write_register(register, (current | set_bits) & ~clear_bits)
+
+    def _cleared(self) -> None:
+        """
+        Records the effect of a CLEAR_DISPLAY instruction on the cached registers: the entry mode is set to
+        increment.
+
+        :return: None
+        """
+        entry_mode: int = self.__registers.get(_ENTRY_MODE_SET, -1)
+        if entry_mode >= 0:
+            self.__registers[_ENTRY_MODE_SET] = entry_mode | _INCREMENT
+
+    def _encode_text(self, data: any) -> bytes | bytearray | memoryview:
+        """
+        Converts the given data into the character codes to be written to DDRAM.
+
+        Bytes-like data is returned as-is, anything else is converted with str().
+
+        :param data: The data to be converted.
+        :return: The character codes.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+
+        text: str = str(data)
+        if self.__charset is not None:
+            return self.__charset.encode(text)
+
+        payload: bytes = text.encode()
+
+        # Non-ASCII text encodes to more bytes than characters, send one character code per character.
+        if len(payload) != len(text):
+            payload = bytes(ord(char) & 0xFF for char in text)
+
+        return payload
+
+    def _send_home(self, clear: bool) -> None:
+        """
+        Sends a CLEAR_DISPLAY or RETURN_HOME instruction to every controller, and records its effects, without
+        waiting for its execution: the caller waits the 2 ms itself, or does something else meanwhile.
+
+        :param clear: True for CLEAR_DISPLAY, False for RETURN_HOME.
+        :return: None
+        """
+        if self.__controller:
+            self.__switch(0)
+
+        self._send_all(_CLEAR_DISPLAY if clear else _RETURN_HOME)
+        if clear:
+            self._cleared()
+        self.__cursor = 0
+
     def clear_display(self) -> None:
         """
         Clears the entire display.
 
         :return: None
         """
-        self.__send_instructions(Instruction.CLEAR_DISPLAY)
-        utime.sleep_ms(2)
+        self._send_home(True)
+        self._wait_ready(2000)
 
     def return_home(self) -> None:
         """
@@ -51,58 +701,88 @@ class HD44780API:
 
         :return: None
         """
-        self.__send_instructions(Instruction.RETURN_HOME)
-        utime.sleep_ms(2)
+        self._send_home(False)
+        self._wait_ready(2000)
 
     def display_on(self) -> None:
         """
-        Turns on the display.
+        Turns on the display, keeping the cursor and blink settings.
 
         :return: None
         """
-        self.__send_instructions(Instruction.DISPLAY_CONTROL | Instruction.DISPLAY)
+        self.__update_register(_DISPLAY_CONTROL, _DISPLAY)
 
     def display_off(self) -> None:
         """
-        Turns off the display.
+        Turns off the display, keeping the cursor and blink settings.
 
         :return: None
         """
-        self.__send_instructions(Instruction.DISPLAY_CONTROL)
+        self.__update_register(_DISPLAY_CONTROL, 0, _DISPLAY)
 
     def display_cursor(self) -> None:
         """
-        Shows the cursor on the display.
+        Shows the cursor on the display, keeping the display and blink settings.
 
         :return: None
         """
-        self.__send_instructions(Instruction.DISPLAY_CONTROL | Instruction.DISPLAY | Instruction.CURSOR)
+        self.__update_register(_DISPLAY_CONTROL, _CURSOR, 0, _DISPLAY)
 
     def display_no_cursor(self) -> None:
         """
-        Hides the cursor on the display.
+        Hides the cursor on the display, keeping the display and blink settings.
 
         :return: None
         """
-        self.__send_instructions(Instruction.DISPLAY_CONTROL | Instruction.DISPLAY)
+        self.__update_register(_DISPLAY_CONTROL, 0, _CURSOR, _DISPLAY)
 
     def cursor_blink(self) -> None:
         """
-        Enables blinking cursor.
+        Enables blinking cursor, keeping the display and cursor settings.
 
         :return: None
         """
-        self.__send_instructions(
-            Instruction.DISPLAY_CONTROL | Instruction.DISPLAY | Instruction.CURSOR | Instruction.BLINK
-        )
+        self.__update_register(_DISPLAY_CONTROL, _BLINK, 0, _DISPLAY)
 
     def cursor_no_blink(self) -> None:
         """
-        Disables blinking cursor.
+        Disables blinking cursor, keeping the display and cursor settings.
+
+        :return: None
+        """
+        self.__update_register(_DISPLAY_CONTROL, 0, _BLINK, _DISPLAY)
+
+    def left_to_right(self) -> None:
+        """
+        Moves the cursor to the right after each character (default).
 
         :return: None
         """
-        self.__send_instructions(Instruction.DISPLAY_CONTROL | Instruction.DISPLAY | Instruction.CURSOR)
+        self.__update_register(_ENTRY_MODE_SET, _INCREMENT, 0, _INCREMENT)
+
+    def right_to_left(self) -> None:
+        """
+        Moves the cursor to the left after each character.
+
+        :return: None
+        """
+        self.__update_register(_ENTRY_MODE_SET, 0, _INCREMENT, _INCREMENT)
+
+    def autoscroll(self) -> None:
+        """
+        Shifts the entire display after each character, instead of moving the cursor.
+
+        :return: None
+        """
+        self.__update_register(_ENTRY_MODE_SET, _SHIFT, 0, _INCREMENT)
+
+    def no_autoscroll(self) -> None:
+        """
+        Moves the cursor after each character, without shifting the display (default).
+
+        :return: None
+        """
+        self.__update_register(_ENTRY_MODE_SET, 0, _SHIFT, _INCREMENT)
 
     def display_shift_left(self) -> None:
         """
@@ -110,7 +790,7 @@ class HD44780API:
 
         :return: None
         """
-        self.__send_instructions(Instruction.CRD_SHIFT | Instruction.DISPLAY_SHIFT | Instruction.SHIFT_LEFT)
+        self._send_all(_CRD_SHIFT | _DISPLAY_SHIFT | _SHIFT_LEFT)
 
     def display_shift_right(self) -> None:
         """
@@ -118,7 +798,7 @@ class HD44780API:
 
         :return: None
         """
-        self.__send_instructions(Instruction.CRD_SHIFT | Instruction.DISPLAY_SHIFT | Instruction.SHIFT_RIGHT)
+        self._send_all(_CRD_SHIFT | _DISPLAY_SHIFT | _SHIFT_RIGHT)
 
     def cursor_shift_left(self) -> None:
         """
@@ -126,7 +806,8 @@ class HD44780API:
 
         :return: None
         """
-        self.__send_instructions(Instruction.CRD_SHIFT | Instruction.CURSOR_MOVE | Instruction.SHIFT_LEFT)
+        self._send_instructions(_CRD_SHIFT | _CURSOR_MOVE | _SHIFT_LEFT)
+        self.__cursor = -1
 
     def cursor_shift_right(self) -> None:
         """
@@ -134,7 +815,8 @@ class HD44780API:
 
         :return: None
         """
-        self.__send_instructions(Instruction.CRD_SHIFT | Instruction.CURSOR_MOVE | Instruction.SHIFT_RIGHT)
+        self._send_instructions(_CRD_SHIFT | _CURSOR_MOVE | _SHIFT_RIGHT)
+        self.__cursor = -1
 
     def set_cursor(self, row: int, col: int) -> None:
         """
@@ -145,7 +827,7 @@ class HD44780API:
         :raises IndexError: If invalid, row or column values are provided.
         :return: None
         """
-        if self.__num_row == Instruction.DISPLAY_1LINE and row != 0:
+        if self.__num_row == _DISPLAY_1LINE and row != 0:
             raise IndexError("Invalid row! Single-line display only supports row 0.")
 
         if not (0 <= row < self._row):
@@ -154,18 +836,42 @@ class HD44780API:
         if not (0 <= col < self._col):
             raise IndexError(f"Invalid column! 'col' must be in the range 0 to {self._col - 1}.")
 
-        row_offset: tuple = const((0x00, 0x40, 0x14, 0x54))
-        self.__send_instructions(Instruction.DDRAM_ADDR | (row_offset[row] + col))
+        controller: int = row >> 1 if self._controllers > 1 else 0
+        if controller != self.__controller:
+            self.__switch(controller)
+
+        self.__cursor = self.__row_addrs[row] + col
+        self._send_instructions(_DDRAM_ADDR | self.__cursor)
 
     def print(self, data: any) -> None:
         """
         Prints the given data on the LCD.
 
-        :param data: The data to be printed (int, float, or str).
+        Bytes-like data is written as-is, skipping the str to character code conversion. Text is translated by the
+        Charset, if one is set.
+
+        :param data: The data to be printed (int, float, str, bytes, bytearray or memoryview).
+        :raises RuntimeError: If a substitute glyph was loaded while the cursor position is unknown.
         :return: None
         """
-        for char in str(data):
-            self.__send_instructions(ord(char), rs=True)  # RS: 1 -> Sending data.
+        charset = self.__charset
+        cursor: int = self.__cursor  # Loading a glyph invalidates the cursor, kept to set it back.
+        if charset is None:
+            payload = self._encode_text(data)
+        else:
+            uploads: int = charset.uploads()
+            payload = self._encode_text(data)
+
+            # A substitute glyph was loaded into CGRAM, set the address counter back to the DDRAM.
+            if charset.uploads() != uploads:
+                if cursor < 0:
+                    raise RuntimeError("Unknown cursor! Call set_cursor() before printing text with substitute glyphs.")
+                self._send_instructions(_DDRAM_ADDR | cursor)
+
+        self._write_data(payload)
+
+        increment: bool = self.__registers.get(_ENTRY_MODE_SET, -1) == _ENTRY_MODE_SET | _INCREMENT
+        self.__cursor = self.__advance(cursor, len(payload)) if increment else -1
 
     def custom_character(self, ram_addr: int, bit_map: tuple | list) -> None:
         """
@@ -187,12 +893,8 @@ class HD44780API:
         # Mask ram_addr to ensure it's within the 7 available ram locations.
         ram_addr &= 0x07  # We have only 7 ram locations to store.
 
-        # Set the CGRAM address using the provided ram_addr.
-        self.__send_instructions(Instruction.CGRAM_ADDR | (ram_addr << 3))
-
-        # Load the bit map into the CGRAM
-        for bit in bit_map:
-            self.__send_instructions(bit, rs=True)  # RS: 1 -> Sending data.
+        # Set the CGRAM address using the provided ram_addr, and load the bit map into the CGRAM of every controller.
+        self._write_cells([(self._glyph_address(ram_addr), bytes(bit_map))])
 
 
 # THE END
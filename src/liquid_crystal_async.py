@@ -0,0 +1,319 @@
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+from .display_buffer import DisplayBuffer
+from .liquid_crystal_api import HD44780API
+
+
+class AsyncLiquidCrystal:
+    # Commands that are not idempotent, and must never be coalesced.
+    __SHIFTS: tuple = ("display_shift_left", "display_shift_right", "cursor_shift_left", "cursor_shift_right")
+
+    def __init__(self, lcd: HD44780API, maxlen: int = 16) -> None:
+        """
+        Initialize a non-blocking wrapper around an LCD backend.
+
+        Text is written into a shadow framebuffer, so several writes to the same cell before a flush are
+        coalesced, and set_cursor only moves a virtual cursor. Other commands are put into a bounded queue.
+        A background task, started with start(), drains the queue and flushes the changed cells, yielding to
+        other tasks between rows and during the clear_display and return_home delays.
+
+        Text is clipped at the end of each row.
+
+        :param lcd: The LCD backend to be driven.
+        :param maxlen: Maximum number of queued commands (default is 16).
+        :raises ValueError: If maxlen is less than 1.
+        """
+        if maxlen < 1:
+            raise ValueError("Invalid maxlen! 'maxlen' must be at least 1.")
+
+        self.__lcd: HD44780API = lcd
+        self.__buffer: DisplayBuffer = DisplayBuffer(lcd)
+        self.__queue: list = []
+        self.__maxlen: int = maxlen
+        self.__pending: asyncio.Event = asyncio.Event()  # Set when the queue holds commands.
+        self.__space: asyncio.Event = asyncio.Event()  # Set when the queue has room.
+        self.__idle: asyncio.Event = asyncio.Event()  # Set when everything queued has been sent.
+        self.__space.set()
+        self.__idle.set()
+        self.__dirty: bool = False  # A flush is queued for the buffered text.
+        self.__row: int = 0
+        self.__col: int = 0
+        self.__task = None
+
+    async def __put(self, name: str, args: tuple = ()) -> None:
+        """
+        Put a command into the queue, waiting for room if it is full.
+
+        A command identical to the last queued one is dropped, except for shifts.
+
+        :param name: Name of the HD44780API method, or None for a flush of the buffered text.
+        :param args: Arguments of the method.
+        :return: None
+        """
+        command: tuple = (name, args)
+        if self.__queue and self.__queue[-1] == command and name not in self.__SHIFTS:
+            return
+
+        while len(self.__queue) >= self.__maxlen:
+            self.__space.clear()
+            await self.__space.wait()
+
+        self.__queue.append(command)
+        self.__idle.clear()
+        self.__pending.set()
+
+    def start(self):
+        """
+        Starts the background task draining the queue.
+
+        :return: The asyncio task.
+        """
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__drain())
+
+        return self.__task
+
+    def stop(self) -> None:
+        """
+        Cancels the background task. Queued commands are kept.
+
+        :return: None
+        """
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    async def join(self) -> None:
+        """
+        Waits until every queued command and buffered text has been sent.
+
+        :return: None
+        """
+        await self.__idle.wait()
+
+    async def __drain(self) -> None:
+        """
+        Execute the queued commands, in order.
+
+        :return: None
+        """
+        while True:
+            await self.__pending.wait()
+
+            while self.__queue:
+                name, args = self.__queue.pop(0)
+                self.__space.set()
+
+                if name is None:
+                    self.__dirty = False
+                    for row in range(self.__lcd._row):
+                        self.__buffer.flush_row(row)
+                        await asyncio.sleep(0)
+
+                elif name in ("clear_display", "return_home"):
+                    clear: bool = name == "clear_display"
+                    self.__lcd._send_home(clear)
+                    await asyncio.sleep(0.002)  # Yield instead of blocking during execution.
+
+                    if clear:
+                        self.__buffer.mark_cleared()
+
+                else:
+                    getattr(self.__lcd, name)(*args)
+                    await asyncio.sleep(0)
+
+            self.__pending.clear()
+            self.__idle.set()
+
+    async def clear_display(self) -> None:
+        """
+        Clears the entire display, and the buffered text.
+
+        :return: None
+        """
+        self.__buffer.fill()
+        self.__row = self.__col = 0
+        await self.__put("clear_display")
+
+        # A flush queued before the clear would leave the text printed from now on unsent: the next print()
+        # queues a new one, after the clear.
+        self.__dirty = False
+
+    async def return_home(self) -> None:
+        """
+        Sets the cursor to the home position.
+
+        :return: None
+        """
+        self.__row = self.__col = 0
+        await self.__put("return_home")
+
+    async def display_on(self) -> None:
+        """
+        Turns on the display.
+
+        :return: None
+        """
+        await self.__put("display_on")
+
+    async def display_off(self) -> None:
+        """
+        Turns off the display.
+
+        :return: None
+        """
+        await self.__put("display_off")
+
+    async def display_cursor(self) -> None:
+        """
+        Shows the cursor on the display.
+
+        :return: None
+        """
+        await self.__put("display_cursor")
+
+    async def display_no_cursor(self) -> None:
+        """
+        Hides the cursor on the display.
+
+        :return: None
+        """
+        await self.__put("display_no_cursor")
+
+    async def cursor_blink(self) -> None:
+        """
+        Enables blinking cursor.
+
+        :return: None
+        """
+        await self.__put("cursor_blink")
+
+    async def cursor_no_blink(self) -> None:
+        """
+        Disables blinking cursor.
+
+        :return: None
+        """
+        await self.__put("cursor_no_blink")
+
+    async def left_to_right(self) -> None:
+        """
+        Moves the cursor to the right after each character (default).
+
+        :return: None
+        """
+        await self.__put("left_to_right")
+
+    async def right_to_left(self) -> None:
+        """
+        Moves the cursor to the left after each character.
+
+        :return: None
+        """
+        await self.__put("right_to_left")
+
+    async def autoscroll(self) -> None:
+        """
+        Shifts the entire display after each character, instead of moving the cursor.
+
+        :return: None
+        """
+        await self.__put("autoscroll")
+
+    async def no_autoscroll(self) -> None:
+        """
+        Moves the cursor after each character, without shifting the display (default).
+
+        :return: None
+        """
+        await self.__put("no_autoscroll")
+
+    async def display_shift_left(self) -> None:
+        """
+        Shifts the entire display to the left.
+
+        :return: None
+        """
+        await self.__put("display_shift_left")
+
+    async def display_shift_right(self) -> None:
+        """
+        Shifts the entire display to the right.
+
+        :return: None
+        """
+        await self.__put("display_shift_right")
+
+    async def cursor_shift_left(self) -> None:
+        """
+        Shifts the cursor position to the left.
+
+        :return: None
+        """
+        await self.__put("cursor_shift_left")
+
+    async def cursor_shift_right(self) -> None:
+        """
+        Shifts the cursor position to the right.
+
+        :return: None
+        """
+        await self.__put("cursor_shift_right")
+
+    async def backlight(self, *args) -> None:
+        """
+        Controls the backlight of the LCD, with the arguments of the backend's backlight().
+
+        :return: None
+        """
+        await self.__put("backlight", args)
+
+    async def custom_character(self, ram_addr: int, bit_map: tuple | list) -> None:
+        """
+        Defines a custom character at the specified CGRAM address with the given bit map.
+
+        :param ram_addr: The CGRAM address (0 to 7) where the character will be stored.
+        :param bit_map: The bit map representing the custom character.
+        :return: None
+        """
+        await self.__put("custom_character", (ram_addr, tuple(bit_map)))
+
+    async def set_cursor(self, row: int, col: int) -> None:
+        """
+        Sets the cursor to the specified row and column. Nothing is sent to the LCD.
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :raises IndexError: If invalid, row or column values are provided.
+        :return: None
+        """
+        if not (0 <= row < self.__lcd._row):
+            raise IndexError(f"Invalid row! 'row' must be in the range 0 to {self.__lcd._row - 1}.")
+
+        if not (0 <= col < self.__lcd._col):
+            raise IndexError(f"Invalid column! 'col' must be in the range 0 to {self.__lcd._col - 1}.")
+
+        self.__row = row
+        self.__col = col
+
+    async def print(self, data: any) -> None:
+        """
+        Writes the given data into the buffer at the cursor, and queues a flush.
+
+        :param data: The data to be printed (int, float, str, bytes, bytearray or memoryview).
+        :return: None
+        """
+        if self.__col < self.__lcd._col:
+            payload = self.__lcd._encode_text(data)
+            self.__buffer.write_at(self.__row, self.__col, payload)
+            self.__col = min(self.__col + len(payload), self.__lcd._col)
+
+        if not self.__dirty:
+            self.__dirty = True
+            await self.__put(None)
+
+
+# THE END
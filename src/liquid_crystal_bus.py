@@ -0,0 +1,259 @@
+import utime
+from micropython import const
+
+from .liquid_crystal_api import HD44780API
+from .transport import Transport
+
+# Register select flag of the nibble frames (see Transport.RS).
+_RS = const(0x10)
+
+
+class LiquidCrystal_Bus(HD44780API):
+    def __init__(
+        self,
+        transport: Transport,
+        row: int = 2,
+        col: int = 16,
+        font: int = HD44780API.FONT5X8,
+        busy_flag: bool = False,
+        warm: bool = False,
+    ) -> None:
+        """
+        Initialize an LCD in 4-bit mode, driven through a transport: a PCF8574 or MCP23017 I2C expander, or a
+        74HC595 shift register on SPI (see the transport_*.py modules).
+
+        Every byte is encoded as two nibble frames, and the frames of a whole print() or combined transfer are
+        handed to the transport at once, up to a screenful, so that each bus writes them in bulk. Moving an LCD
+        to another bus only changes the transport passed here.
+
+        With busy_flag enabled, clear_display and return_home poll the busy flag instead of sleeping for the
+        worst-case execution time, if the transport can read it back. Regular instructions need no wait, as the
+        transport covers their execution time.
+
+        With warm enabled, the LCD is assumed to be powered and configured already, e.g. after a soft reset of
+        the board: the power-on wait, the cleared screen and the display control are skipped, and only the 4-bit
+        interface is resynchronized before the function set and entry mode are written again. The backlight is
+        kept as read back, if the transport can read its outputs.
+
+        A 40x4 LCD has two controllers, sharing every line but EN: the transport must be created with the EN of
+        the second one, which drives rows 2 and 3.
+
+        :param transport: The transport the LCD is wired to.
+        :param row: Number of rows on the LCD (default is 2).
+        :param col: Number of columns on the LCD (default is 16).
+        :param font: Font size (default is 5x8).
+        :param busy_flag: Poll the busy flag instead of using timed delays (default is False).
+        :param warm: Attach to an already initialized LCD, keeping its contents (default is False).
+        :raises TypeError: If the transport is not a Transport.
+        :raises ValueError: If the LCD is 40x4 and the transport has no EN for the second controller.
+        """
+        super().__init__(row, col)
+
+        if not isinstance(transport, Transport):
+            raise TypeError("Invalid transport! 'transport' must be a Transport object.")
+
+        if transport.controllers < self._controllers:
+            raise ValueError("Invalid transport! A 40x4 LCD needs the EN of its second controller, see 'en2'.")
+
+        self.__transport: Transport = transport
+        self.__write_nibbles = transport.write_nibbles  # Bound method, called for every write.
+        self.__pair: bytearray = bytearray(2)  # Nibble frames of one byte.
+        self.__nibbles: bytearray = bytearray(2 * row * col)  # Nibble frames of a full screen of characters.
+        self.__view: memoryview = memoryview(self.__nibbles)
+        self.__busy_flag: bool = False  # Enabled by __init_lcd once the busy flag is known to be readable.
+
+        self.__font_size: int = font
+        self.__init_lcd(busy_flag, warm)  # Initialize the LCD.
+
+    def _send_instructions(self, data: int, rs: bool = False) -> None:
+        """
+        Send instructions to the LCD.
+
+        :param data: Instruction or data to be sent.
+        :param rs: Register Select (True for data, False for instruction).
+        :return: None
+        """
+        stats = self._stats
+        if stats is not None:
+            start: int = utime.ticks_us()
+
+        flag: int = _RS if rs else 0x00
+        pair: bytearray = self.__pair
+        pair[0] = flag | (data >> 4)
+        pair[1] = flag | (data & 0x0F)
+        self.__write_nibbles(pair)
+
+        if stats is not None:
+            transactions, nbytes = self.__transport.cost(2)
+            stats.record(rs, 1, transactions, nbytes, start)
+
+    def _write_data(self, payload: bytes | bytearray | memoryview) -> None:
+        """
+        Write a block of data bytes to the LCD, handing the transport a screenful of nibble frames at a time.
+
+        :param payload: The data bytes to be written.
+        :return: None
+        """
+        self._write_runs(((-1, payload),))
+
+    def _write_runs(self, runs: list) -> None:
+        """
+        Write blocks of data bytes to the LCD, each at its own DDRAM or CGRAM address.
+
+        The set address instructions and the data bytes of every run are encoded together, and handed to the
+        transport a screenful of nibble frames at a time.
+
+        :param runs: The (set DDRAM or CGRAM address instruction, data bytes) pairs to be written. _write_data()
+            passes -1 as the address, to write at the address counter.
+        :return: None
+        """
+        stats = self._stats
+        if stats is not None:
+            start: int = utime.ticks_us()
+
+        write_nibbles = self.__write_nibbles
+        buf: bytearray = self.__nibbles
+        view: memoryview = self.__view
+        size: int = len(buf)
+        offset: int = 0
+        count: int = 0
+        commands: int = 0
+
+        for address, payload in runs:
+            if address >= 0:
+                buf[offset] = address >> 4
+                buf[offset + 1] = address & 0x0F
+                offset += 2
+                commands += 1
+
+            for byte in payload:
+                # Flush the nibble buffer once it is full.
+                if offset == size:
+                    write_nibbles(buf)
+                    offset = 0
+
+                buf[offset] = _RS | (byte >> 4)
+                buf[offset + 1] = _RS | (byte & 0x0F)
+                offset += 2
+
+            count += len(payload)
+            if offset == size:
+                write_nibbles(buf)
+                offset = 0
+
+        if offset:
+            write_nibbles(view[:offset])
+
+        if stats is not None:
+            stats.commands += commands
+            transactions, nbytes = self.__transport.cost(2 * (count + commands))
+            stats.record(True, count, transactions, nbytes, start)
+
+    def _wait_ready(self, delay_us: int) -> None:
+        """
+        Wait until the controller has executed the previous instruction.
+
+        If the busy flag is still set after delay_us, it is assumed to be unreadable and the timed delays
+        are used from then on.
+
+        :param delay_us: Worst-case execution time of the previous instruction, in microseconds.
+        :return: None
+        """
+        if not self.__busy_flag:
+            utime.sleep_us(delay_us)
+
+            if self._stats is not None:
+                self._stats.wait_us += delay_us
+            return
+
+        read_status = self.__transport.read_status
+        start: int = utime.ticks_us()
+        while read_status() & 0x80:
+            if self._stats is not None:
+                self._stats.status_reads += 1
+
+            if utime.ticks_diff(utime.ticks_us(), start) > delay_us:
+                self.__busy_flag = False
+                break
+
+        if self._stats is not None:
+            self._stats.status_reads += 1
+            self._stats.wait_us += utime.ticks_diff(utime.ticks_us(), start)
+
+    def _select(self, controller: int) -> None:
+        """
+        Selects the controller receiving the next writes, by routing the enable strobes to its EN line.
+
+        :param controller: Index of the controller.
+        :return: None
+        """
+        self.__transport.select(controller)
+
+    def backlight(self, status: bool = False) -> None:
+        """
+        Control the backlight of the LCD.
+
+        :param status: Backlight status (True for ON, False for OFF).
+        :return: None
+        """
+        if not isinstance(status, bool):
+            raise ValueError("Backlight 'status' must be a boolean (True or False).")
+
+        self.__transport.set_backlight(status)
+
+    def __write_all(self, nibbles: bytes) -> None:
+        """
+        Writes nibble frames to every controller, so that they all execute them during the following wait.
+
+        :param nibbles: The nibble frames.
+        :return: None
+        """
+        for controller in range(self._controllers):
+            self._select(controller)
+            self.__write_nibbles(nibbles)
+
+        self._select(0)
+
+    def __init_lcd(self, busy_flag: bool = False, warm: bool = False) -> None:
+        """
+        Initialize the LCD by sending initialization commands.
+
+        Whether the LCD is in 8-bit mode, or in 4-bit mode waiting for either nibble, three 8-bit function sets
+        sent as single nibbles leave it in 8-bit mode. After a warm start, the first one may complete a pending
+        nibble, at worst as a return home, so its wait covers that execution time.
+
+        :param busy_flag: Poll the busy flag after the function set, if it can be read back.
+        :param warm: Only resynchronize the interface and restore the function set and entry mode.
+        :return: None
+        """
+        function_set: bytes = b"\x03"  # Function set (Interface is 8 bits long.)
+
+        if warm:
+            self.__transport.sync()
+        else:
+            utime.sleep_ms(50)  # Wait for more than 40 ms after VCC rises to 2.7 V.
+
+        self.__write_all(function_set)
+        utime.sleep_us(2000 if warm else 5000)  # Wait for more than 4.1 ms, or for a return home.
+        self.__write_all(function_set)
+        utime.sleep_us(100)  # Wait for more than 100 µs.
+        self.__write_all(function_set)
+        utime.sleep_us(100)
+        self.__write_all(bytes((0x02,)))  # Function set (Interface is 4 bits long.)
+        utime.sleep_us(100)
+
+        # Function set: 4-bit mode, display lines, font size.
+        self._write_function_set(self.__font_size)
+
+        # The busy flag can be checked once the interface length is set.
+        self.__busy_flag = busy_flag and self._probe_busy_flag(self.__transport.read_status)
+
+        if not warm:
+            self.display_on()  # Display control: Display on, cursor and blink off.
+            self.clear_display()  # Clear display.
+
+        # Entry mode set: Increment display, No shift.
+        self._write_entry_mode()
+
+
+# THE END
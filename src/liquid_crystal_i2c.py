@@ -1,119 +1,80 @@
-import utime
 from machine import I2C
 from micropython import const
 
-from .instructions import Instruction
-from .liquid_crystal_api import HD44780API
-from ..lib.PCF8574T import PCF8574T
+from .liquid_crystal_bus import LiquidCrystal_Bus
+from .transport import Transport
+from .transport_pcf8574 import PCF8574Transport
+
+
+class LiquidCrystal_I2C(LiquidCrystal_Bus):
+    # Expander pins of RW and BACKLIGHT, which may drive the EN of the second controller of a 40x4 LCD.
+    __RW, __BL = const((1, 3))
+
+    def __init__(
+        self,
+        port: I2C,
+        addr: int = 0x27,
+        row: int = 2,
+        col: int = 16,
+        font: int = LiquidCrystal_Bus.FONT5X8,
+        packed: bool = True,
+        busy_flag: bool = False,
+        warm: bool = False,
+        en2: int = -1,
+        freq: int = 100_000,
+    ) -> None:
+        """
+        Initialize the I2C-based LCD object, an LCD on a PCF8574 backpack driven through LiquidCrystal_Bus.
 
+        In packed mode (the default), the LCD is driven through a PCF8574Transport: every byte sent to the
+        LCD is encoded as its EN-high/EN-low nibble frames, and the frames of a whole print() are written with a
+        single I2C transaction. With packed mode disabled, every pin is driven individually through the PCF8574T
+        driver.
 
-class LiquidCrystal_I2C(HD44780API):
-    # Pin mapping for RS, RW, EN, and BACKLIGHT.
-    __RS, __RW, __EN, __BL = const((0, 1, 2, 3))
+        With busy_flag enabled in packed mode, clear_display and return_home poll the busy flag (DB7) through
+        RW instead of sleeping for the worst-case execution time. Regular instructions need no wait, as their
+        execution time is covered by the I2C transfer. If the flag cannot be read back during initialization,
+        the timed delays are used.
 
-    # Macro for Font size.
-    FONT5X8, FONT5X10 = const((Instruction.FONT5X8, Instruction.FONT5X10))
+        With warm enabled, the LCD is assumed to be powered and configured already, e.g. after a soft reset of
+        the board: the power-on wait, the cleared screen and the display control are skipped, and only the 4-bit
+        interface is resynchronized before the function set and entry mode are written again. The backlight is
+        kept as read back from the expander in packed mode.
 
-    def __init__(self, port: I2C, addr: int = 0x27, row: int = 2, col: int = 16, font: int = FONT5X8) -> None:
-        """
-        Initialize the I2C-based LCD object.
+        A 40x4 LCD has two controllers, sharing RS, RW and the data lines: en2 is the expander pin wired to the EN
+        of the second one, which drives rows 2 and 3. The backpack has no spare pin, so it is either RW (1), with
+        RW tied low and the busy flag unused, or the backlight pin (3), with the backlight wired on.
 
         :param port: I2C port for communication.
         :param addr: I2C address of the LCD.
         :param row: Number of rows on the LCD (default is 2).
         :param col: Number of columns on the LCD (default is 16).
         :param font: Font size (default is 5x8).
+        :param packed: Write whole nibble frames in one I2C transaction (default is True).
+        :param busy_flag: Poll the busy flag instead of using timed delays (default is False).
+        :param warm: Attach to an already initialized LCD, keeping its contents (default is False).
+        :param en2: Expander pin for the EN of the second controller of a 40x4 LCD, 1 (RW) or 3 (backlight),
+            -1 if none (default is -1).
+        :param freq: Clock of the I2C bus in Hz, above about 480 kHz the bytes are padded to cover the execution
+            time in packed mode (default is 100000).
         :raises TypeError: If the provided port is not a valid I2C object.
+        :raises ValueError: If en2 is invalid, or a 40x4 LCD has no en2.
         """
-        super().__init__(row, col)
-        self.__io_exp = PCF8574T(port, addr)  # GPIO Expander object.
-
-        # Set GPIO pins as output
-        for pin in range(self.__io_exp.PIN_MIN, self.__io_exp.PIN_MAX):
-            self.__io_exp.set_gpio_mode(pin, self.__io_exp.OUTPUT)
-
-        self.__num_row = Instruction.DISPLAY_2LINE if row >= 2 else Instruction.DISPLAY_1LINE
-        self.__font_size: int = font
-        self.__init_lcd()  # Initialize the LCD.
-
-    def __toggle_enable(self) -> None:
-        """
-        Toggle the Enable (EN) pin to execute the command.
-
-        :return: None
-        """
-        self.__io_exp.gpio_write(self.__EN, True)
-        utime.sleep_us(40)
-        self.__io_exp.gpio_write(self.__EN, False)
-
-    def __write_nibble(self, nibble: int) -> None:
-        """
-        Write a 4-bit nibble to the GPIO expander.
+        if en2 not in (-1, self.__RW, self.__BL):
+            raise ValueError("Invalid en2! 'en2' must be 1 (RW), 3 (backlight) or -1.")
 
-        :param nibble: The 4-bit nibble to be written.
-        :return: None
-        """
-        for pin, bit in enumerate(range(4), start=4):
-            self.__io_exp.gpio_write(pin, (nibble >> bit) & 0x01)
-
-        # Toggle to enable. To execute previously received data.
-        self.__toggle_enable()
-
-    def __send_instructions(self, data: int, rs: bool = False) -> None:
-        """
-        Send instructions to the LCD.
-
-        :param data: Instruction or data to be sent.
-        :param rs: Register Select (True for data, False for instruction).
-        :return: None
-        """
-        msb_data: int = (data >> 4) & 0x0F
-        lsb_data: int = data & 0x0F
-
-        # Set RS and RW signals.
-        self.__io_exp.gpio_write(self.__RS, rs)
-        self.__io_exp.gpio_write(self.__RW, False)  # RW: 0 (Write mode).
-
-        # Send high nibble (MSB) first, followed by low nibble (LSB).
-        self.__write_nibble(msb_data)
-        self.__write_nibble(lsb_data)
-
-    def backlight(self, status: bool = False) -> None:
-        """
-        Control the backlight of the LCD.
-
-        :param status: Backlight status (True for ON, False for OFF).
-        :return: None
-        """
-        if not isinstance(status, bool):
-            raise ValueError("Backlight 'status' must be a boolean (True or False).")
-
-        # Set the 3rd pin 'PB3' for the LCD backlight.
-        self.__io_exp.gpio_write(self.__BL, status)
-
-    def __init_lcd(self) -> None:
-        """
-        Initialize the LCD by sending initialization commands.
-
-        :return: None
-        """
-        # Wait for more than 40 ms after VCC rises to 2.7 V.
-        utime.sleep_ms(50)
-        self.__send_instructions(0x03)  # Function set (Interface is 8 bits long.)
-        utime.sleep_ms(5)  # Wait for more than 4.1 ms.
-        self.__send_instructions(0x03)  # Function set (Interface is 8 bits long.)
-        utime.sleep_us(100)  # Wait for more than 100 µs.
-        self.__send_instructions(0x03)  # Function set (Interface is 8 bits long.)
+        if row == 4 and col == 40 and en2 < 0:
+            raise ValueError("Invalid en2! A 40x4 LCD needs the expander pin wired to the EN of its second controller.")
 
-        # Function set: 4-bit mode, display lines, font size.
-        self.__send_instructions(Instruction.FUNCTION_SET >> 4)
-        self.__send_instructions(Instruction.FUNCTION_SET | Instruction.LEN_4BIT | self.__num_row | self.__font_size)
+        if packed:
+            # Frames of a full screen of characters per I2C transaction.
+            transport: Transport = PCF8574Transport(port, addr, buffer_size=4 * row * col, en2=en2, freq=freq)
+        else:
+            from .transport_pcf8574t import _PinTransport  # Only loads the PCF8574T driver when used.
 
-        self.display_on()  # Display control: Display on, cursor and blink off.
-        self.clear_display()  # Clear display.
+            transport = _PinTransport(port, addr, en2)
 
-        # Entry mode set: Increment display, No shift.
-        self.__send_instructions(Instruction.ENTRY_MODE_SET | Instruction.INCREMENT)
+        super().__init__(transport, row, col, font, busy_flag, warm)
 
 
 # THE END
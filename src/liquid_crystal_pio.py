@@ -0,0 +1,259 @@
+import array
+
+import rp2
+import utime
+from machine import Pin
+from micropython import const
+
+from .liquid_crystal_api import HD44780API
+
+# Writes one byte to the LCD per 16-bit FIFO word, shifted out from bit 0: RS (1 bit), high nibble (4 bits),
+# low nibble (4 bits) and the number of extra 16-cycle delays after the byte (7 bits). At 1 MHz, a byte takes
+# at least 39 µs from its last EN falling edge to the first one of the next byte, which covers the 37 µs
+# execution time; clear display and return home carry enough extra delays to cover 1.52 ms.
+@rp2.asm_pio(
+    set_init=rp2.PIO.OUT_LOW,
+    out_init=(rp2.PIO.OUT_LOW,) * 4,
+    sideset_init=rp2.PIO.OUT_LOW,
+    out_shiftdir=rp2.PIO.SHIFT_RIGHT,
+    autopull=True,
+    pull_thresh=16,
+    fifo_join=rp2.PIO.JOIN_TX,
+)
+def _hd44780_write():
+    wrap_target()
+    out(x, 1).side(0)  # RS
+    jmp(not_x, "command").side(0)
+    set(pins, 1).side(0)
+    jmp("nibbles").side(0)
+    label("command")
+    set(pins, 0).side(0)
+    label("nibbles")
+    out(pins, 4).side(0)  # High nibble.
+    nop().side(1)  # EN high for 1 µs.
+    nop().side(0)  # The high nibble is latched on the falling edge.
+    out(pins, 4).side(0)  # Low nibble.
+    nop().side(1)
+    out(y, 7).side(0)[15]  # Extra delays.
+    label("delay")
+    jmp(y_dec, "delay").side(0)[15]
+    wrap()
+
+
+class LiquidCrystal_PIO(HD44780API):
+    # Pin mapping for RS, RW, EN and D4.
+    __RS, __RW, __EN, __D4 = const((0, 1, 2, 3))
+
+    # Base addresses of PIO0 and PIO1, and offset of the TX FIFO of state machine 0.
+    __PIO_BASES: tuple = (0x50200000, 0x50300000)
+    __TXF0 = const(0x010)
+
+    # State machine clock (1 µs per cycle), and extra delays of clear display and return home (96 x 16 µs).
+    __FREQ = const(1_000_000)
+    __LONG_DELAY = const(95)
+
+    def __init__(
+        self,
+        gpio_list: tuple,
+        row: int = 2,
+        col: int = 16,
+        font: int = HD44780API.FONT5X8,
+        sm_id: int = 0,
+        dma: bool = True,
+    ) -> None:
+        """
+        Initializes an RP2040 interface to an HD44780-compatible LCD in 4-bit mode, with the RS, EN and data
+        waveforms generated by a PIO state machine.
+
+        Each byte is encoded as one FIFO word, which carries its own execution delay, so the state machine paces
+        the writes without polling or sleeping. With dma enabled, printed text is encoded into a preallocated
+        buffer and fed to the state machine by a DMA channel: print() returns as soon as the transfer is started,
+        and only waits if the previous transfer is still running.
+
+        The power-on sequence is bit-banged, as it needs single nibbles and millisecond waits; the state machine
+        takes over the pins once the LCD is in 4-bit mode. RW is held low, so the busy flag is not used.
+
+        :param gpio_list: GPIO pins for RS, RW, EN, and D4 to D7. D4 to D7 must be consecutive GPIOs.
+        :param row: Number of rows on the LCD (default is 2).
+        :param col: Number of columns on the LCD (default is 16).
+        :param font: Font size (default is 5x8).
+        :param sm_id: State machine number, 0 to 3 on PIO0 and 4 to 7 on PIO1 (default is 0).
+        :param dma: Feed printed text to the state machine with DMA (default is True).
+        :raises ValueError: If gpio_list does not hold 7 pins, D4 to D7 are not consecutive, or the LCD is 40x4.
+        """
+        super().__init__(row, col)
+
+        if self._controllers > 1:
+            raise ValueError("Invalid row! 40x4 LCDs have two controllers, use LiquidCrystal or LiquidCrystal_Bus.")
+
+        if len(gpio_list) != 7:
+            raise ValueError(f"Invalid GPIO list! Expected 7 GPIO pins, but received {len(gpio_list)} pins.")
+
+        d4: int = gpio_list[self.__D4]
+        if tuple(gpio_list[3:]) != tuple(range(d4, d4 + 4)):
+            raise ValueError("Invalid GPIO list! D4 to D7 must be consecutive GPIOs.")
+
+        self.__gpio_list: list[Pin] = [Pin(pin, Pin.OUT, value=0) for pin in gpio_list]
+        self.__font_size: int = font
+        self.__power_on()
+
+        self.__sm = rp2.StateMachine(
+            sm_id,
+            _hd44780_write,
+            freq=self.__FREQ,
+            set_base=self.__gpio_list[self.__RS],
+            out_base=self.__gpio_list[self.__D4],
+            sideset_base=self.__gpio_list[self.__EN],
+        )
+        self.__sm.active(1)
+
+        self.__tx_buf: array.array = array.array("H", bytearray(row * col))  # Words of a full screen.
+        self.__dma = None
+        if dma:
+            self.__dma = rp2.DMA()
+            self.__dma_ctrl: int = self.__dma.pack_ctrl(
+                size=1, inc_write=False, treq_sel=(sm_id // 4) * 8 + sm_id % 4  # Paced by DREQ_PIOx_TXy.
+            )
+            self.__txf: int = self.__PIO_BASES[sm_id // 4] + self.__TXF0 + 4 * (sm_id % 4)
+
+        self.__init_lcd()  # Initialize the LCD.
+
+    def __write_nibble(self, nibble: int) -> None:
+        """
+        Writes a single nibble as an instruction, by bit-banging D4 to D7 and EN.
+
+        :param nibble: The 4-bit nibble.
+        :return: None
+        """
+        for bit, pin in enumerate(self.__gpio_list[self.__D4 :]):
+            pin.value((nibble >> bit) & 0x01)
+
+        self.__gpio_list[self.__EN].value(True)
+        utime.sleep_us(1)
+        self.__gpio_list[self.__EN].value(False)
+
+    def __power_on(self) -> None:
+        """
+        Runs the power-on sequence up to the switch to 4-bit mode.
+
+        :return: None
+        """
+        # Wait for more than 40 ms after VCC rises to 2.7 V.
+        utime.sleep_ms(50)
+        self.__write_nibble(0x03)  # Function set (Interface is 8 bits long.)
+        utime.sleep_ms(5)  # Wait for more than 4.1 ms.
+        self.__write_nibble(0x03)  # Function set (Interface is 8 bits long.)
+        utime.sleep_us(100)  # Wait for more than 100 µs.
+        self.__write_nibble(0x03)  # Function set (Interface is 8 bits long.)
+        utime.sleep_us(100)
+        self.__write_nibble(0x02)  # Function set (Interface is 4 bits long.)
+        utime.sleep_us(100)
+
+    def __wait_dma(self) -> None:
+        """
+        Waits until the DMA channel has fed the last buffer to the state machine, so the buffer can be reused
+        and the next words follow it in the FIFO.
+
+        :return: None
+        """
+        while self.__dma is not None and self.__dma.active():
+            utime.sleep_us(40)  # About one byte.
+
+    def _send_instructions(self, data: int, rs: bool = False) -> None:
+        """
+        Sends instructions to the LCD.
+
+        :param data: Instruction or data to be sent.
+        :param rs: Register Select (True for data, False for instruction).
+        :return: None
+        """
+        stats = self._stats
+        if stats is not None:
+            start: int = utime.ticks_us()
+
+        # Clear display and return home (0x01 to 0x03) execute in 1.52 ms.
+        delay: int = self.__LONG_DELAY if not rs and 0 < data < 0x04 else 0
+
+        self.__wait_dma()
+        self.__sm.put((1 if rs else 0) | ((data & 0xF0) >> 3) | ((data & 0x0F) << 5) | (delay << 9))
+
+        if stats is not None:
+            stats.record(rs, 1, 1, 2, start)
+
+    def _write_data(self, payload: bytes | bytearray | memoryview) -> None:
+        """
+        Writes a block of data bytes to the LCD.
+
+        The bytes are encoded into the transmit buffer, one screenful at a time, and fed to the state machine
+        by DMA, or written to its FIFO by the CPU with dma disabled.
+
+        :param payload: The data bytes to be written.
+        :return: None
+        """
+        stats = self._stats
+        if stats is not None:
+            start: int = utime.ticks_us()
+
+        buf: array.array = self.__tx_buf
+        size: int = len(buf)
+        transfers: int = 0
+
+        for offset in range(0, len(payload), size):
+            count: int = min(size, len(payload) - offset)
+            self.__wait_dma()
+
+            for index in range(count):
+                byte: int = payload[offset + index]
+                buf[index] = 0x01 | ((byte & 0xF0) >> 3) | ((byte & 0x0F) << 5)  # RS: 1 -> Sending data.
+
+            if self.__dma is not None:
+                self.__dma.config(read=buf, write=self.__txf, count=count, ctrl=self.__dma_ctrl, trigger=True)
+            else:
+                self.__sm.put(buf if count == size else buf[:count])
+
+            transfers += 1
+
+        if stats is not None:
+            stats.record(True, len(payload), transfers, 2 * len(payload), start)
+
+    def _wait_ready(self, delay_us: int) -> None:
+        """
+        Nothing to wait for: the state machine delays the next write by the execution time of the previous one.
+
+        :param delay_us: Worst-case execution time of the previous instruction, in microseconds.
+        :return: None
+        """
+        pass
+
+    @staticmethod
+    def backlight(pin: int, status: bool) -> None:
+        """
+        Controls the backlight of the LCD.
+
+        :param pin: GPIO pin for backlight control.
+        :param status: Backlight status (True for ON, False for OFF).
+        :return: None
+        """
+        if not isinstance(status, bool):
+            raise ValueError("The backlight 'status' must be a boolean value (True or False).")
+
+        backlight: Pin = Pin(pin, Pin.OUT)  # Backlight object
+        backlight.value(status)
+
+    def __init_lcd(self) -> None:
+        """
+        Initializes the LCD, once the state machine drives it in 4-bit mode.
+
+        :return: None
+        """
+        # Function set: 4-bit mode, number of lines (rows), and font size.
+        self._write_function_set(self.__font_size)
+
+        self.display_on()  # Display control: Display on, cursor and blink off.
+        self.clear_display()  # Clear display.
+
+        # Entry mode set: Increment display, No shift.
+        self._write_entry_mode()
+
+
+# THE END
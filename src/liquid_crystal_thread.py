@@ -0,0 +1,456 @@
+import _thread
+
+import utime
+
+from .liquid_crystal_api import HD44780API
+
+
+class ThreadedLiquidCrystal:
+    def __init__(self, lcd: HD44780API, capacity: int = 32, poll_us: int = 200) -> None:
+        """
+        Initialize a wrapper that drives an LCD backend from a worker thread, on the second core of an RP2040.
+
+        The wrapper has the methods of HD44780API, with the same arguments: each call is put into a preallocated
+        ring buffer and returns at once, and the worker started with start() executes the calls in order. The
+        blocking parts of the backend, the enable pulses, the clear_display and return_home delays and the bus
+        transfers, then run on the other core, outside of the timing budget of the control loop.
+
+        The ring buffer has a single producer, the thread calling the wrapper, and a single consumer, the worker:
+        the producer only moves the head index once the slot is written, and the worker only moves the tail index
+        once the call is executed, so no lock is needed. Only one thread may call the wrapper. A slot holds the
+        name of the backend method and up to three arguments, in preallocated lists: the bound method is looked up
+        by the worker, and queuing a call allocates nothing but the copies of the caller's buffers. If the ring is
+        full, the call waits for the worker to free a slot, and is counted in queue_stats(): size the capacity for
+        the calls of a loop iteration.
+
+        The instrumentation methods of HD44780API are forwarded too: enable_stats(), disable_stats() and
+        reset_stats() are queued, and stats() reads the counters of the backend.
+
+        Text is converted and translated by the worker; bytearray and memoryview data is copied when queued, as
+        the caller may reuse its buffer. Helpers bound to the backend, e.g. a Layout, are run on the worker with
+        call().
+
+        An exception raised by a call on the worker is kept, and raised again by join().
+
+        :param lcd: The LCD backend to be driven.
+        :param capacity: Maximum number of queued calls (default is 32).
+        :param poll_us: Sleep of the idle worker, and of a waiting producer, in microseconds (default is 200).
+        :raises ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Invalid capacity! 'capacity' must be at least 1.")
+
+        self.__lcd: HD44780API = lcd
+        self.__size: int = capacity + 1  # One slot is kept free to tell a full ring from an empty one.
+
+        # Slots: the method name, or the function of call(), the number of arguments, 255 for the args and kwargs
+        # of call(), and the arguments.
+        self.__functions: list = [None] * self.__size
+        self.__argc: bytearray = bytearray(self.__size)
+        self.__arg0: list = [None] * self.__size
+        self.__arg1: list = [None] * self.__size
+        self.__arg2: list = [None] * self.__size
+        self.__head: int = 0  # Index of the slot written next, only moved by the producer.
+        self.__tail: int = 0  # Index of the slot executed next, only moved by the worker.
+        self.__poll_us: int = poll_us
+        self.__running: bool = False
+        self.__alive: bool = False  # The worker thread has not returned yet.
+        self.__error = None  # First exception raised by a call on the worker.
+        self.__stalls: int = 0
+        self.__high_water: int = 0
+
+    def __put(self, function, argc: int = 0, arg0=None, arg1=None, arg2=None) -> None:
+        """
+        Put a call into the ring buffer, waiting for a free slot if it is full.
+
+        :param function: The name of the backend method, or the function of call().
+        :param argc: Number of arguments, 0 to 3, or 255 for the args tuple and kwargs dict of call().
+        :param arg0: First argument, or the args of call().
+        :param arg1: Second argument, or the kwargs of call().
+        :param arg2: Third argument.
+        :raises RuntimeError: If the ring buffer is full while the worker is not running.
+        :return: None
+        """
+        head: int = self.__head
+        following: int = (head + 1) % self.__size
+        if following == self.__tail:
+            self.__stalls += 1
+            while following == self.__tail:
+                if not self.__alive:
+                    raise RuntimeError("Worker not running! Call start() before queuing more calls than 'capacity'.")
+                utime.sleep_us(self.__poll_us)
+
+        self.__functions[head] = function
+        self.__argc[head] = argc
+        self.__arg0[head] = arg0
+        self.__arg1[head] = arg1
+        self.__arg2[head] = arg2
+        self.__head = following  # Publishes the slot to the worker.
+
+        pending: int = (following - self.__tail) % self.__size
+        if pending > self.__high_water:
+            self.__high_water = pending
+
+    def __run(self) -> None:
+        """
+        Execute the queued calls, in order, until stopped and the ring buffer is empty.
+
+        :return: None
+        """
+        lcd: HD44780API = self.__lcd
+        functions: list = self.__functions
+        argc: bytearray = self.__argc
+        arg0: list = self.__arg0
+        arg1: list = self.__arg1
+        arg2: list = self.__arg2
+        size: int = self.__size
+
+        try:
+            while self.__running or self.__tail != self.__head:
+                tail: int = self.__tail
+                if tail == self.__head:
+                    utime.sleep_us(self.__poll_us)
+                    continue
+
+                function = functions[tail]
+                count: int = argc[tail]
+                try:
+                    if isinstance(function, str):
+                        function = getattr(lcd, function)  # Picks up the timed methods of enable_stats().
+
+                    if count == 0:
+                        function()
+                    elif count == 1:
+                        function(arg0[tail])
+                    elif count == 2:
+                        function(arg0[tail], arg1[tail])
+                    elif count == 3:
+                        function(arg0[tail], arg1[tail], arg2[tail])
+                    else:
+                        function(*arg0[tail], **arg1[tail])
+                except Exception as error:
+                    if self.__error is None:
+                        self.__error = error
+
+                # Releases the references held by the slot, e.g. the printed data.
+                functions[tail] = arg0[tail] = arg1[tail] = arg2[tail] = None
+                self.__tail = (tail + 1) % size  # Frees the slot for the producer.
+        finally:
+            self.__alive = False
+
+    def start(self) -> None:
+        """
+        Starts the worker thread executing the queued calls. On an RP2040, it runs on the second core.
+
+        :return: None
+        """
+        if self.__alive:
+            self.__running = True
+            return
+
+        self.__running = self.__alive = True
+        _thread.start_new_thread(self.__run, ())
+
+    def stop(self) -> None:
+        """
+        Stops the worker thread once it has executed every queued call, and waits for it to return.
+
+        :return: None
+        """
+        self.__running = False
+        while self.__alive:
+            utime.sleep_us(self.__poll_us)
+
+    def join(self) -> None:
+        """
+        Waits until the worker has executed every queued call.
+
+        :raises Exception: The first exception raised by a call on the worker since the last join(), if any.
+        :return: None
+        """
+        while self.__tail != self.__head and self.__alive:
+            utime.sleep_us(self.__poll_us)
+
+        error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def pending(self) -> int:
+        """
+        Returns the number of queued calls the worker has not executed yet.
+
+        :return: Number of calls.
+        """
+        return (self.__head - self.__tail) % self.__size
+
+    def queue_stats(self) -> dict:
+        """
+        Returns the queue counters: the calls that waited for a free slot, and the most calls queued at once.
+
+        :return: A dict with 'stalls' and 'high_water'.
+        """
+        return {"stalls": self.__stalls, "high_water": self.__high_water}
+
+    def enable_stats(self, slow_us: int = 0, callback=None) -> None:
+        """
+        Queues turning on the instrumentation counters of the backend, see HD44780API.enable_stats(). The callback
+        is called by the worker.
+
+        :param slow_us: Report public calls taking longer than this, in microseconds (0 to disable).
+        :param callback: Function called with the method name and its duration in microseconds.
+        :return: None
+        """
+        self.__put("enable_stats", 2, slow_us, callback)
+
+    def disable_stats(self) -> None:
+        """
+        Queues turning off the instrumentation counters of the backend.
+
+        :return: None
+        """
+        self.__put("disable_stats")
+
+    def stats(self) -> dict:
+        """
+        Returns the instrumentation counters of the backend, for the calls the worker has executed so far: call
+        join() first to count every queued call.
+
+        :return: A dict of counters, empty while disabled.
+        """
+        return self.__lcd.stats()
+
+    def reset_stats(self) -> None:
+        """
+        Queues resetting the instrumentation counters of the backend.
+
+        :return: None
+        """
+        self.__put("reset_stats")
+
+    def call(self, function, *args, **kwargs) -> None:
+        """
+        Queues a call of any function, executed by the worker in order with the LCD calls, e.g. the update() of
+        a helper bound to the backend.
+
+        :param function: The function to be called.
+        :param args: Arguments of the function.
+        :param kwargs: Keyword arguments of the function.
+        :return: None
+        """
+        self.__put(function, 255, args, kwargs)
+
+    def batch(self):
+        """
+        Returns the wrapper as a context manager: the calls made inside it are batched by the backend, see
+        HD44780API.batch().
+
+        :return: The wrapper.
+        """
+        return self
+
+    def __enter__(self):
+        """
+        Queues the start of the batch.
+
+        :return: The wrapper.
+        """
+        self.__put("__enter__")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Queues the end of the batch, which sends the recorded writes.
+
+        :param exc_type: Type of the exception raised in the block, if any.
+        :param exc_value: The exception raised in the block, if any.
+        :param traceback: Traceback of the exception, if any.
+        :return: None
+        """
+        self.__put("__exit__", 3, exc_type, exc_value, traceback)
+
+    def clear_display(self) -> None:
+        """
+        Clears the entire display.
+
+        :return: None
+        """
+        self.__put("clear_display")
+
+    def return_home(self) -> None:
+        """
+        Sets the cursor to the home position.
+
+        :return: None
+        """
+        self.__put("return_home")
+
+    def display_on(self) -> None:
+        """
+        Turns on the display.
+
+        :return: None
+        """
+        self.__put("display_on")
+
+    def display_off(self) -> None:
+        """
+        Turns off the display.
+
+        :return: None
+        """
+        self.__put("display_off")
+
+    def display_cursor(self) -> None:
+        """
+        Shows the cursor on the display.
+
+        :return: None
+        """
+        self.__put("display_cursor")
+
+    def display_no_cursor(self) -> None:
+        """
+        Hides the cursor on the display.
+
+        :return: None
+        """
+        self.__put("display_no_cursor")
+
+    def cursor_blink(self) -> None:
+        """
+        Enables blinking cursor.
+
+        :return: None
+        """
+        self.__put("cursor_blink")
+
+    def cursor_no_blink(self) -> None:
+        """
+        Disables blinking cursor.
+
+        :return: None
+        """
+        self.__put("cursor_no_blink")
+
+    def left_to_right(self) -> None:
+        """
+        Moves the cursor to the right after each character (default).
+
+        :return: None
+        """
+        self.__put("left_to_right")
+
+    def right_to_left(self) -> None:
+        """
+        Moves the cursor to the left after each character.
+
+        :return: None
+        """
+        self.__put("right_to_left")
+
+    def autoscroll(self) -> None:
+        """
+        Shifts the entire display after each character, instead of moving the cursor.
+
+        :return: None
+        """
+        self.__put("autoscroll")
+
+    def no_autoscroll(self) -> None:
+        """
+        Moves the cursor after each character, without shifting the display (default).
+
+        :return: None
+        """
+        self.__put("no_autoscroll")
+
+    def display_shift_left(self) -> None:
+        """
+        Shifts the entire display to the left.
+
+        :return: None
+        """
+        self.__put("display_shift_left")
+
+    def display_shift_right(self) -> None:
+        """
+        Shifts the entire display to the right.
+
+        :return: None
+        """
+        self.__put("display_shift_right")
+
+    def cursor_shift_left(self) -> None:
+        """
+        Shifts the cursor position to the left.
+
+        :return: None
+        """
+        self.__put("cursor_shift_left")
+
+    def cursor_shift_right(self) -> None:
+        """
+        Shifts the cursor position to the right.
+
+        :return: None
+        """
+        self.__put("cursor_shift_right")
+
+    def backlight(self, *args) -> None:
+        """
+        Controls the backlight of the LCD, with the arguments of the backend's backlight().
+
+        :return: None
+        """
+        self.__put("backlight", len(args), *args)
+
+    def set_charset(self, charset) -> None:
+        """
+        Sets the Charset translating the text printed from then on, or None to send it as-is.
+
+        :param charset: The Charset, or None.
+        :return: None
+        """
+        self.__put("set_charset", 1, charset)
+
+    def set_cursor(self, row: int, col: int) -> None:
+        """
+        Sets the cursor to the specified row and column.
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :raises IndexError: If invalid, row or column values are provided.
+        :return: None
+        """
+        if not (0 <= row < self.__lcd._row):
+            raise IndexError(f"Invalid row! 'row' must be in the range 0 to {self.__lcd._row - 1}.")
+
+        if not (0 <= col < self.__lcd._col):
+            raise IndexError(f"Invalid column! 'col' must be in the range 0 to {self.__lcd._col - 1}.")
+
+        self.__put("set_cursor", 2, row, col)
+
+    def print(self, data: any) -> None:
+        """
+        Prints the given data on the LCD.
+
+        :param data: The data to be printed (int, float, str, bytes, bytearray or memoryview).
+        :return: None
+        """
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+
+        self.__put("print", 1, data)
+
+    def custom_character(self, ram_addr: int, bit_map: tuple | list) -> None:
+        """
+        Defines a custom character at the specified CGRAM address with the given bit map.
+
+        :param ram_addr: The CGRAM address (0 to 7) where the character will be stored.
+        :param bit_map: The bit map representing the custom character.
+        :return: None
+        """
+        self.__put("custom_character", 2, ram_addr, tuple(bit_map))
+
+
+# THE END
@@ -0,0 +1,215 @@
+import utime
+from micropython import const
+
+from .liquid_crystal_api import HD44780API
+
+
+class RefreshScheduler:
+    # Priority classes, highest first.
+    ALARM, STATUS, DECORATIVE = const((0, 1, 2))
+
+    def __init__(self, lcd: HD44780API, fps: int = 10, bus_share: float = 0.25, byte_us: int = 400) -> None:
+        """
+        Initialize a refresh scheduler, which rate-limits the writes of many producers to one LCD.
+
+        Producers submit() text for a region, identified by its row and column, with a priority class. Between
+        two frames, only the latest text of each region is kept. Every tick(), at most fps times per second, the
+        pending regions are written in priority order, oldest first within a class, in one combined transfer.
+
+        The bus time of a frame is capped at bus_share of the frame period: the cost of each region is
+        predicted from the measured time per byte, and the regions that do not fit wait for the next frame.
+        A region longer than the whole budget is written a part per frame, at least a byte.
+
+        :param lcd: The LCD to be driven.
+        :param fps: Maximum number of frames per second (default is 10).
+        :param bus_share: Largest share of each frame period spent writing to the LCD, above 0 up to 1
+            (default is 0.25).
+        :param byte_us: Initial estimate of the bus time per byte written, refined by measurement (default is 400,
+            for a packed I2C LCD at 100 kHz).
+        :raises ValueError: If fps is less than 1, bus_share is out of range, or byte_us is less than 1.
+        """
+        if fps < 1:
+            raise ValueError("Invalid fps! 'fps' must be at least 1.")
+
+        if not 0 < bus_share <= 1:
+            raise ValueError("Invalid bus_share! 'bus_share' must be above 0, up to 1.")
+
+        if byte_us < 1:
+            raise ValueError("Invalid byte_us! 'byte_us' must be at least 1.")
+
+        self.__lcd: HD44780API = lcd
+        self.__frame_us: int = 1_000_000 // fps
+        self.__budget_us: int = int(self.__frame_us * bus_share)
+        self.__byte_us: int = byte_us
+        self.__last = None  # utime.ticks_us() of the last frame.
+        self.__running: bool = False
+
+        # Pending regions of each priority class, by (row, col): [payload, offset of the first unwritten byte].
+        self.__pending: tuple = ({}, {}, {})
+        self.__runs: list = []  # Runs of the frame being written, reused by every tick().
+
+        self.reset_stats()
+
+    def submit(self, row: int, col: int, data: any, priority: int = STATUS) -> None:
+        """
+        Queues text for a region, replacing the text still pending for the same region.
+
+        Text that does not fit on the row is clipped.
+
+        :param row: The row number (0-indexed).
+        :param col: The column number (0-indexed).
+        :param data: The data to be written (int, float, str, bytes, bytearray or memoryview).
+        :param priority: ALARM, STATUS or DECORATIVE (default is STATUS).
+        :raises ValueError: If the priority is invalid.
+        :raises IndexError: If invalid, row or column values are provided.
+        :return: None
+        """
+        lcd: HD44780API = self.__lcd
+
+        if priority not in (self.ALARM, self.STATUS, self.DECORATIVE):
+            raise ValueError("Invalid priority! 'priority' must be ALARM, STATUS or DECORATIVE.")
+
+        if not (0 <= row < lcd._row):
+            raise IndexError(f"Invalid row! 'row' must be in the range 0 to {lcd._row - 1}.")
+
+        if not (0 <= col < lcd._col):
+            raise IndexError(f"Invalid column! 'col' must be in the range 0 to {lcd._col - 1}.")
+
+        payload: bytes = bytes(lcd._encode_text(data)[: lcd._col - col])  # Copied, the caller may reuse its buffer.
+        region: tuple = (row, col)
+
+        for pending in self.__pending:
+            if pending.pop(region, None) is not None:
+                self.__superseded += 1
+
+        if payload:
+            self.__pending[priority][region] = [payload, 0]
+
+    def pending(self) -> int:
+        """
+        Returns the number of regions waiting to be written.
+
+        :return: The number of regions.
+        """
+        return sum(len(pending) for pending in self.__pending)
+
+    def tick(self, timer=None) -> int:
+        """
+        Writes a frame of pending regions, unless the previous frame is less than a frame period old.
+
+        :param timer: Ignored, so that tick can be used as a machine.Timer callback.
+        :return: Number of regions written in full.
+        """
+        now: int = utime.ticks_us()
+        if self.__last is not None and utime.ticks_diff(now, self.__last) < self.__frame_us:
+            return 0
+
+        self.__last = now
+        runs: list = self.__runs
+        runs.clear()
+        byte_us: int = self.__byte_us
+        spent: int = 0  # Predicted bus time of the frame.
+        nbytes: int = 0
+        written: int = 0
+        full: bool = False
+
+        for pending in self.__pending:
+            done: list = []
+
+            for region, entry in pending.items():
+                payload, offset = entry
+                count: int = len(payload) - offset
+                room: int = (self.__budget_us - spent) // byte_us - 1  # Data bytes fitting after the address.
+
+                if room < count:
+                    full = True
+                    if room < 1:
+                        if runs:
+                            break
+                        room = 1  # At least a byte per frame, whose measured time corrects the estimate.
+                    count = room
+
+                row, col = region
+                addr: int = self.__lcd._address(row, col + offset)
+                runs.append((addr, memoryview(payload)[offset : offset + count]))
+                spent += (count + 1) * byte_us
+                nbytes += count + 1
+
+                if offset + count == len(payload):
+                    done.append(region)
+                else:
+                    entry[1] = offset + count
+
+                if full:
+                    break
+
+            for region in done:
+                del pending[region]
+            written += len(done)
+
+            if full:
+                break
+
+        if runs:
+            start: int = utime.ticks_us()
+            self.__lcd._write_cells(runs)
+            elapsed: int = utime.ticks_diff(utime.ticks_us(), start)
+
+            # Moving average of the measured time per byte.
+            self.__byte_us = max((3 * byte_us + elapsed // nbytes) // 4, 1)
+            self.__bus_us += elapsed
+            self.__frames += 1
+
+        self.__deferred += self.pending()
+        return written
+
+    async def run(self) -> None:
+        """
+        Ticks every frame period, until stop() is called.
+
+        :return: None
+        """
+        try:
+            import asyncio
+        except ImportError:
+            import uasyncio as asyncio
+
+        self.__running = True
+        while self.__running:
+            self.tick()
+            await asyncio.sleep(self.__frame_us / 1_000_000)
+
+    def stop(self) -> None:
+        """
+        Ends run() after its current frame.
+
+        :return: None
+        """
+        self.__running = False
+
+    def stats(self) -> dict:
+        """
+        Returns the scheduler figures since initialization or the last reset_stats().
+
+        :return: A dict with 'frames' written, 'superseded' updates replaced before being written, 'deferred'
+            regions left pending at the end of a frame (summed over frames), 'bus_us' spent writing, and 'byte_us',
+            the current estimate of the bus time per byte.
+        """
+        return {
+            "frames": self.__frames,
+            "superseded": self.__superseded,
+            "deferred": self.__deferred,
+            "bus_us": self.__bus_us,
+            "byte_us": self.__byte_us,
+        }
+
+    def reset_stats(self) -> None:
+        """
+        Resets the scheduler figures.
+
+        :return: None
+        """
+        self.__frames = self.__superseded = self.__deferred = self.__bus_us = 0
+
+
+# THE END
@@ -0,0 +1,230 @@
+from .display_buffer import DisplayBuffer
+from .liquid_crystal_api import HD44780API
+
+
+class Ticker:
+    def __init__(self, lcd: HD44780API, buffer: DisplayBuffer = None, interval_ms: int = 300) -> None:
+        """
+        Initialize a scrolling text engine, stepped by a timer or an asyncio task.
+
+        In hardware mode, load() writes up to 40 characters per line into the DDRAM once, including the cells
+        off screen, and each step is a single display shift instruction. The shift moves every row at once,
+        and only suits 1 and 2 row LCDs, as rows 3 and 4 are the continuation of the DDRAM lines of rows 1
+        and 2.
+
+        In software mode, marquee() scrolls a window of text over part of a row through the DisplayBuffer,
+        so each step only sends the cells that changed, and every row scrolls on its own.
+
+        :param lcd: The LCD to be driven.
+        :param buffer: DisplayBuffer of the LCD, required for marquees (default is None).
+        :param interval_ms: Time between steps when run as an asyncio task (default is 300).
+        :raises ValueError: If interval_ms is less than 1.
+        """
+        if interval_ms < 1:
+            raise ValueError("Invalid interval_ms! 'interval_ms' must be at least 1.")
+
+        self.__lcd: HD44780API = lcd
+        self.__buffer: DisplayBuffer = buffer
+        self.__interval_ms: int = interval_ms
+        self.__running: bool = False
+
+        # Hardware mode: length of the DDRAM lines, shift direction (0 while unloaded) and display shift.
+        self.__line_len: int = 40 if lcd._row == 2 else 80
+        self.__direction: int = 0
+        self.__offset: int = 0
+
+        # Software mode, by row: [col, text, window, position, every, countdown].
+        self.__marquees: dict = {}
+
+    def offset(self) -> int:
+        """
+        Returns the number of cells the display is shifted to the left by, in hardware mode.
+
+        :return: The display shift, in the range of 0 to the DDRAM line length - 1.
+        """
+        return self.__offset
+
+    def load(self, lines: tuple | list, direction: int = -1) -> None:
+        """
+        Writes the lines into the DDRAM, and starts scrolling them with the display shift.
+
+        Each line is padded with spaces to the full DDRAM line, so the text scrolls around seamlessly.
+
+        :param lines: Text of each row, at most 40 characters each (80 on a 1 row LCD).
+        :param direction: -1 to scroll to the left, 1 to scroll to the right (default is -1).
+        :raises ValueError: If the LCD has 4 rows, marquees are running, or a line is too long.
+        :raises IndexError: If there are more lines than rows.
+        :return: None
+        """
+        if self.__lcd._row > 2:
+            raise ValueError("Invalid LCD! The display shift only scrolls 1 or 2 row LCDs.")
+
+        if self.__marquees:
+            raise ValueError("Invalid mode! The display shift would move the marquees; remove them first.")
+
+        if len(lines) > self.__lcd._row:
+            raise IndexError(f"Invalid lines! At most {self.__lcd._row} lines can be loaded.")
+
+        payloads: list = [self.__lcd._encode_text(line) for line in lines]
+        for payload in payloads:
+            if len(payload) > self.__line_len:
+                raise ValueError(f"Invalid line! At most {self.__line_len} characters fit in a DDRAM line.")
+
+        self.__lcd.return_home()  # Undo any display shift.
+
+        # Both lines in one combined transfer, which also lets the driver track the cursor it leaves.
+        runs: list = []
+        for row, payload in enumerate(payloads):
+            line: bytearray = bytearray(b" " * self.__line_len)
+            line[: len(payload)] = payload
+            runs.append((self.__lcd._address(row, 0), line))
+
+        self.__lcd._write_cells(runs)
+
+        self.__direction = -1 if direction < 0 else 1
+        self.__offset = 0
+
+    def unload(self) -> None:
+        """
+        Stops the hardware scrolling, and undoes the display shift. The DisplayBuffer, if any, is invalidated,
+        so its next flush() redraws the screen.
+
+        :return: None
+        """
+        if not self.__direction:
+            return
+
+        self.__direction = 0
+        self.__offset = 0
+        self.__lcd.return_home()
+
+        if self.__buffer is not None:
+            self.__buffer.invalidate()
+
+    def marquee(self, row: int, text: any, col: int = 0, width: int = 0, gap: int = 3, every: int = 1) -> None:
+        """
+        Scrolls text to the left through a window of a row, replacing any marquee of the row.
+
+        Text that fits in the window is shown as-is, and does not scroll.
+
+        :param row: The row number (0-indexed).
+        :param text: The data to be scrolled (int, float, str, bytes, bytearray or memoryview).
+        :param col: The column of the first cell of the window (default is 0).
+        :param width: Number of cells of the window, 0 for the rest of the row (default is 0).
+        :param gap: Number of spaces between the end of the text and its next start (default is 3).
+        :param every: Number of steps between two moves, to scroll rows at different speeds (default is 1).
+        :raises ValueError: If there is no DisplayBuffer, the display shift is in use, or every is less than 1.
+        :raises IndexError: If invalid, row, column or width values are provided.
+        :return: None
+        """
+        if self.__buffer is None:
+            raise ValueError("Invalid mode! Marquees are drawn through a DisplayBuffer; pass one to Ticker().")
+
+        if self.__direction:
+            raise ValueError("Invalid mode! The display shift is in use; unload() it first.")
+
+        if every < 1:
+            raise ValueError("Invalid every! 'every' must be at least 1.")
+
+        if not (0 <= row < self.__lcd._row):
+            raise IndexError(f"Invalid row! 'row' must be in the range 0 to {self.__lcd._row - 1}.")
+
+        if not (0 <= col < self.__lcd._col):
+            raise IndexError(f"Invalid column! 'col' must be in the range 0 to {self.__lcd._col - 1}.")
+
+        width = width or self.__lcd._col - col
+        if not (0 < width <= self.__lcd._col - col):
+            raise IndexError(f"Invalid width! 'width' must be in the range 1 to {self.__lcd._col - col}.")
+
+        payload = self.__lcd._encode_text(text)
+        if len(payload) > width:
+            payload = bytes(payload) + b" " * gap
+
+        window: bytearray = bytearray(b" " * width)
+        self.__marquees[row] = [col, payload, window, 0, every, 0]
+        self.__draw(row)
+        self.__buffer.flush_row(row)
+
+    def remove(self, row: int) -> None:
+        """
+        Stops the marquee of a row. Its last window stays in the buffer.
+
+        :param row: The row number (0-indexed).
+        :return: None
+        """
+        self.__marquees.pop(row, None)
+
+    def __draw(self, row: int) -> None:
+        """
+        Write the window of a marquee into the buffer, at its current position.
+
+        :param row: The row number (0-indexed).
+        :return: None
+        """
+        col, text, window, position, _, _ = self.__marquees[row]
+        length: int = len(text)
+
+        if length <= len(window):
+            window[:length] = text
+            for index in range(length, len(window)):
+                window[index] = 0x20
+        else:
+            for index in range(len(window)):
+                window[index] = text[(position + index) % length]
+
+        self.__buffer.write_at(row, col, window)
+
+    def step(self, timer=None) -> None:
+        """
+        Scrolls everything by one cell: shifts the display in hardware mode, or moves the marquees that are due
+        and flushes their rows.
+
+        :param timer: Ignored, so that step can be used as a machine.Timer callback.
+        :return: None
+        """
+        if self.__direction < 0:
+            self.__lcd.display_shift_left()
+        elif self.__direction > 0:
+            self.__lcd.display_shift_right()
+
+        if self.__direction:
+            self.__offset = (self.__offset - self.__direction) % self.__line_len
+
+        for row, marquee in self.__marquees.items():
+            # Steps left before the next move.
+            if marquee[5] > 0:
+                marquee[5] -= 1
+                continue
+
+            marquee[5] = marquee[4] - 1
+            if len(marquee[1]) > len(marquee[2]):
+                marquee[3] = (marquee[3] + 1) % len(marquee[1])
+                self.__draw(row)
+                self.__buffer.flush_row(row)
+
+    async def run(self) -> None:
+        """
+        Steps every interval_ms, until stop() is called.
+
+        :return: None
+        """
+        try:
+            import asyncio
+        except ImportError:
+            import uasyncio as asyncio
+
+        self.__running = True
+        while self.__running:
+            self.step()
+            await asyncio.sleep(self.__interval_ms / 1000)
+
+    def stop(self) -> None:
+        """
+        Ends run() after its current step.
+
+        :return: None
+        """
+        self.__running = False
+
+
+# THE END
@@ -0,0 +1,213 @@
+import struct
+
+import utime
+from micropython import const
+
+from .liquid_crystal_api import HD44780API
+
+# Record kinds, in the first byte of each record.
+_INSTRUCTION = const(0)
+_DATA = const(1)
+_WAIT = const(2)
+_SELECT = const(3)
+
+
+class TraceRecorder:
+    # Trace file header: magic, version, rows, columns, controllers, number of records and records overwritten.
+    HEADER: str = "<4sBBBBII"
+    MAGIC: bytes = b"LCDT"
+    VERSION = const(2)
+
+    # Bytes per record: the kind, one byte holding the instruction, data byte, wait in 16 µs units or controller,
+    # then the µs since the previous record on two bytes, little-endian.
+    RECORD_SIZE = const(4)
+
+    def __init__(self, lcd: HD44780API, capacity: int = 1024) -> None:
+        """
+        Initialize a recorder of the instructions, data bytes and waits an LCD driver sends to its backend.
+
+        While started, every write is stored as a 4-byte record in a preallocated ring buffer, the oldest records
+        being overwritten once it is full: the kind (instruction, data, wait or controller selection), the byte,
+        the requested wait in 16 µs units or the controller selected, and the time since the previous record in
+        microseconds, saturated at 65535. dump() writes the records to a file, for the host replayer in sim/trace.py
+        to rebuild the screens and compute statistics.
+
+        On a 40x4 LCD, the selections of the controller receiving the writes are recorded too, and the records
+        that follow are replayed on that controller.
+
+        Writes are recorded as the driver hands them to the backend, after the optimizations of batch(). Start and
+        stop the recorder outside of batch() blocks.
+
+        :param lcd: The LCD to be traced.
+        :param capacity: Number of records kept (default is 1024).
+        :raises ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Invalid capacity! 'capacity' must be at least 1.")
+
+        self.__lcd: HD44780API = lcd
+        self.__buf: bytearray = bytearray(self.RECORD_SIZE * capacity)
+        self.__capacity: int = capacity
+        self.__next: int = 0  # Index of the record written next.
+        self.__count: int = 0
+        self.__dropped: int = 0
+        self.__last: int = 0  # utime.ticks_us() of the previous record.
+        self.__depth: int = 0  # Nesting of the hooks, so only the outermost call is recorded.
+        self.__hooks = None  # Hooks of the LCD wrapped while started.
+
+    def __record(self, kind: int, value: int) -> None:
+        """
+        Append a record to the ring buffer.
+
+        :param kind: _INSTRUCTION, _DATA, _WAIT or _SELECT.
+        :param value: The instruction, data byte, wait in 16 µs units or controller.
+        :return: None
+        """
+        now: int = utime.ticks_us()
+        delta: int = min(utime.ticks_diff(now, self.__last), 0xFFFF) if self.__count or self.__dropped else 0
+        self.__last = now
+
+        buf: bytearray = self.__buf
+        offset: int = self.RECORD_SIZE * self.__next
+        buf[offset] = kind
+        buf[offset + 1] = value
+        buf[offset + 2] = delta & 0xFF
+        buf[offset + 3] = delta >> 8
+
+        self.__next = (self.__next + 1) % self.__capacity
+        if self.__count < self.__capacity:
+            self.__count += 1
+        else:
+            self.__dropped += 1
+
+    def start(self) -> None:
+        """
+        Starts recording, by wrapping the write hooks of the LCD.
+
+        :return: None
+        """
+        if self.__hooks is not None:
+            return
+
+        lcd: HD44780API = self.__lcd
+        self.__hooks = (lcd._send_instructions, lcd._write_data, lcd._write_runs, lcd._wait_ready, lcd._select)
+        send_instructions, write_data, write_runs, wait_ready, select = self.__hooks
+
+        def traced_send_instructions(data: int, rs: bool = False) -> None:
+            if not self.__depth:
+                self.__record(_DATA if rs else _INSTRUCTION, data)
+            self.__depth += 1
+            try:
+                send_instructions(data, rs)
+            finally:
+                self.__depth -= 1
+
+        def traced_write_data(payload: bytes | bytearray | memoryview) -> None:
+            if not self.__depth:
+                for byte in payload:
+                    self.__record(_DATA, byte)
+            self.__depth += 1
+            try:
+                write_data(payload)
+            finally:
+                self.__depth -= 1
+
+        def traced_write_runs(runs: list) -> None:
+            if not self.__depth:
+                for address, payload in runs:
+                    self.__record(_INSTRUCTION, address)
+                    for byte in payload:
+                        self.__record(_DATA, byte)
+            self.__depth += 1
+            try:
+                write_runs(runs)
+            finally:
+                self.__depth -= 1
+
+        def traced_wait_ready(delay_us: int) -> None:
+            if not self.__depth:
+                self.__record(_WAIT, min((delay_us + 15) >> 4, 0xFF))
+            self.__depth += 1
+            try:
+                wait_ready(delay_us)
+            finally:
+                self.__depth -= 1
+
+        def traced_select(controller: int) -> None:
+            if not self.__depth:
+                self.__record(_SELECT, controller)
+            self.__depth += 1
+            try:
+                select(controller)
+            finally:
+                self.__depth -= 1
+
+        lcd._send_instructions = traced_send_instructions
+        lcd._write_data = traced_write_data
+        lcd._write_runs = traced_write_runs
+        lcd._wait_ready = traced_wait_ready
+        lcd._select = traced_select
+
+    def stop(self) -> None:
+        """
+        Stops recording, and restores the write hooks of the LCD. The records are kept.
+
+        :return: None
+        """
+        if self.__hooks is None:
+            return
+
+        lcd: HD44780API = self.__lcd
+        lcd._send_instructions, lcd._write_data, lcd._write_runs, lcd._wait_ready, lcd._select = self.__hooks
+        self.__hooks = None
+
+    def clear(self) -> None:
+        """
+        Discards the records.
+
+        :return: None
+        """
+        self.__next = self.__count = self.__dropped = 0
+
+    def records(self) -> int:
+        """
+        Returns the number of records held.
+
+        :return: Number of records, at most the capacity.
+        """
+        return self.__count
+
+    def dropped(self) -> int:
+        """
+        Returns the number of records overwritten since the last clear().
+
+        :return: Number of records overwritten.
+        """
+        return self.__dropped
+
+    def dump(self, file) -> None:
+        """
+        Writes the header and the records, oldest first, to a file.
+
+        :param file: The file name, or a stream with a write() method.
+        :return: None
+        """
+        if isinstance(file, str):
+            with open(file, "wb") as stream:
+                self.dump(stream)
+            return
+
+        lcd: HD44780API = self.__lcd
+        header: bytes = struct.pack(
+            self.HEADER, self.MAGIC, self.VERSION, lcd._row, lcd._col, lcd._controllers, self.__count, self.__dropped
+        )
+        file.write(header)
+
+        view: memoryview = memoryview(self.__buf)
+        split: int = self.RECORD_SIZE * (self.__next if self.__count == self.__capacity else 0)
+        end: int = self.RECORD_SIZE * self.__count
+        file.write(view[split:end])
+        file.write(view[:split])
+
+
+# THE END
@@ -0,0 +1,242 @@
+from micropython import const
+
+# Register select flag of the nibble frames.
+_RS = const(0x10)
+
+# Execution time of regular instructions, in microseconds.
+_EXEC_US = const(37)
+
+
+class Transport:
+    # Register select flag of the nibble frames passed to write_nibbles(): bits 0 to 3 hold D4 to D7.
+    RS = const(_RS)
+
+    # Number of controllers with an enable line, 2 for a 40x4 LCD wired with the EN of its second one.
+    controllers: int = 1
+
+    def write_nibbles(self, nibbles: bytes | bytearray | memoryview) -> None:
+        """
+        Placeholder method for writing nibble frames to the LCD, one enable strobe each, in a single bulk
+        transfer where the bus allows.
+
+        This method must be implemented by subclasses. Bytes are written as two frames, high nibble first, and
+        the transport leaves the controller the 37 µs execution time of regular instructions after each pair of
+        frames.
+
+        :param nibbles: The nibble frames: D4 to D7 in bits 0 to 3, and RS in bit 4.
+        :return: None
+        """
+        pass
+
+    def read_status(self) -> int:
+        """
+        Reads the busy flag and address counter (RS: 0, RW: 1) of an LCD in 4-bit mode.
+
+        :return: The busy flag (bit 7) and the address counter (bits 0 to 6), -1 if RW is not wired.
+        """
+        return -1
+
+    def set_backlight(self, status: bool) -> None:
+        """
+        Placeholder method for switching the backlight, kept by transports without a backlight line.
+
+        :param status: Backlight status (True for ON, False for OFF).
+        :return: None
+        """
+        pass
+
+    def select(self, controller: int) -> None:
+        """
+        Placeholder method for routing the enable strobes to the EN line of a controller, kept by transports
+        wired to a single one.
+
+        :param controller: Index of the controller, 0 for rows 0 and 1, 1 for rows 2 and 3.
+        :return: None
+        """
+        pass
+
+    def sync(self) -> None:
+        """
+        Placeholder method for reading back the outputs on a warm start, so that the backlight is kept as it is,
+        kept by transports that cannot read them.
+
+        :return: None
+        """
+        pass
+
+    def cost(self, count: int) -> tuple:
+        """
+        Returns the bus operations write_nibbles() takes for a number of frames, for the instrumentation counters.
+
+        :param count: Number of nibble frames.
+        :return: The number of bus transactions and the number of bytes written.
+        """
+        return count, count
+
+
+class _PortTransport(Transport):
+    # Port bits of RS, RW, EN, the backlight and D4 to D7 on the usual LCD backpacks.
+    PINS: tuple = (0, 1, 2, 3, 4, 5, 6, 7)
+
+    def __init__(self, pins: tuple, buffer_size: int, head: int = 0, en2: int = -1, freq: int = 0) -> None:
+        """
+        Initialize the encoding of nibble frames to the values of an 8-bit output port wired to the LCD.
+
+        Every frame is written as two port values, with EN high then low; the controller latches the data lines
+        on the falling edge.
+
+        On an I2C bus, each port value takes 9 clock cycles, and the two values of the next frame must cover the
+        37 µs execution time of a byte: up to about 480 kHz they do. Above, the port values of the frames are
+        sent in a single transaction, where no sleep fits, so the idle port value is repeated after each byte
+        for the difference.
+
+        The port has no spare bit for the EN of the second controller of a 40x4 LCD: en2 is either the RW bit,
+        with RW tied low and the busy flag unreadable, or the backlight bit, with the backlight wired on.
+
+        :param pins: Port bits of RS, RW, EN, the backlight and D4 to D7.
+        :param buffer_size: Bytes of port values written per bus transfer.
+        :param head: Bytes reserved at the start of the transmit buffer, e.g. for a register address.
+        :param en2: Port bit of the EN of a second controller, the RW or backlight bit, -1 if none.
+        :param freq: Clock of the I2C bus in Hz, 0 if the transport waits for the execution time itself.
+        :raises ValueError: If pins does not hold 8 distinct bits of 0 to 7, buffer_size is less than 4, or en2
+            is invalid.
+        """
+        if len(pins) != 8 or sorted(pins) != list(range(8)):
+            raise ValueError("Invalid pins! 'pins' must hold the port bits 0 to 7 of RS, RW, EN, BL and D4 to D7.")
+
+        if buffer_size < 4:
+            raise ValueError("Invalid buffer_size! 'buffer_size' must be at least 4.")
+
+        if en2 not in (-1, pins[1], pins[3]):
+            raise ValueError("Invalid en2! 'en2' must be the port bit of RW or of the backlight, or -1.")
+
+        self._rs_mask: int = 1 << pins[0]
+        self._rw_mask: int = 1 << pins[1]
+        self._en_masks: tuple = (1 << pins[2],) + ((1 << en2,) if en2 >= 0 else ())  # EN bit of each controller.
+        self._en_mask: int = self._en_masks[0]
+        self._bl_mask: int = 0 if en2 == pins[3] else 1 << pins[3]
+        self._readable: bool = en2 != pins[1]  # RW drives a controller's EN instead.
+        self.controllers = len(self._en_masks)
+        self._data_bits: tuple = pins[4:]
+        self._data_mask: int = sum(1 << bit for bit in self._data_bits)
+
+        # Port value of each nibble frame, EN and the backlight aside.
+        self._ports: bytes = bytes(
+            (self._rs_mask if frame & _RS else 0)
+            | sum(((frame >> index) & 0x01) << bit for index, bit in enumerate(self._data_bits))
+            for frame in range(2 * _RS)
+        )
+
+        self._backlight: int = 0  # Backlight bit of every port value written.
+        self._state: int = 0x00  # Shadow of the output port.
+        # Idle port values written after each byte, for the execution time the next frame does not cover.
+        self._pad: int = max((_EXEC_US * freq + 8_999_999) // 9_000_000 - 2, 0)
+
+        # Whole bytes only: 4 port values and the padding each.
+        unit: int = 4 + self._pad
+        self._head: int = head
+        self._tx_buf: bytearray = bytearray(head + max(buffer_size // unit, 1) * unit)
+        self._tx_view: memoryview = memoryview(self._tx_buf)
+
+    def _write_port(self, end: int) -> None:
+        """
+        Placeholder method for writing the port values of the transmit buffer, from the head to end, in one bus
+        transfer.
+
+        This method must be implemented by subclasses.
+
+        :param end: Index in the transmit buffer following the last port value.
+        :return: None
+        """
+        pass
+
+    def write_nibbles(self, nibbles: bytes | bytearray | memoryview) -> None:
+        """
+        Writes nibble frames to the LCD, one bus transfer per transmit buffer of port values.
+
+        :param nibbles: The nibble frames: D4 to D7 in bits 0 to 3, and RS in bit 4.
+        :return: None
+        """
+        buf: bytearray = self._tx_buf
+        ports: bytes = self._ports
+        size: int = len(buf)
+        head: int = self._head
+        backlight: int = self._backlight
+        enable: int = self._en_mask
+        pad: int = self._pad
+        offset: int = head
+        port: int = self._state
+        second: bool = False  # The frame is the low nibble of a byte.
+
+        for frame in nibbles:
+            port = ports[frame & 0x1F] | backlight
+            buf[offset] = port | enable
+            buf[offset + 1] = port
+            offset += 2
+
+            if pad:
+                if second:
+                    end: int = offset + pad
+                    while offset < end:
+                        buf[offset] = port
+                        offset += 1
+                second = not second
+
+            # Flush the transmit buffer once it is full.
+            if offset == size:
+                self._write_port(offset)
+                offset = head
+
+        if offset > head:
+            self._write_port(offset)
+
+        self._state = port
+
+    def set_backlight(self, status: bool) -> None:
+        """
+        Switches the backlight, by writing the port with its backlight bit updated.
+
+        :param status: Backlight status (True for ON, False for OFF).
+        :return: None
+        """
+        self._backlight = self._bl_mask if status else 0
+        self._state = (self._state & ~self._bl_mask) | self._backlight
+        self._tx_buf[self._head] = self._state
+        self._write_port(self._head + 1)
+
+    def select(self, controller: int) -> None:
+        """
+        Routes the enable strobes to the EN bit of a controller.
+
+        :param controller: Index of the controller.
+        :return: None
+        """
+        self._en_mask = self._en_masks[controller]
+
+    def _nibble(self, port: int) -> int:
+        """
+        Extracts D4 to D7 from a port value read back.
+
+        :param port: The port value.
+        :return: The nibble.
+        """
+        nibble: int = 0
+        for index, bit in enumerate(self._data_bits):
+            nibble |= ((port >> bit) & 0x01) << index
+
+        return nibble
+
+    def cost(self, count: int) -> tuple:
+        """
+        Returns the bus operations write_nibbles() takes for a number of frames.
+
+        :param count: Number of nibble frames.
+        :return: The number of bus transactions and the number of bytes written.
+        """
+        per_transfer: int = len(self._tx_buf) - self._head
+        values: int = 2 * count + self._pad * (count // 2)
+        transactions: int = (values + per_transfer - 1) // per_transfer
+        return transactions, values + self._head * transactions
+
+
+# THE END
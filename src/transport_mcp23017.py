@@ -0,0 +1,104 @@
+from machine import I2C
+from micropython import const
+
+from .transport import _PortTransport
+
+
+class MCP23017Transport(_PortTransport):
+    # Registers, with IOCON.BANK = 0: direction, configuration, port and output latch of port A; port B follows.
+    __IODIR, __IOCON, __GPIO, __OLAT = const((0x00, 0x0A, 0x12, 0x14))
+
+    # IOCON: sequential operation disabled, so that the bytes of a transaction are all written to the latch.
+    __SEQOP = const(0x20)
+
+    def __init__(
+        self,
+        port: I2C,
+        addr: int = 0x20,
+        bank: int = 0,
+        pins: tuple = _PortTransport.PINS,
+        buffer_size: int = 320,
+        en2: int = -1,
+        freq: int = 400_000,
+    ) -> None:
+        """
+        Initialize a transport through one 8-bit port of an MCP23017 I2C expander.
+
+        With sequential operation disabled, every byte of a transaction addressed to the output latch is
+        written to the port in turn: the port values of all the frames written at once go in a single I2C
+        transaction, after the register address. Up to 400 kHz, the I2C transfer covers the EN pulse width and
+        the execution time of regular instructions. The expander also runs at 1 MHz and 1.7 MHz: pass the clock
+        of the bus as freq, so that each byte is padded to cover the execution time.
+
+        :param port: I2C port for communication.
+        :param addr: I2C address of the expander (default is 0x20).
+        :param bank: Port wired to the LCD, 0 for port A or 1 for port B (default is 0).
+        :param pins: Port bits of RS, RW, EN, the backlight and D4 to D7 (default is PINS).
+        :param buffer_size: Bytes of port values written per I2C transaction (default is 320).
+        :param en2: Port bit of the EN of the second controller of a 40x4 LCD, the RW or backlight bit, -1 if
+            none (default is -1).
+        :param freq: Clock of the I2C bus, in Hz (default is 400000).
+        :raises TypeError: If the provided port is not a valid I2C object.
+        :raises ValueError: If bank is not 0 or 1, or en2 is invalid.
+        """
+        if not hasattr(port, "writeto"):
+            raise TypeError("Invalid port! 'port' must be an I2C object.")
+
+        if bank not in (0, 1):
+            raise ValueError("Invalid bank! 'bank' must be 0 (port A) or 1 (port B).")
+
+        super().__init__(pins, buffer_size, head=1, en2=en2, freq=freq)
+        self.__port: I2C = port
+        self.__addr: int = addr
+        self.__iodir: int = self.__IODIR + bank
+        self.__gpio: int = self.__GPIO + bank
+        self.__olat: int = self.__OLAT + bank
+        self.__rx_buf: bytearray = bytearray(1)
+        self._tx_buf[0] = self.__olat  # Every transfer starts with the address of the output latch.
+
+        port.writeto(addr, bytes((self.__IOCON, self.__SEQOP)))
+        port.writeto(addr, bytes((self.__olat, 0x00)))
+        port.writeto(addr, bytes((self.__iodir, 0x00)))  # All outputs.
+
+    def _write_port(self, end: int) -> None:
+        """
+        Writes the output latch address and the port values of the transmit buffer in one I2C transaction.
+
+        :param end: Index in the transmit buffer following the last port value.
+        :return: None
+        """
+        self.__port.writeto(self.__addr, self._tx_view[:end])
+
+    def read_status(self) -> int:
+        """
+        Reads the busy flag and address counter. D4 to D7 are turned into inputs, then each nibble is read from
+        the port while EN is high.
+
+        :return: The busy flag (bit 7) and the address counter (bits 0 to 6), -1 if RW drives an EN.
+        """
+        if not self._readable:
+            return -1
+
+        port: I2C = self.__port
+        addr: int = self.__addr
+        state: int = self._backlight | self._rw_mask
+        high: bytes = bytes((self.__olat, state | self._en_mask))
+        low: bytes = bytes((self.__olat, state))
+        select: bytes = bytes((self.__gpio,))
+        status: int = 0
+
+        port.writeto(addr, low)
+        port.writeto(addr, bytes((self.__iodir, self._data_mask)))
+        for shift in (4, 0):
+            port.writeto(addr, high)
+            port.writeto(addr, select, False)
+            port.readfrom_into(addr, self.__rx_buf)
+            status |= self._nibble(self.__rx_buf[0]) << shift
+            port.writeto(addr, low)
+
+        port.writeto(addr, bytes((self.__iodir, 0x00)))
+        self._state = state
+        return status
+
+
+# THE END
@@ -0,0 +1,89 @@
+from machine import I2C
+
+from .transport import _PortTransport
+
+
+class PCF8574Transport(_PortTransport):
+    def __init__(
+        self,
+        port: I2C,
+        addr: int = 0x27,
+        pins: tuple = _PortTransport.PINS,
+        buffer_size: int = 320,
+        en2: int = -1,
+        freq: int = 100_000,
+    ) -> None:
+        """
+        Initialize a transport through a PCF8574 I2C expander, as on the usual LCD backpacks.
+
+        The port values of all the frames written at once go in a single I2C transaction, up to buffer_size
+        bytes. The transfer of each port value (~90 µs at 100 kHz) already exceeds the EN pulse width and the
+        execution time of regular instructions, so no delays are needed. The PCF8574 is rated for 100 kHz; if
+        the bus runs faster than about 480 kHz, pass its clock as freq, so that each byte is padded to cover the
+        execution time.
+
+        :param port: I2C port for communication.
+        :param addr: I2C address of the expander (default is 0x27).
+        :param pins: Port bits of RS, RW, EN, the backlight and D4 to D7 (default is PINS, the backpack wiring).
+        :param buffer_size: Bytes written per I2C transaction (default is 320, a full 20x4 screen).
+        :param en2: Port bit of the EN of the second controller of a 40x4 LCD, the RW or backlight bit, -1 if
+            none (default is -1).
+        :param freq: Clock of the I2C bus, in Hz (default is 100000).
+        :raises TypeError: If the provided port is not a valid I2C object.
+        :raises ValueError: If en2 is invalid.
+        """
+        if not hasattr(port, "writeto"):
+            raise TypeError("Invalid port! 'port' must be an I2C object.")
+
+        super().__init__(pins, buffer_size, en2=en2, freq=freq)
+        self.__port: I2C = port
+        self.__addr: int = addr
+        self.__rx_buf: bytearray = bytearray(1)
+
+    def _write_port(self, end: int) -> None:
+        """
+        Writes the port values of the transmit buffer in one I2C transaction.
+
+        :param end: Index in the transmit buffer following the last port value.
+        :return: None
+        """
+        self.__port.writeto(self.__addr, self._tx_view[:end])
+
+    def read_status(self) -> int:
+        """
+        Reads the busy flag and address counter. D4 to D7 are written high to release them as inputs, then
+        each nibble is read back while EN is high.
+
+        :return: The busy flag (bit 7) and the address counter (bits 0 to 6), -1 if RW drives an EN.
+        """
+        if not self._readable:
+            return -1
+
+        port: int = self._backlight | self._rw_mask | self._data_mask
+        buf: bytearray = self._tx_buf
+        buf[0] = port
+        buf[1] = port | self._en_mask
+        pulse: memoryview = self._tx_view[:2]  # EN low, then high.
+        status: int = 0
+
+        for shift in (4, 0):
+            self.__port.writeto(self.__addr, pulse)
+            self.__port.readfrom_into(self.__addr, self.__rx_buf)
+            status |= self._nibble(self.__rx_buf[0]) << shift
+
+        self.__port.writeto(self.__addr, pulse[:1])  # EN low.
+        self._state = port
+        return status
+
+    def sync(self) -> None:
+        """
+        Reads back the port on a warm start, keeping the backlight as it is.
+
+        :return: None
+        """
+        self.__port.readfrom_into(self.__addr, self.__rx_buf)
+        self._backlight = self.__rx_buf[0] & self._bl_mask
+        self._state = self._backlight
+
+
+# THE END
@@ -0,0 +1,87 @@
+import utime
+from machine import I2C
+from micropython import const
+
+from .transport import Transport
+from ..lib.PCF8574T import PCF8574T
+
+
+class _PinTransport(Transport):
+    # Expander pins of RS, RW, EN and BACKLIGHT; D4 to D7 are pins 4 to 7.
+    __RS, __RW, __EN, __BL = const((0, 1, 2, 3))
+
+    def __init__(self, port: I2C, addr: int, en2: int = -1) -> None:
+        """
+        Initialize a transport driving every expander pin individually through the PCF8574T driver.
+
+        :param port: I2C port for communication.
+        :param addr: I2C address of the expander.
+        :param en2: Expander pin for the EN of the second controller of a 40x4 LCD, -1 if none.
+        """
+        self.__io_exp = PCF8574T(port, addr)  # GPIO Expander object.
+
+        # Set GPIO pins as output
+        for pin in range(self.__io_exp.PIN_MIN, self.__io_exp.PIN_MAX):
+            self.__io_exp.set_gpio_mode(pin, self.__io_exp.OUTPUT)
+
+        self.__en_pins: tuple = (self.__EN,) + ((en2,) if en2 >= 0 else ())  # EN pin of each controller.
+        self.__en_pin: int = self.__EN
+        self.__backlight: bool = en2 != self.__BL  # The backlight pin drives an EN instead.
+        self.controllers = len(self.__en_pins)
+
+    def write_nibbles(self, nibbles: bytes | bytearray | memoryview) -> None:
+        """
+        Writes nibble frames to the LCD, setting RS and RW only when RS changes.
+
+        :param nibbles: The nibble frames: D4 to D7 in bits 0 to 3, and RS in bit 4.
+        :return: None
+        """
+        gpio_write = self.__io_exp.gpio_write
+        level: int = -1
+
+        for frame in nibbles:
+            if frame >> 4 != level:
+                level = frame >> 4
+                gpio_write(self.__RS, level)
+                gpio_write(self.__RW, False)  # RW: 0 (Write mode).
+
+            for pin, bit in enumerate(range(4), start=4):
+                gpio_write(pin, (frame >> bit) & 0x01)
+
+            # Toggle to enable. To execute previously received data.
+            gpio_write(self.__en_pin, True)
+            utime.sleep_us(40)
+            gpio_write(self.__en_pin, False)
+
+    def set_backlight(self, status: bool) -> None:
+        """
+        Sets the backlight pin, unless it drives the EN of the second controller.
+
+        :param status: Backlight status (True for ON, False for OFF).
+        :return: None
+        """
+        if self.__backlight:
+            self.__io_exp.gpio_write(self.__BL, status)
+
+    def select(self, controller: int) -> None:
+        """
+        Routes the enable strobes to the EN pin of a controller.
+
+        :param controller: Index of the controller.
+        :return: None
+        """
+        self.__en_pin = self.__en_pins[controller]
+
+    def cost(self, count: int) -> tuple:
+        """
+        Returns the bus operations write_nibbles() takes for a number of frames, at most: one single-byte
+        transaction per pin write, 6 per frame for the 4 data pins and EN high and low, and 2 per byte for RS and
+        RW. RS and RW are only written when RS changes, at most once per byte, so the figure is an upper bound.
+
+        :param count: Number of nibble frames.
+        :return: The number of bus transactions and the number of bytes written.
+        """
+        return 7 * count, 7 * count
+
+
+# THE END
@@ -0,0 +1,81 @@
+import utime
+from machine import SPI, Pin
+
+from .transport import _PortTransport
+
+
+class SPI595Transport(_PortTransport):
+    def __init__(self, spi: SPI, latch: int, pins: tuple = _PortTransport.PINS, en2: int = -1) -> None:
+        """
+        Initialize a transport through a 74HC595 shift register on a hardware SPI bus.
+
+        SPI shifts each port value in, then a pulse of the latch pin (RCLK) puts it on the outputs. At SPI clock
+        rates of several MHz, a port value takes a few microseconds, so the 37 µs execution time of regular
+        instructions is waited for after each byte. The shift register has no inputs: RW must be tied low, and
+        the busy flag cannot be read.
+
+        :param spi: SPI bus, SCK and MOSI wired to SRCLK and SER.
+        :param latch: GPIO pin wired to RCLK.
+        :param pins: Outputs QA to QH of RS, RW, EN, the backlight and D4 to D7, as 0 to 7 (default is PINS).
+        :param en2: Output of the EN of the second controller of a 40x4 LCD, the RW or backlight output, -1 if
+            none (default is -1).
+        :raises TypeError: If the provided spi is not a valid SPI object.
+        :raises ValueError: If en2 is invalid.
+        """
+        if not hasattr(spi, "write"):
+            raise TypeError("Invalid spi! 'spi' must be an SPI object.")
+
+        super().__init__(pins, 4, en2=en2)
+        self.__spi: SPI = spi
+        self.__latch = Pin(latch, Pin.OUT, value=0).value  # Bound 'Pin.value' method.
+
+    def _write_port(self, end: int) -> None:
+        """
+        Shifts out and latches the port values of the transmit buffer, one at a time.
+
+        :param end: Index in the transmit buffer following the last port value.
+        :return: None
+        """
+        write = self.__spi.write
+        latch = self.__latch
+        view: memoryview = self._tx_view
+
+        for index in range(end):
+            write(view[index : index + 1])
+            latch(1)
+            latch(0)
+
+    def write_nibbles(self, nibbles: bytes | bytearray | memoryview) -> None:
+        """
+        Writes nibble frames to the LCD, waiting for the execution time after each byte.
+
+        :param nibbles: The nibble frames: D4 to D7 in bits 0 to 3, and RS in bit 4.
+        :return: None
+        """
+        write = self.__spi.write
+        latch = self.__latch
+        buf: bytearray = self._tx_buf
+        view: memoryview = self._tx_view
+        ports: bytes = self._ports
+        backlight: int = self._backlight
+        enable: int = self._en_mask
+        port: int = self._state
+
+        for index, frame in enumerate(nibbles):
+            port = ports[frame & 0x1F] | backlight
+            buf[0] = port | enable
+            buf[1] = port
+            write(view[:1])
+            latch(1)
+            latch(0)
+            write(view[1:2])
+            latch(1)
+            latch(0)
+
+            if index & 0x01:
+                utime.sleep_us(37)
+
+        self._state = port
+
+
+# THE END
@@ -0,0 +1,128 @@
+"""
+Host tests of HD44780API.batch(): the recorded writes are reordered and combined, and leave the same screen and
+CGRAM as the unbatched calls, against two simulated PCF8574 backpacks on one I2C bus.
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+LiquidCrystal = sim.load_package()
+
+BIT_MAP: list = [0x00, 0x0A, 0x1F, 0x1F, 0x0E, 0x04, 0x00, 0x00]
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        sim.reset()
+        self.plain_model, _ = sim.attach_i2c(0x27)
+        self.batch_model, _ = sim.attach_i2c(0x26)
+        self.port = sim.machine.I2C(0, freq=100000)
+        self.plain = LiquidCrystal.LiquidCrystal_I2C(self.port, 0x27)
+        self.lcd = LiquidCrystal.LiquidCrystal_I2C(self.port, 0x26)
+        self.plain.enable_stats()
+        self.lcd.enable_stats()
+
+    def run_both(self, calls) -> int:
+        """
+        Runs the calls on the plain LCD, then in a batch on the other one, and checks they show the same.
+
+        :param calls: Function of an LCD making the calls.
+        :return: Number of I2C transactions of the batch.
+        """
+        calls(self.plain)
+        transactions: int = self.port.transactions
+        with self.lcd.batch():
+            calls(self.lcd)
+            self.assertEqual(self.port.transactions, transactions)  # Nothing is sent inside the batch.
+
+        self.assertEqual(self.batch_model.lines(), self.plain_model.lines())
+        self.assertEqual(bytes(self.batch_model.cgram), bytes(self.plain_model.cgram))
+        self.assertEqual(self.plain_model.violations, 0)
+        self.assertEqual(self.batch_model.violations, 0)
+        return self.port.transactions - transactions
+
+    def test_adjacent_writes_are_combined(self) -> None:
+        def calls(lcd) -> None:
+            lcd.set_cursor(0, 0)
+            lcd.print("Temp")
+            lcd.set_cursor(0, 4)  # Already the address counter.
+            lcd.print(" 21C")
+            lcd.set_cursor(1, 2)
+            lcd.print("ok")
+
+        self.assertEqual(self.run_both(calls), 1)
+        self.assertEqual(self.lcd.stats()["commands"], self.plain.stats()["commands"] - 1)
+        self.assertEqual(self.lcd.stats()["skipped_writes"], 1)
+        self.assertEqual(self.batch_model.lines(), ["Temp 21C        ", "  ok            "])
+
+    def test_cgram_uploads_are_moved_first(self) -> None:
+        def calls(lcd) -> None:
+            lcd.set_cursor(1, 0)
+            lcd.print("\x00 ok")
+            lcd.custom_character(0, BIT_MAP)
+            lcd.set_cursor(0, 0)
+            lcd.print("Heart")
+
+        self.assertEqual(self.run_both(calls), 1)
+        self.assertEqual(bytes(self.batch_model.cgram[:8]), bytes(BIT_MAP))
+
+    def test_order_is_kept_without_a_first_address(self) -> None:
+        for lcd in (self.plain, self.lcd):
+            lcd.set_cursor(1, 3)
+
+        def calls(lcd) -> None:
+            lcd.print("AB")  # Relies on the address counter left before the batch.
+            lcd.custom_character(1, BIT_MAP)
+            lcd.set_cursor(0, 0)
+            lcd.print("C")
+
+        self.run_both(calls)
+        self.assertEqual(self.batch_model.lines(), ["C               ", "   AB           "])
+
+    def test_decrementing_entry_mode_keeps_addresses(self) -> None:
+        def calls(lcd) -> None:
+            lcd.right_to_left()
+            lcd.set_cursor(0, 9)
+            lcd.print("abc")
+            lcd.set_cursor(0, 12)  # The address counter after "abc" if it incremented.
+            lcd.print("de")
+
+        self.run_both(calls)
+        self.assertEqual(self.lcd.stats()["skipped_writes"], self.plain.stats()["skipped_writes"])
+        self.assertEqual(self.batch_model.lines()[0], "       cba ed   ")
+
+    def test_nested_batches_are_sent_by_the_outermost(self) -> None:
+        transactions: int = self.port.transactions
+        with self.lcd.batch():
+            self.lcd.set_cursor(0, 0)
+            with self.lcd.batch():
+                self.lcd.print("in")
+            self.assertEqual(self.port.transactions, transactions)
+            self.lcd.print("out")
+
+        self.assertEqual(self.port.transactions, transactions + 1)
+        self.assertEqual(self.batch_model.lines()[0], "inout           ")
+
+    def test_writes_are_sent_if_the_block_raises(self) -> None:
+        with self.assertRaises(ZeroDivisionError):
+            with self.lcd.batch():
+                self.lcd.set_cursor(0, 0)
+                self.lcd.print("kept")
+                self.lcd.print(1 / 0)
+
+        self.assertEqual(self.batch_model.lines()[0], "kept            ")
+        self.assertEqual(self.batch_model.violations, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# THE END
@@ -0,0 +1,119 @@
+"""
+Host tests of Charset: translation to the character ROM codes, and the substitute glyphs loaded into CGRAM while
+print() sets the cursor back, against the simulated PCF8574 backpack and HD44780 controller.
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+LiquidCrystal = sim.load_package()
+
+EURO: list = [0x06, 0x09, 0x1C, 0x08, 0x1C, 0x09, 0x06, 0x00]
+POUND: list = [0x06, 0x09, 0x08, 0x1C, 0x08, 0x08, 0x1F, 0x00]
+
+
+class CharsetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        sim.reset()
+        self.model, _ = sim.attach_i2c(0x27)
+        self.lcd = LiquidCrystal.LiquidCrystal_I2C(sim.machine.I2C(0, freq=100000))
+
+    def row(self, row: int) -> bytes:
+        """
+        Returns the character codes shown on a row of the simulated LCD.
+
+        :param row: The row number (0-indexed).
+        :return: The character codes.
+        """
+        return bytes(self.model.ddram[0x40 * row : 0x40 * row + 16])
+
+    def test_rom_tables(self) -> None:
+        a00 = LiquidCrystal.Charset()
+        self.assertEqual(a00.encode("plain ASCII"), b"plain ASCII")
+        self.assertEqual(bytes(a00.encode("21°C ä é ~ \\ →")), b"21\xdfC \xe1 e ? ? \x7e")
+        self.assertEqual(bytes(a00.encode("\x00\x07ｱ")), b"\x00\x07\xb1")
+
+        a02 = LiquidCrystal.Charset(LiquidCrystal.Charset.A02, fallback="*")
+        self.assertEqual(bytes(a02.encode("é~→")), b"\xe9~*")
+
+        a00.map("€", 0x01)
+        self.assertEqual(bytes(a00.encode("5€")), b"5\x01")
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            LiquidCrystal.Charset("A01")
+        with self.assertRaises(ValueError):
+            LiquidCrystal.Charset(fallback="€")
+        with self.assertRaises(ValueError):
+            LiquidCrystal.Charset().map("€", 0x100)
+        with self.assertRaises(ValueError):
+            LiquidCrystal.Charset().substitute("€", "euro")
+
+    def test_substitute_restores_the_cursor(self) -> None:
+        glyphs = LiquidCrystal.GlyphCache(self.lcd)
+        glyphs.register("euro", EURO)
+        charset = LiquidCrystal.Charset(glyphs=glyphs)
+        charset.substitute("€", "euro")
+        self.lcd.set_charset(charset)
+
+        self.lcd.set_cursor(1, 3)
+        self.lcd.print("5€ off")
+        self.lcd.print("!")  # Follows the text, at the cursor print() set back.
+        self.assertEqual(self.row(1), b"   5\x00 off!      ")
+        self.assertEqual(bytes(self.model.cgram[:8]), bytes(EURO))
+        self.assertEqual(charset.uploads(), 1)
+
+        self.lcd.set_cursor(0, 0)
+        self.lcd.print("€€")  # Resident, not uploaded again.
+        self.assertEqual(charset.uploads(), 1)
+        self.assertEqual(self.row(0)[:3], b"\x00\x00 ")
+        self.assertEqual(self.model.violations, 0)
+
+    def test_least_recently_used_glyph_is_replaced(self) -> None:
+        glyphs = LiquidCrystal.GlyphCache(self.lcd, slots=1)
+        glyphs.register("euro", EURO)
+        glyphs.register("pound", POUND)
+        charset = LiquidCrystal.Charset(glyphs=glyphs)
+        charset.substitute("€", "euro")
+        charset.substitute("£", "pound")
+        self.lcd.set_charset(charset)
+
+        self.lcd.set_cursor(0, 0)
+        self.lcd.print("€1")
+        self.lcd.set_cursor(0, 4)
+        self.lcd.print("£2")
+        self.assertEqual(charset.uploads(), 2)
+        self.assertEqual(bytes(self.model.cgram[:8]), bytes(POUND))
+        self.assertEqual(self.row(0)[:6], b"\x001  \x002")
+        self.assertEqual(self.model.violations, 0)
+
+    def test_unknown_cursor_is_raised(self) -> None:
+        glyphs = LiquidCrystal.GlyphCache(self.lcd)
+        glyphs.register("euro", EURO)
+        charset = LiquidCrystal.Charset(glyphs=glyphs)
+        charset.substitute("€", "euro")
+        self.lcd.set_charset(charset)
+
+        self.lcd.set_cursor(0, 0)
+        self.lcd.print("ab")
+        self.lcd.custom_character(7, POUND)  # Leaves the address counter in CGRAM.
+
+        with self.assertRaises(RuntimeError):
+            self.lcd.print("€")
+
+        self.assertEqual(self.row(0)[:3], b"ab ")
+        self.assertEqual(bytes(self.model.cgram[56:64]), bytes(POUND))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# THE END
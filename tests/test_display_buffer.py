@@ -0,0 +1,97 @@
+"""
+Host tests of DisplayBuffer: the runs of changed cells sent by flush(), flush_row() and flush_run(), against the
+simulated PCF8574 backpack and HD44780 controller.
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+LiquidCrystal = sim.load_package()
+
+
+class DisplayBufferTest(unittest.TestCase):
+    def setUp(self) -> None:
+        sim.reset()
+        self.model, _ = sim.attach_i2c(0x27, 4, 20)
+        self.lcd = LiquidCrystal.LiquidCrystal_I2C(sim.machine.I2C(0, freq=100000), row=4, col=20)
+        self.buffer = LiquidCrystal.DisplayBuffer(self.lcd)
+        self.lcd.enable_stats()
+
+    def flush(self) -> tuple:
+        """
+        Flushes the buffer, and counts the set DDRAM address instructions sent.
+
+        :return: Number of cells written, and number of runs.
+        """
+        commands: int = self.lcd.stats()["commands"]
+        written: int = self.buffer.flush()
+        self.assertEqual(self.model.violations, 0)
+        return written, self.lcd.stats()["commands"] - commands
+
+    def test_only_changed_cells_are_sent(self) -> None:
+        self.buffer.write_at(0, 0, "Hello")
+        self.buffer.write_at(3, 15, "clipped")
+        self.assertEqual(self.flush(), (10, 2))
+        self.assertEqual(self.model.lines(), ["Hello" + " " * 15, " " * 20, " " * 20, " " * 15 + "clipp"])
+
+        self.assertEqual(self.flush(), (0, 0))
+        self.buffer.write_at(0, 0, "Help")  # Same text up to the last character.
+        self.assertEqual(self.flush(), (1, 1))
+        self.assertEqual(self.model.lines()[0], "Helpo" + " " * 15)
+
+    def test_runs_bridge_a_single_unchanged_cell(self) -> None:
+        self.buffer.write_at(1, 0, "a b")  # One unchanged cell between the changes: one run.
+        self.assertEqual(self.flush(), (3, 1))
+
+        self.buffer.write_at(2, 0, "c  d")  # Two unchanged cells: two runs.
+        self.assertEqual(self.flush(), (2, 2))
+        self.assertEqual(self.model.lines()[1:3], ["a b" + " " * 17, "c  d" + " " * 16])
+
+    def test_flush_run_and_flush_row(self) -> None:
+        self.buffer.write_at(0, 2, "first")
+        self.buffer.write_at(2, 4, "second")
+        self.buffer.write_at(2, 14, "third")
+
+        self.assertEqual(self.buffer.flush_run(), 5)
+        self.assertEqual(self.model.lines()[2], " " * 20)
+        self.assertEqual(self.buffer.flush_row(2), 11)
+        self.assertEqual(self.buffer.flush_run(), 0)
+        self.assertEqual(self.model.lines(), ["  first" + " " * 13, " " * 20, "    second    third ", " " * 20])
+
+    def test_invalidate_and_mark_cleared(self) -> None:
+        self.buffer.write_at(1, 0, "kept")
+        self.flush()
+
+        self.buffer.invalidate()
+        self.assertEqual(self.flush(), (80, 4))
+
+        self.lcd.clear_display()
+        self.buffer.mark_cleared()
+        self.assertEqual(self.flush(), (4, 1))
+        self.assertEqual(self.model.lines()[1], "kept" + " " * 16)
+
+        self.buffer.fill()
+        self.assertIn(ord("k"), self.buffer)  # Still shown until the next flush().
+        self.flush()
+        self.assertNotIn(ord("k"), self.buffer)
+        self.assertEqual(self.model.lines(), [" " * 20] * 4)
+
+    def test_invalid_cell_is_rejected(self) -> None:
+        with self.assertRaises(IndexError):
+            self.buffer.write_at(4, 0, "x")
+        with self.assertRaises(IndexError):
+            self.buffer.write_at(0, 20, "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# THE END
@@ -0,0 +1,42 @@
+"""
+Host tests of the HD44780 instruction flags: the private constants of liquid_crystal_api.py must match the public
+ones of instructions.py.
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import importlib
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+LiquidCrystal = sim.load_package()
+
+
+class InstructionsTest(unittest.TestCase):
+    def test_api_flags_match_instructions(self) -> None:
+        instructions = importlib.import_module("LiquidCrystal.src.instructions")
+        api = importlib.import_module("LiquidCrystal.src.liquid_crystal_api")
+
+        names: list = [name for name in dir(instructions) if name.isupper()]
+        self.assertIn("FUNCTION_SET", names)
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(api, "_" + name), getattr(instructions, name))
+
+    def test_font_sizes_are_inherited(self) -> None:
+        for backend in ("LiquidCrystal", "LiquidCrystal_Bus", "LiquidCrystal_I2C", "LiquidCrystal_PIO"):
+            with self.subTest(backend=backend):
+                cls = getattr(LiquidCrystal, backend)
+                self.assertEqual((cls.FONT5X8, cls.FONT5X10), (LiquidCrystal.Instruction.FONT5X8, 0x04))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# THE END
@@ -0,0 +1,90 @@
+"""
+Host tests of Layout: field rendering, alignment and clipping, and the combined write of the changed fields,
+against the simulated PCF8574 backpack and HD44780 controller.
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+LiquidCrystal = sim.load_package()
+
+
+class LayoutTest(unittest.TestCase):
+    def setUp(self) -> None:
+        sim.reset()
+        self.model, _ = sim.attach_i2c(0x27)
+        self.port = sim.machine.I2C(0, freq=100000)
+        self.lcd = LiquidCrystal.LiquidCrystal_I2C(self.port)
+        self.layout = LiquidCrystal.Layout(self.lcd)
+
+    def test_fields_are_aligned_and_clipped(self) -> None:
+        self.layout.field("left", 0, 0, 5)
+        self.layout.field("right", 0, 6, 4, align=">", fmt="d")
+        self.layout.field("center", 0, 11, 5, align="^")
+        self.layout.field("hex", 1, 0, 2, fmt="02x")
+        self.layout.field("clip", 1, 4, 3)
+
+        written: int = self.layout.update(left="ab", right=-42, center="mid", hex=255, clip="clipped")
+        self.assertEqual(written, 5)
+        self.assertEqual(self.model.lines(), ["ab     -42  mid ", "ff  cli         "])
+        self.assertEqual(self.model.violations, 0)
+
+    def test_fixed_point_matches_format(self) -> None:
+        self.layout.field("one", 0, 0, 8, fmt=".1f")
+        self.layout.field("two", 1, 0, 8, fmt=".2f")
+
+        values: tuple = (-3.25, 0.125, 2.5, -0.04, -0.0, 1.005, 2.675, 99.95, 7, -7, 1e30, float("inf"), float("nan"))
+        for value in values:
+            with self.subTest(value=value):
+                self.layout.update(one=value, two=value)
+                expected: list = [format(value, ".1f")[:8], format(value, ".2f")[:8]]
+                self.assertEqual([line[:8].rstrip() for line in self.model.lines()], expected)
+
+        self.assertEqual(self.model.violations, 0)
+
+    def test_only_changed_fields_are_written(self) -> None:
+        self.layout.field("temp", 0, 0, 6, align=">", fmt=".1f")
+        self.layout.field("count", 1, 12, 4, align=">")
+        self.assertEqual(self.layout.update(temp=21.5, count=3), 2)
+
+        transactions: int = self.port.transactions
+        self.assertEqual(self.layout.update(temp=21.5, count=4), 1)
+        self.assertEqual(self.port.transactions, transactions + 1)  # One transaction for the changed field.
+        self.assertEqual(self.layout.update(temp=21.5, count=4), 0)
+        self.assertEqual(self.port.transactions, transactions + 1)
+
+        self.lcd.clear_display()
+        self.layout.invalidate()
+        self.assertEqual(self.layout.update(temp=21.5, count=4), 2)
+        self.assertEqual(self.model.lines(), ["  21.5          ", "               4"])
+        self.assertEqual(self.model.violations, 0)
+
+    def test_invalid_fields_are_rejected(self) -> None:
+        self.layout.field("a", 0, 0, 4)
+
+        with self.assertRaises(ValueError):
+            self.layout.field("b", 0, 3, 2)
+        with self.assertRaises(ValueError):
+            self.layout.field("b", 1, 0, 2, align="|")
+        with self.assertRaises(IndexError):
+            self.layout.field("b", 2, 0, 2)
+        with self.assertRaises(IndexError):
+            self.layout.field("b", 1, 10, 7)
+        with self.assertRaises(KeyError):
+            self.layout.update(b=1)
+
+        self.layout.field("a", 0, 2, 4)  # Redeclared, so it does not overlap itself.
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# THE END
@@ -0,0 +1,119 @@
+"""
+Host tests of ThreadedLiquidCrystal: the worker runs on a CPython '_thread' thread, against the simulated PCF8574
+backpack and HD44780 controller.
+
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import _thread
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim  # noqa: E402
+
+LiquidCrystal = sim.load_package()
+
+
+class ThreadedLiquidCrystalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        sim.reset()
+        self.model, self.expander = sim.attach_i2c(0x27)
+        self.lcd = LiquidCrystal.LiquidCrystal_I2C(sim.machine.I2C(0, freq=100000))
+        self.display = LiquidCrystal.ThreadedLiquidCrystal(self.lcd, capacity=8)
+
+    def tearDown(self) -> None:
+        self.display.stop()
+
+    def test_worker_is_a_cpython_thread(self) -> None:
+        self.assertIs(sys.modules["LiquidCrystal.src.liquid_crystal_thread"]._thread, _thread)
+
+        thread: list = []
+        self.display.start()
+        self.display.call(lambda: thread.append(_thread.get_ident()))
+        self.display.join()
+        self.assertEqual(len(thread), 1)
+        self.assertNotEqual(thread[0], _thread.get_ident())
+
+    def test_calls_are_executed_in_order(self) -> None:
+        self.display.print("queued")
+        self.assertEqual(self.display.pending(), 1)
+
+        self.display.start()
+        data: bytearray = bytearray(b"abc")
+        self.display.set_cursor(1, 0)
+        self.display.print(data)
+        data[:] = b"XYZ"  # Copied when queued.
+
+        with self.display.batch():
+            self.display.set_cursor(0, 8)
+            self.display.print(3.5)
+
+        self.display.custom_character(1, [0x1F] * 8)
+        self.display.backlight(True)
+        for count in range(50):
+            self.display.set_cursor(0, 12)
+            self.display.print(f"{count:3}")
+
+        self.display.join()
+        self.assertEqual(self.display.pending(), 0)
+        self.assertEqual(self.model.lines(), ["queued  3.5  49 ", "abc             "])
+        self.assertEqual(bytes(self.model.cgram[8:16]), b"\x1f" * 8)
+        self.assertTrue(self.expander.backlight())
+        self.assertEqual(self.model.violations, 0)
+
+        queue: dict = self.display.queue_stats()
+        self.assertGreaterEqual(queue["high_water"], 1)
+        self.assertLessEqual(queue["high_water"], 8)
+
+    def test_stats_are_forwarded(self) -> None:
+        self.display.start()
+        self.display.enable_stats()
+        self.display.set_cursor(0, 0)
+        self.display.print("Hello")
+        self.display.join()
+
+        stats: dict = self.display.stats()
+        self.assertEqual(stats, self.lcd.stats())
+        self.assertEqual(stats["data_bytes"], 5)
+
+        self.display.reset_stats()
+        self.display.join()
+        self.assertEqual(self.display.stats()["data_bytes"], 0)
+
+        self.display.disable_stats()
+        self.display.join()
+        self.assertEqual(self.display.stats(), {})
+
+    def test_join_raises_the_worker_exception(self) -> None:
+        self.display.start()
+        self.display.call(self.lcd.set_cursor, 9, 9)
+        self.display.print("x")
+
+        with self.assertRaises(IndexError):
+            self.display.join()
+
+        self.display.join()  # The exception is only raised once.
+        self.assertEqual(self.model.lines()[0][:1], "x")
+
+    def test_full_ring_without_worker(self) -> None:
+        display = LiquidCrystal.ThreadedLiquidCrystal(self.lcd, capacity=1)
+        display.display_on()
+
+        with self.assertRaises(RuntimeError):
+            display.display_on()
+
+        self.assertEqual(display.queue_stats()["stalls"], 1)
+
+    def test_invalid_cursor_is_raised_by_the_caller(self) -> None:
+        with self.assertRaises(IndexError):
+            self.display.set_cursor(2, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# THE END